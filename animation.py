@@ -0,0 +1,134 @@
+# animation.py
+import colorsys
+
+
+def rainbow_table(steps=180):
+    """Precomputed hex colors for a full trip around the hue wheel."""
+    table = []
+    for i in range(steps):
+        r, g, b = colorsys.hsv_to_rgb(i / steps, 1, 1)
+        table.append(f'#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}')
+    return table
+
+
+class FrameClock:
+    """
+    One after() loop that drives every UI animation of the app.
+
+    Each animation is registered with the toplevel it lives in and is called
+    with the current tick number. Per tick an animation is:
+      - suspended while its window is not viewable (withdrawn or minimized),
+      - throttled to `idle_fps` while its window is not focused or the user has
+        been idle for `idle_after_ms` (Tk's own `tk inactive` timer),
+      - run at full `fps` otherwise.
+    While nothing runs at full rate the loop itself slows to `idle_fps`, and when
+    every animation is suspended it stops until wake() is called, which happens
+    automatically when a registered window is mapped or focused.
+    """
+
+    def __init__(self, root, fps=30, idle_fps=4, idle_after_ms=60000):
+        self.root = root
+        self.interval = max(1, int(1000 / fps))
+        self.throttle_every = max(1, round(fps / idle_fps))
+        self.idle_after_ms = idle_after_ms
+        self.tick = 0
+        self._step = 1  # ticks covered by the pending after() call
+        self._animations = {}
+        self._next_handle = 0
+        self._after_id = None
+        self._bound_windows = set()
+
+    def register(self, window, callback):
+        """Call `callback(tick)` every frame while `window` is visible. Returns a handle for unregister()."""
+        self._next_handle += 1
+        handle = self._next_handle
+        self._animations[handle] = (window, callback)
+
+        key = str(window)
+        if key not in self._bound_windows:
+            self._bound_windows.add(key)
+            window.bind("<Map>", lambda e: self.wake(), add="+")
+            window.bind("<FocusIn>", lambda e: self.wake(), add="+")
+            window.bind("<Destroy>", lambda e, w=window: self._forget_window(e, w), add="+")
+        self.wake()
+        return handle
+
+    def unregister(self, handle):
+        self._animations.pop(handle, None)
+
+    def wake(self):
+        """Resume the loop at full rate so suspended or throttled animations are re-evaluated."""
+        if not self._animations:
+            return
+        if self._after_id is not None:
+            if self._step == 1:
+                return
+            self.root.after_cancel(self._after_id)
+        self._schedule(1)
+
+    def _schedule(self, step):
+        self._step = step
+        self._after_id = self.root.after(self.interval * step, self._on_tick)
+
+    def _forget_window(self, event, window):
+        # <Destroy> is delivered for every child; only the toplevel itself matters
+        if event.widget is not window:
+            return
+        self._bound_windows.discard(str(window))
+        for handle, (win, _) in list(self._animations.items()):
+            if win is window:
+                self._animations.pop(handle, None)
+
+    def _user_idle(self):
+        try:
+            return int(self.root.tk.call("tk", "inactive")) > self.idle_after_ms
+        except Exception:
+            return False
+
+    def _focused_toplevel(self):
+        try:
+            focus = self.root.focus_get()
+        except Exception:
+            # focus_get() raises for focus in widgets Tkinter doesn't know (e.g. a combobox popdown)
+            return None
+        return str(focus.winfo_toplevel()) if focus else None
+
+    def _on_tick(self):
+        self._after_id = None
+        self.tick += self._step
+        idle = self._user_idle()
+        focused = self._focused_toplevel()
+        throttled_tick = self.tick % self.throttle_every < self._step
+
+        any_running = False
+        any_full_rate = False
+        for handle, (window, callback) in list(self._animations.items()):
+            try:
+                if not window.winfo_viewable():
+                    continue
+            except Exception:
+                self._animations.pop(handle, None)
+                continue
+            any_running = True
+            if idle or str(window) != focused:
+                if not throttled_tick:
+                    continue
+            else:
+                any_full_rate = True
+            try:
+                callback(self.tick)
+            except Exception as e:
+                print(f"[Animation] Removing failing animation: {e}")
+                self._animations.pop(handle, None)
+
+        if any_running:
+            self._schedule(1 if any_full_rate else self.throttle_every)
+
+
+def get_clock(root):
+    """Return the FrameClock shared by everything under `root`, creating it on first use."""
+    clock = getattr(root, "_frame_clock", None)
+    if clock is None:
+        clock = FrameClock(root)
+        root._frame_clock = clock
+    return clock
@@ -0,0 +1,162 @@
+# bulk_edit.py
+"""
+Bulk edits for the Menu Editor: pick items by section, sub-section, name
+pattern and price range, then set, scale or round their prices, move them to
+another sub-section or delete them, all in one model batch (one save).
+
+    targets = bulk_edit.select(model, section="drinks", pattern="*cola*")
+    changes = bulk_edit.scale_prices(model, targets, 10)     # +10%
+    print("\\n".join(bulk_edit.describe(model, changes)))   # preview
+    bulk_edit.apply(model, changes)
+
+Operations only compute Change tuples, so a preview shows exactly what apply
+will do. Deleting or moving an item out of its last place drops its price,
+limit and discount bypasses (see menu_model.py).
+"""
+import math
+import fnmatch
+from collections import Counter, namedtuple
+
+from render_plan import price_resolver
+
+# One selected listing of an item
+Target = namedtuple("Target", "section subsection item")
+# kind is "price" (before/after prices), "move" (after is (section, subsection)) or "delete"
+Change = namedtuple("Change", "kind section subsection item before after")
+
+
+def _name_matches(pattern):
+    pattern = (pattern or "").strip().lower()
+    if not pattern:
+        return lambda name: True
+    if any(ch in pattern for ch in "*?["):
+        return lambda name: fnmatch.fnmatchcase(name.lower(), pattern)
+    return lambda name: pattern in name.lower()
+
+
+def select(model, section=None, subsection=None, pattern=None, min_price=None, max_price=None):
+    """
+    Listings matching every given filter, in menu order. Section and sub-section
+    match case-insensitively; `pattern` is a glob (`*cola*`) or a plain substring.
+    """
+    matches = _name_matches(pattern)
+    price_of = price_resolver(model.menu)
+    section = (section or "").strip().lower()
+    subsection = (subsection or "").strip().lower()
+    targets = []
+    for sec, value in model.sections.items():
+        if sec == "combos" or (section and sec.lower() != section):
+            continue
+        if isinstance(value, dict):
+            groups = [(sub, items) for sub, items in value.items() if not subsection or sub.lower() == subsection]
+        elif isinstance(value, list) and not subsection:
+            groups = [(None, value)]
+        else:
+            continue
+        for sub, items in groups:
+            for item in items:
+                if not matches(item):
+                    continue
+                if min_price is not None or max_price is not None:
+                    price = price_of(item)
+                    if (min_price is not None and price < min_price) or (max_price is not None and price > max_price):
+                        continue
+                targets.append(Target(sec, sub, item))
+    return targets
+
+
+def _price_changes(model, targets, new_price):
+    price_of = price_resolver(model.menu)
+    changes = []
+    seen = set()
+    # Prices belong to the name, so an item listed twice changes once
+    for t in targets:
+        if t.item in seen:
+            continue
+        seen.add(t.item)
+        before = price_of(t.item)
+        after = round(new_price(before), 2)
+        if after < 0:
+            raise ValueError(f"'{t.item}' would cost less than nothing")
+        if after != before:
+            changes.append(Change("price", t.section, t.subsection, t.item, before, after))
+    return changes
+
+
+def set_prices(model, targets, price):
+    return _price_changes(model, targets, lambda before: price)
+
+
+def scale_prices(model, targets, percent):
+    """Raise (or with a negative percent, lower) prices by `percent`."""
+    return _price_changes(model, targets, lambda before: before * (100 + percent) / 100)
+
+
+def round_prices(model, targets, step):
+    """Round prices to the nearest multiple of `step`, e.g. 0.05 or 0.25."""
+    if step <= 0:
+        raise ValueError("Rounding step must be positive")
+    return _price_changes(model, targets, lambda before: math.floor(before / step + 0.5) * step)
+
+
+def move_items(model, targets, section, subsection=None):
+    """Move listings to `section` / `subsection` (a new sub-section is created if needed)."""
+    real = next((s for s in model.sections if s.lower() == section.strip().lower()), None)
+    if real is None or real == "combos":
+        raise ValueError(f"No section named '{section}'")
+    value = model.sections[real]
+    subsection = (subsection or "").strip() or None
+    if isinstance(value, dict):
+        if subsection is None:
+            raise ValueError(f"Section '{real}' needs a sub-section")
+        subsection = next((s for s in value if s.lower() == subsection.lower()), subsection)
+    elif subsection is not None:
+        raise ValueError(f"Section '{real}' has no sub-sections")
+    changes = []
+    for t in targets:
+        if (t.section, t.subsection) != (real, subsection):
+            changes.append(Change("move", t.section, t.subsection, t.item, None, (real, subsection)))
+    return changes
+
+
+def delete_items(model, targets):
+    return [Change("delete", t.section, t.subsection, t.item, None, None) for t in targets]
+
+
+def _place(section, subsection):
+    return f"{section}/{subsection}" if subsection is not None else section
+
+
+def describe(model, changes):
+    """One preview line per change."""
+    deletes = Counter(c.item for c in changes if c.kind == "delete")
+    lines = []
+    for c in changes:
+        if c.kind == "price":
+            lines.append(f"{c.item}: ${c.before:.2f} -> ${c.after:.2f}")
+        elif c.kind == "move":
+            lines.append(f"{c.item}: {_place(c.section, c.subsection)} -> {_place(*c.after)}")
+        else:
+            note = ""
+            if deletes[c.item] >= model.listings(c.item):
+                note = "  (its price, limit and discount bypasses go too)"
+            lines.append(f"{c.item}: remove from {_place(c.section, c.subsection)}{note}")
+    return lines
+
+
+def apply(model, changes):
+    """Apply `changes` as one model batch."""
+    with model.batch():
+        for c in changes:
+            if c.kind == "price":
+                model.set_price(c.item, c.after)
+            elif c.kind == "move":
+                section, subsection = c.after
+                value = model.sections[section]
+                present = value if subsection is None else value.get(subsection, ())
+                # Add before removing so the item never looks unlisted and keeps its price
+                if c.item not in present:
+                    model.add_item(section, subsection, c.item)
+                model.remove_item(c.section, c.subsection, c.item)
+            elif c.kind == "delete":
+                model.remove_item(c.section, c.subsection, c.item)
@@ -11,6 +11,8 @@ BUTTON_BG = "#7952b3"
 BUTTON_HOVER_BG = "#6f42c1"
 SPINBOX_BG = "#4a3e8f"
 SCROLLBAR_BG = "#444444"
+LIMIT_WARNING_BG = "#8f3e4a"
+LIMIT_WARNING_FG = "#ff8a8a"
 
 FONT_DEFAULT = ("Segoe UI", 10)
 FONT_HEADER = ("Segoe UI", 12, "bold")
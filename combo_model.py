@@ -0,0 +1,82 @@
+# combo_model.py
+from array import array
+
+
+class MealSelection:
+    """
+    Item selections for every meal of one mix-and-match combo.
+
+    Quantities live in a flat meals x columns integer matrix, one column per
+    allowed (category, item) pair. Columns of a category are contiguous, so a
+    category is just a column range. Per-meal category totals are maintained on
+    every write, so set() hands the selector's limit check the new total
+    directly and keeps `sum(sel.values())` out of the hot path.
+    """
+
+    def __init__(self, allowed_items, limits):
+        self.categories = []
+        self.cat_ranges = {}
+        self.columns = []  # (category, item) per column
+        self.col_index = {}
+        for cat, items in allowed_items.items():
+            start = len(self.columns)
+            for item in items:
+                if (cat, item) not in self.col_index:
+                    self.col_index[(cat, item)] = len(self.columns)
+                    self.columns.append((cat, item))
+            self.cat_ranges[cat] = (start, len(self.columns))
+            self.categories.append(cat)
+
+        self.width = len(self.columns)
+        self.cat_slot = {cat: i for i, cat in enumerate(self.categories)}
+        self.col_cat = array("i", [self.cat_slot[cat] for cat, _ in self.columns])
+        limits_lower = {k.lower(): v for k, v in limits.items()}
+        self.limits = array("i", [int(limits.get(cat, limits_lower.get(cat.lower(), 0)) or 0) for cat in self.categories])
+
+        self.meals = 0
+        self.qty = array("i")
+        self.cat_totals = array("i")
+
+    @classmethod
+    def for_combo(cls, combo_data):
+        return cls(combo_data.get("combo_items", {}), combo_data.get("limits", {}))
+
+    def __len__(self):
+        return self.meals
+
+    def resize(self, meals):
+        """Grow with empty meals or drop meals from the end."""
+        meals = max(0, meals)
+        if meals > self.meals:
+            self.qty.extend([0] * ((meals - self.meals) * self.width))
+            self.cat_totals.extend([0] * ((meals - self.meals) * len(self.categories)))
+        else:
+            del self.qty[meals * self.width:]
+            del self.cat_totals[meals * len(self.categories):]
+        self.meals = meals
+
+    def clear(self):
+        self.resize(0)
+
+    def column(self, category, item):
+        return self.col_index.get((category, item))
+
+    def get(self, meal, col):
+        return self.qty[meal * self.width + col]
+
+    def set(self, meal, col, value):
+        """Store a quantity and return the meal's new total for that column's category."""
+        idx = meal * self.width + col
+        slot = meal * len(self.categories) + self.col_cat[col]
+        self.cat_totals[slot] += value - self.qty[idx]
+        self.qty[idx] = value
+        return self.cat_totals[slot]
+
+    def category_limit(self, category):
+        return self.limits[self.cat_slot[category]]
+
+    def meal_items(self, meal, category):
+        """(item, qty) pairs selected in one category of one meal."""
+        start, stop = self.cat_ranges.get(category, (0, 0))
+        base = meal * self.width
+        return [(self.columns[col][1], self.qty[base + col]) for col in range(start, stop) if self.qty[base + col]]
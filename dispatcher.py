@@ -0,0 +1,167 @@
+# dispatcher.py
+"""
+Background work for the whole app.
+
+Long operations (network, disk, image decoding) run on one bounded worker pool.
+Their results, and anything else a worker wants done on the UI, go through a
+thread-safe queue that the Tk thread drains on a timer, so Tk is only ever
+touched from its own thread.
+
+    task = dispatcher.submit(load_thing, path, on_done=show_thing)
+    task.cancel()   # e.g. when the window that wanted it closes
+
+Call install(root) once the Tk root exists; callbacks posted before that wait
+in the queue.
+"""
+import time
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import metrics
+
+MAX_WORKERS = 4
+DRAIN_INTERVAL_MS = 50  # poll period while nothing is arriving
+BUSY_INTERVAL_MS = 10  # poll period right after callbacks were applied
+DRAIN_BUDGET_S = 0.008  # max time per drain, the rest waits for the next tick
+
+
+class Cancelled(Exception):
+    """Raised inside a task that noticed its token was cancelled."""
+
+
+class CancelToken:
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise Cancelled()
+
+
+class Task:
+    def __init__(self, future, token):
+        self.future = future
+        self.token = token
+
+    def cancel(self):
+        """Stop the task if it has not started and drop its callbacks either way."""
+        self.token.cancel()
+        self.future.cancel()
+
+    def done(self):
+        return self.future.done()
+
+
+_pool = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="immense-worker")
+_queue = queue.SimpleQueue()
+_root = None
+_tk_thread = None
+_pending = 0
+_pending_lock = threading.Lock()
+
+
+def _count_pending(delta):
+    global _pending
+    with _pending_lock:
+        _pending += delta
+        metrics.WORKER_TASKS.set(_pending)
+
+
+def install(root):
+    """Start draining the callback queue on the Tk thread of `root`."""
+    global _root, _tk_thread
+    _root = root
+    _tk_thread = threading.get_ident()
+    root.after(DRAIN_INTERVAL_MS, _drain)
+
+
+def on_tk_thread():
+    return threading.get_ident() == _tk_thread
+
+
+def pending():
+    """Tasks queued or running on the worker pool."""
+    return _pending
+
+
+def post(callback, *args):
+    """Run `callback(*args)` on the Tk thread. Safe to call from any thread."""
+    _queue.put((callback, args))
+
+
+def submit(func, *args, on_done=None, on_error=None, token=None, **kwargs):
+    """
+    Run `func(*args, **kwargs)` on the worker pool. `on_done(result)` or
+    `on_error(exc)` is then called on the Tk thread unless the task was cancelled.
+    Pass `token` to share a CancelToken with the work itself (long loops should
+    check it); otherwise a fresh one is created.
+    """
+    token = token or CancelToken()
+    _count_pending(1)
+
+    def run():
+        if token.cancelled:
+            return
+        try:
+            result = func(*args, **kwargs)
+        except Cancelled:
+            return
+        except Exception as e:
+            if not token.cancelled:
+                post(_finish_error, token, on_error, e, func)
+            return
+        if on_done and not token.cancelled:
+            post(_finish_done, token, on_done, result)
+
+    future = _pool.submit(run)
+    # Also runs for futures cancelled before they started
+    future.add_done_callback(lambda f: _count_pending(-1))
+    return Task(future, token)
+
+
+def _finish_done(token, on_done, result):
+    if not token.cancelled:
+        on_done(result)
+
+
+def _finish_error(token, on_error, exc, func):
+    if token.cancelled:
+        return
+    if on_error:
+        on_error(exc)
+    else:
+        print(f"[Dispatcher] {getattr(func, '__qualname__', func)} failed: {exc}")
+
+
+def _drain():
+    deadline = time.perf_counter() + DRAIN_BUDGET_S
+    ran = 0
+    while time.perf_counter() < deadline:
+        try:
+            callback, args = _queue.get_nowait()
+        except queue.Empty:
+            break
+        ran += 1
+        try:
+            callback(*args)
+        except Exception as e:
+            print(f"[Dispatcher] Callback {getattr(callback, '__qualname__', callback)} failed: {e}")
+    metrics.DISPATCH_QUEUE.set(_queue.qsize())
+    try:
+        _root.after(BUSY_INTERVAL_MS if ran else DRAIN_INTERVAL_MS, _drain)
+    except Exception:
+        # root destroyed: the app is exiting
+        pass
+
+
+def shutdown():
+    """Drop queued work; running tasks finish (or notice cancellation) on their own."""
+    _pool.shutdown(wait=False, cancel_futures=True)
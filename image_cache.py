@@ -0,0 +1,84 @@
+# image_cache.py
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import metrics
+
+MAX_CACHE_BYTES = 32 * 1024 * 1024
+DOWNLOAD_TIMEOUT = (10, 30)
+
+_lock = threading.Lock()
+_entries = OrderedDict()  # key -> raw image bytes, least recently used first
+_cached_bytes = 0
+
+
+def _is_url(source):
+    return source.startswith("http://") or source.startswith("https://")
+
+
+def load_bytes(source):
+    """
+    Raw bytes of a menu image file or URL. Recently used images are kept in memory
+    (up to MAX_CACHE_BYTES), so reopening an order window or the full-size preview
+    does not hit the disk or the network again. Local files are re-read once they
+    change. Safe to call from worker threads.
+    """
+    global _cached_bytes
+    key = source if _is_url(source) else (source, os.stat(source).st_mtime_ns)
+    with _lock:
+        data = _entries.get(key)
+        if data is not None:
+            _entries.move_to_end(key)
+            metrics.IMAGE_CACHE_HITS.inc()
+            return data
+    metrics.IMAGE_CACHE_MISSES.inc()
+
+    if _is_url(source):
+        import requests
+
+        response = requests.get(source, timeout=DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        data = response.content
+    else:
+        with open(source, "rb") as fp:
+            data = fp.read()
+
+    with _lock:
+        if key not in _entries and len(data) <= MAX_CACHE_BYTES:
+            _entries[key] = data
+            _cached_bytes += len(data)
+            while _cached_bytes > MAX_CACHE_BYTES:
+                _, old = _entries.popitem(last=False)
+                _cached_bytes -= len(old)
+    return data
+
+
+def open_image(source):
+    """A PIL image for a menu image file or URL, read through the cache."""
+    from PIL import Image
+
+    return Image.open(io.BytesIO(load_bytes(source)))
+
+
+def load_thumbnail(source, size):
+    """
+    Decoded image shrunk to fit within `size`. Meant for worker threads: only the
+    PhotoImage has to be created on the Tk thread.
+    """
+    from PIL import Image
+
+    pil_img = open_image(source)
+    pil_img.thumbnail(size, Image.LANCZOS)
+    return pil_img
+
+
+def load_fitted(source, size):
+    """Decoded image scaled down (never up) to fit within `size`, for full-size previews."""
+    from PIL import Image
+
+    pil_img = open_image(source)
+    w, h = pil_img.size
+    scale = min(size[0] / w, size[1] / h, 1)
+    return pil_img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
@@ -2,14 +2,12 @@ import os
 import json
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
-from menu_manager import load_menu_files, save_menu_file, delete_menu_file, MENU_DIR
-from order_ui import OrderUIWindow
-from menu_editor import MenuEditorWindow
+from menu_manager import load_menu_files, save_menu_file, delete_menu_file, load_menu, save_menu, MENU_DIR
 from style_helper import apply_default_style
 import colors
-import colorsys
-import updater
-import threading
+import animation
+import prewarm
+import share_code
 from version import APP_VERSION
 
 
@@ -52,6 +50,8 @@ class LandingPage:
             width=32,
         )
         self.combo_estab.grid(row=1, column=0, columnspan=2, pady=(10, 20), sticky="ew")
+        # Whatever is selected is the likeliest to be opened next
+        self.combo_estab.bind("<<ComboboxSelected>>", lambda e: prewarm.prioritize(self.selected_estab.get()))
 
         # ---- Buttons Section ----
         # Group 1: Ordering & Editor
@@ -72,9 +72,11 @@ class LandingPage:
         btn_create.grid(row=4, column=0, padx=8, pady=5, sticky="ew")
         btn_delete.grid(row=4, column=1, padx=8, pady=5, sticky="ew")
 
-        # update
+        # Group 4: Another register / update
+        btn_register = ttk.Button(main_frame, text="New Register", command=self.open_new_register)
         btn_update = ttk.Button(main_frame, text="Check for Updates", command=self.on_check_updates_clicked)
-        btn_update.grid(row=5, column=0, columnspan=2, padx=8, pady=5, sticky="ew")
+        btn_register.grid(row=5, column=0, padx=8, pady=5, sticky="ew")
+        btn_update.grid(row=5, column=1, padx=8, pady=5, sticky="ew")
 
         # Configure grid column weight for even stretching
         main_frame.grid_columnconfigure(0, weight=1)
@@ -111,57 +113,30 @@ class LandingPage:
         )
         version_label.pack(anchor="e")
 
-        # Animation tracker variable
-        self.rainbow_animation_offset = 0
-
-        # Start the rainbow animation on the credit label
-        self.animate_rainbow_text()
+        # Rainbow credit text, driven by the shared frame clock (paused while the window is hidden)
+        self.rainbow_colors = animation.rainbow_table()
+        self.rainbow_animation = animation.get_clock(root).register(root, self.animate_rainbow_text)
 
         # Store window references
         self.order_win = None
+        self.order_ui = None
+        # Open order windows as (toplevel, OrderUIWindow); each is an independent register
+        self.registers = []
         self.editor_win = None
         self.latest_selected_estab = self.establishments[0]
 
 
     def on_check_updates_clicked(self):
-        # Run the update check in a background thread to avoid blocking UI
-        threading.Thread(target=self._check_updates_thread, daemon=True).start()
-
-    def _check_updates_thread(self):
-        upd = updater.Updater(self.root)
-        success = upd.fetch_latest_release_info()
-
-        def show_message(msg):
-            self.root.after(0, lambda: messagebox.showinfo("Update", msg))
-
-        if not success:
-            show_message("Could not check for updates at this time.")
-            return
-
-        if upd.is_update_available():
-            # Prompt update dialog must be called in main thread
-            self.root.after(0, upd.prompt_update)
-        else:
-            show_message("No updates available. You have the latest version.")
-
-    def animate_rainbow_text(self):
-        import colorsys
+        # The check runs on the worker pool; its result dialogs come back on the Tk thread
+        import updater
 
-        hue = self.rainbow_animation_offset % 360
-        r, g, b = colorsys.hsv_to_rgb(hue / 360, 1, 1)
-        hex_color = f'#{int(r*255):02x}{int(g*255):02x}{int(b*255):02x}'
-        self.credit_label.config(fg=hex_color)
+        updater.check_for_updates(self.root, force=True)
 
-        self.rainbow_animation_offset += 2
-        if self.rainbow_animation_offset >= 360:
-            self.rainbow_animation_offset = 0
-
-        self.root.after(33, self.animate_rainbow_text)
-
-        # Store window references
-        self.order_win = None
-        self.editor_win = None
-        self.latest_selected_estab = self.establishments[0]
+    def animate_rainbow_text(self, tick):
+        # Two hue degrees per frame, as before
+        color = self.rainbow_colors[tick % len(self.rainbow_colors)]
+        if self.credit_label.cget("fg") != color:
+            self.credit_label.config(fg=color)
 
     def refresh_establishments(self):
         previous_selection = self.selected_estab.get()
@@ -176,27 +151,48 @@ class LandingPage:
             self.selected_estab.set(self.establishments[0])
             self.latest_selected_estab = self.establishments[0]
 
+    def _live_registers(self):
+        self.registers = [(win, ui) for win, ui in self.registers if win.winfo_exists()]
+        return self.registers
+
     def open_order_tab_new(self):
         est = self.selected_estab.get()
-        if self.order_win and self.order_win.winfo_exists():
-            self.order_win.lift()
-            return
+        for win, ui in self._live_registers():
+            if ui.establishment == est:
+                win.lift()
+                return
+        self.open_new_register()
+
+    def open_new_register(self):
+        """Open another order window. Registers on the same menu share its parsed data."""
+        from order_ui import OrderUIWindow
+
+        est = self.selected_estab.get()
+        used = {ui.register_number for _, ui in self._live_registers()}
+        number = next(n for n in range(1, len(used) + 2) if n not in used)
+        prewarm.mark_used(est)
         self.order_win = tk.Toplevel(self.root)
-        OrderUIWindow(self.order_win, est)
+        self.order_ui = OrderUIWindow(self.order_win, est, register_number=number)
+        self.registers.append((self.order_win, self.order_ui))
         self.order_win.focus_force()
 
     def open_order_tab(self):
+        from order_ui import OrderUIWindow
+
         est = self.selected_estab.get()
         if self.order_win and self.order_win.winfo_exists():
             self.order_win.lift()
             return
+        prewarm.mark_used(est)
         self.order_win = tk.Toplevel(self.root)
         self.order_win.title(f"Order Tab - {est}")
         self.order_win.geometry("1100x800")
-        OrderUIWindow(self.order_win, est)
+        self.order_ui = OrderUIWindow(self.order_win, est)
         self.order_win.focus_force()
 
     def open_menu_editor(self):
+        from menu_editor import MenuEditorWindow
+
         est = self.selected_estab.get()
         if self.editor_win and self.editor_win.winfo_exists():
             self.editor_win.lift()
@@ -206,7 +202,9 @@ class LandingPage:
             self.refresh_establishments()
             self.selected_estab.set(est)
             self.latest_selected_estab = est
+            prewarm.prioritize(est)
 
+        prewarm.mark_used(est)
         self.editor_win = tk.Toplevel(self.root)
         self.editor_win.title(f"Menu Editor - {est}")
         self.editor_win.geometry("900x700")
@@ -222,22 +220,21 @@ class LandingPage:
             return
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                menu_data = json.load(f)
-            export_code = json.dumps({"establishment": est, "menu": menu_data}, indent=2)
+            export_code = share_code.encode(est, load_menu(est))
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load menu: {e}")
             return
 
         export_win = tk.Toplevel(self.root)
         export_win.title(f"Export Menu Code for '{est}'")
-        export_win.geometry("800x600")
+        export_win.geometry("800x400")
         export_win.transient(self.root)
 
-        lbl = tk.Label(export_win, text="Copy this code to share with others:")
+        lbl = tk.Label(export_win, text=f"Copy this code to share with others ({len(export_code) / 1024:.1f} KB):")
         lbl.pack(anchor=tk.W, padx=10, pady=5)
 
-        txt = tk.Text(export_win, wrap=tk.NONE)
+        # One compressed line; wrapping keeps it readable without a horizontal scroll
+        txt = tk.Text(export_win, wrap=tk.CHAR)
         txt.insert("1.0", export_code)
         txt.config(state=tk.DISABLED)
         txt.pack(expand=True, fill=tk.BOTH, padx=10, pady=5)
@@ -259,25 +256,20 @@ class LandingPage:
         import_win.geometry("600x500")
         import_win.transient(self.root)
 
-        lbl = tk.Label(import_win, text="Paste the menu code here:")
+        lbl = tk.Label(import_win, text="Paste the menu code here (or use Import from Clipboard):")
         lbl.pack(anchor=tk.W, padx=10, pady=5)
 
         txt = tk.Text(import_win, wrap=tk.NONE)
         txt.pack(expand=True, fill=tk.BOTH, padx=10, pady=5)
 
-        def do_import():
-            code = txt.get("1.0", tk.END).strip()
-            if not code:
+        def import_code(code):
+            if not code.strip():
                 messagebox.showwarning("Empty", "Please paste some menu code to import.")
                 return
             try:
-                data = json.loads(code)
-                est_name = data.get("establishment", None)
-                menu_data = data.get("menu", None)
-                if not est_name or not menu_data:
-                    raise ValueError("Invalid menu code structure.")
-            except Exception as e:
-                messagebox.showerror("Error", f"Invalid JSON code: {e}")
+                est_name, menu_data = share_code.decode(code)
+            except ValueError as e:
+                messagebox.showerror("Error", str(e))
                 return
 
             file_path = os.path.join(MENU_DIR, f"{est_name}.json")
@@ -286,9 +278,7 @@ class LandingPage:
                     return
 
             try:
-                os.makedirs(MENU_DIR, exist_ok=True)
-                with open(file_path, "w", encoding="utf-8") as f:
-                    json.dump(menu_data, f, indent=2)
+                save_menu(menu_data, est_name)
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save imported menu: {e}")
                 return
@@ -299,10 +289,24 @@ class LandingPage:
             self.selected_estab.set(est_name)
             self.latest_selected_estab = est_name
 
+        def do_import():
+            import_code(txt.get("1.0", tk.END))
+
+        def import_clipboard():
+            # Decoded straight from the clipboard; large old-style codes never enter the Text widget
+            try:
+                code = self.root.clipboard_get()
+            except tk.TclError:
+                messagebox.showwarning("Empty", "The clipboard has no text to import.")
+                return
+            import_code(code)
+
         btn_frame = tk.Frame(import_win)
         btn_frame.pack(fill=tk.X, padx=10, pady=5)
         btn_import = ttk.Button(btn_frame, text="Import", command=do_import)
         btn_import.pack(side=tk.LEFT, padx=5)
+        btn_clipboard = ttk.Button(btn_frame, text="Import from Clipboard", command=import_clipboard)
+        btn_clipboard.pack(side=tk.LEFT, padx=5)
         btn_cancel = ttk.Button(btn_frame, text="Cancel", command=import_win.destroy)
         btn_cancel.pack(side=tk.LEFT, padx=5)
 
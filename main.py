@@ -1,8 +1,30 @@
 # main.py
-import threading
+import importlib
 import tkinter as tk
 from landing_page import LandingPage
-import updater
+import stall_watchdog
+import dispatcher
+import metrics
+import prewarm
+
+
+# Loaded in the background after the first frame (the HTTP stack comes in with updater)
+WARM_UP_MODULES = ("order_ui", "menu_editor", "PIL.Image", "PIL.ImageTk", "updater")
+
+
+def warm_up():
+    """Import the heavy modules once the landing page is up (runs on the worker pool)."""
+    for name in WARM_UP_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            print(f"[Startup] Background warm-up of {name} failed: {e}")
+
+
+def check_for_updates(root):
+    import updater
+    updater.check_for_updates(root)
+
 
 def main():
     root = tk.Tk()
@@ -10,10 +32,19 @@ def main():
     root.title("ImmenseCalculator - Establishment Selection")
     LandingPage(root)
 
-    # Check for updates asynchronously, with GUI support
-    threading.Thread(target=updater.check_for_updates, args=(root,), daemon=True).start()
+    # Log freezes of the Tk event loop with the stack that caused them
+    stall_watchdog.install(root)
+    # Periodic local metrics file (data/metrics/) for watching register health
+    metrics.install(root)
+
+    # Idle callbacks queued now run after Tk's own redraw, i.e. after the first frame is painted.
+    # Only then load the order/editor modules, Pillow and the HTTP stack in the background.
+    dispatcher.install(root)
+    root.after_idle(lambda: dispatcher.submit(warm_up, on_done=lambda _: check_for_updates(root)))
+    # Then read and index the menus, most recently used first, while the user is choosing
+    root.after_idle(prewarm.start, root)
 
     root.mainloop()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
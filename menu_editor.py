@@ -2,13 +2,18 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog, filedialog
-from widgets import SteppedSpinbox
-from menu_manager import load_menu, save_menu
-from PIL import Image, ImageTk
+from widgets import QuantityControl, LazyTabs, bind_mousewheel
+from menu_manager import load_menu, save_menu_async
+from menu_model import MenuModel
 import os
-import io
-import requests
+import time
+import bisect
+import math
 import colors
+import dispatcher
+import image_cache
+import menu_import
+import bulk_edit
 from style_helper import apply_default_style
 
 
@@ -30,23 +35,8 @@ class ScrollableFrame(ttk.Frame):
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Bind mousewheel scrolling when cursor is over the scrollable_frame area
-        self._bind_mousewheel()
-
-    def _bind_mousewheel(self):
-        # Windows and MacOS bindings
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        # Linux bindings
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
-
-    def _on_mousewheel(self, event):
-        if event.num == 4:  # Linux scroll up
-            self.canvas.yview_scroll(-1, "units")
-        elif event.num == 5:  # Linux scroll down
-            self.canvas.yview_scroll(1, "units")
-        else:
-            self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
+        # Mousewheel scrolls the canvas while the cursor is over this frame
+        bind_mousewheel(self, self.canvas)
 
 
 class MenuEditorWindow:
@@ -55,7 +45,11 @@ class MenuEditorWindow:
         self.root = root
         self.establishment = establishment
         self.menu = load_menu(establishment)
+        # Edits go through the model; tabs patch their rows from its change events
+        self.model = MenuModel(self.menu)
+        self.model.subscribe(self._on_menu_changed)
         self.image_path = self.menu.get("menu_image_path", None)
+        self._image_task = None
 
         # Apply styling and theme
         self.style = ttk.Style(root)
@@ -67,30 +61,38 @@ class MenuEditorWindow:
         self.notebook = ttk.Notebook(root, style="Custom.TNotebook")
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
 
+        # Only the tab headers exist at first; each tab is built when first shown
+        self.tabs = LazyTabs(self.notebook)
+
         self.tab_sections = ttk.Frame(self.notebook, style="TFrame")
-        self.notebook.add(self.tab_sections, text="Sections & Items")
-        self.create_sections_items_tab()
+        self.tabs.add(self.tab_sections, "Sections & Items", self._build_sections_tab)
 
         self.tab_prices = ttk.Frame(self.notebook, style="TFrame")
-        self.notebook.add(self.tab_prices, text="Item Prices")
-        self.create_prices_tab()
+        self.tabs.add(self.tab_prices, "Item Prices", self._build_prices_tab)
 
         self.tab_combos = ttk.Frame(self.notebook, style="TFrame")
-        self.notebook.add(self.tab_combos, text="Combo Specials")
-        self.create_combos_tab()
+        self.tabs.add(self.tab_combos, "Combo Specials", self.create_combos_tab)
 
         self.tab_discounts = ttk.Frame(self.notebook, style="TFrame")
-        self.notebook.add(self.tab_discounts, text="Discounts")
-        self.create_discounts_tab()
+        self.tabs.add(self.tab_discounts, "Discounts", self._build_discounts_tab)
 
         self.tab_image = ttk.Frame(self.notebook, style="TFrame")
-        self.notebook.add(self.tab_image, text="Menu Image")
-        self.create_image_tab()
+        self.tabs.add(self.tab_image, "Menu Image", self._build_image_tab)
 
+    def _build_sections_tab(self):
+        self.create_sections_items_tab()
         self.load_sections()
+
+    def _build_prices_tab(self):
+        self.create_prices_tab()
         self.load_prices()
-        self.load_combos()
+
+    def _build_discounts_tab(self):
+        self.create_discounts_tab()
         self.load_discounts()
+
+    def _build_image_tab(self):
+        self.create_image_tab()
         self.load_image_tab()
 
     def setup_styles(self):
@@ -184,6 +186,15 @@ class MenuEditorWindow:
         btn_limit_set = tk.Button(limit_frame, text="Set Item Limit", command=self.set_item_limit)
         btn_limit_set.pack(fill=tk.X, pady=3)
 
+        btn_import = tk.Button(item_frame, text="Import Items...", command=self.import_items_dialog)
+        btn_import.pack(fill=tk.X, padx=5, pady=(0, 5))
+        btn_bulk = tk.Button(item_frame, text="Bulk Edit...", command=self.bulk_edit_dialog)
+        btn_bulk.pack(fill=tk.X, padx=5, pady=(0, 5))
+
+        # Real names of the section / sub-section whose items are listed
+        self._shown_section = None
+        self._shown_subsection = None
+
     # Helpers for case-insensitive lookups to preserve original names
     def _get_section_real_name(self, lookup):
         sections = self.menu.get("sections", {})
@@ -204,23 +215,44 @@ class MenuEditorWindow:
                     return subsec
         return None
 
+    # Listbox row helpers used when patching views from model events
+    def _insert_sorted(self, lb, value):
+        lb.insert(bisect.bisect_left(lb.get(0, tk.END), value), value)
+
+    def _remove_row(self, lb, value):
+        rows = lb.get(0, tk.END)
+        if value in rows:
+            lb.delete(rows.index(value))
+
+    def _is_selected(self, lb, value):
+        sel = lb.curselection()
+        return bool(sel) and lb.get(sel[0]) == value
+
+    def _select_row(self, lb, value, on_select):
+        rows = lb.get(0, tk.END)
+        if value not in rows:
+            return
+        idx = rows.index(value)
+        lb.selection_clear(0, tk.END)
+        lb.selection_set(idx)
+        lb.see(idx)
+        on_select(None)
+
+    def _clear_section_view(self):
+        self._shown_section = None
+        self._shown_subsection = None
+        self.lb_subsections.delete(0, tk.END)
+        self.lb_items.delete(0, tk.END)
+        self.entry_item_limit.delete(0, tk.END)
+
     def on_section_select(self, event):
         sel = self.lb_sections.curselection()
-        if not sel:
-            self.lb_subsections.delete(0, tk.END)
-            self.lb_items.delete(0, tk.END)
-            self.entry_item_limit.delete(0, tk.END)
-            return
-        lookup = self.lb_sections.get(sel[0])
-        real_section = self._get_section_real_name(lookup)
+        real_section = self._get_section_real_name(self.lb_sections.get(sel[0])) if sel else None
+        self._clear_section_view()
         if not real_section:
-            self.lb_subsections.delete(0, tk.END)
-            self.lb_items.delete(0, tk.END)
-            self.entry_item_limit.delete(0, tk.END)
             return
+        self._shown_section = real_section
         val = self.menu["sections"].get(real_section, {})
-        self.lb_subsections.delete(0, tk.END)
-        self.lb_items.delete(0, tk.END)
         if isinstance(val, dict):
             for subsec in val:
                 self.lb_subsections.insert(tk.END, subsec)
@@ -230,28 +262,23 @@ class MenuEditorWindow:
         elif isinstance(val, list):
             for item in val:
                 self.lb_items.insert(tk.END, item)
-        else:
-            if real_section.lower() == "combos" and isinstance(val, dict):
-                for combo in val.keys():
-                    self.lb_items.insert(tk.END, combo)
 
     def on_subsection_select(self, event):
         sel_section = self.lb_sections.curselection()
         sel_subsec = self.lb_subsections.curselection()
+        self._shown_subsection = None
+        self.lb_items.delete(0, tk.END)
+        self.entry_item_limit.delete(0, tk.END)
         if not sel_section or not sel_subsec:
-            self.lb_items.delete(0, tk.END)
-            self.entry_item_limit.delete(0, tk.END)
             return
         section_lookup = self.lb_sections.get(sel_section[0])
         subsection_lookup = self.lb_subsections.get(sel_subsec[0])
         real_section = self._get_section_real_name(section_lookup)
         real_subsection = self._get_subsection_real_name(real_section, subsection_lookup)
         if not real_section or not real_subsection:
-            self.lb_items.delete(0, tk.END)
-            self.entry_item_limit.delete(0, tk.END)
             return
+        self._shown_subsection = real_subsection
         val = self.menu["sections"][real_section].get(real_subsection, [])
-        self.lb_items.delete(0, tk.END)
         for item in val:
             self.lb_items.insert(tk.END, item)
         if val:
@@ -268,6 +295,12 @@ class MenuEditorWindow:
         self.entry_item_limit.delete(0, tk.END)
         self.entry_item_limit.insert(0, str(limit))
 
+    def _selected_subsection(self, real_sec):
+        sel_subsec = self.lb_subsections.curselection()
+        if not sel_subsec:
+            return None
+        return self._get_subsection_real_name(real_sec, self.lb_subsections.get(sel_subsec[0]))
+
     def add_section(self):
         name = self.entry_section.get().strip()
         if not name:
@@ -277,14 +310,9 @@ class MenuEditorWindow:
         if any(s.lower() == name.lower() for s in secs):
             messagebox.showwarning("Exists", "Section already exists")
             return
-        secs[name] = []
         self.entry_section.delete(0, tk.END)
-        self.load_sections()
-        self.save_menu()
-        idx = list(secs.keys()).index(name)
-        self.lb_sections.selection_clear(0, tk.END)
-        self.lb_sections.selection_set(idx)
-        self.lb_sections.event_generate("<<ListboxSelect>>")
+        self.model.add_section(name)
+        self._select_row(self.lb_sections, name, self.on_section_select)
 
     def remove_section(self):
         sel = self.lb_sections.curselection()
@@ -297,21 +325,9 @@ class MenuEditorWindow:
             messagebox.showerror("Error", "Section not found")
             return
         if messagebox.askyesno("Confirm", f"Remove section '{real_sec}'?"):
-            self.menu["sections"].pop(real_sec, None)
-            self.load_sections()
-            self.save_menu()
-            secs = self.menu.get("sections", {})
-            if secs:
-                first = sorted(secs.keys())[0]
-                idx = list(secs.keys()).index(first)
-                self.lb_sections.selection_clear(0, tk.END)
-                self.lb_sections.selection_set(idx)
-                self.lb_sections.event_generate("<<ListboxSelect>>")
-            else:
-                self.lb_sections.selection_clear(0, tk.END)
-                self.lb_subsections.delete(0, tk.END)
-                self.lb_items.delete(0, tk.END)
-                self.entry_item_limit.delete(0, tk.END)
+            self.model.remove_section(real_sec)
+            if self.lb_sections.size():
+                self._select_row(self.lb_sections, self.lb_sections.get(0), self.on_section_select)
 
     def add_subsection(self):
         sel_section = self.lb_sections.curselection()
@@ -320,31 +336,25 @@ class MenuEditorWindow:
             return
         sec_lookup = self.lb_sections.get(sel_section[0])
         real_sec = self._get_section_real_name(sec_lookup)
-        secs = self.menu.setdefault("sections", {})
-        val = secs.get(real_sec, [])
-        if isinstance(val, list):
-            secs[real_sec] = {"default": val}
-            val = secs[real_sec]
+        if not real_sec:
+            messagebox.showerror("Error", "Section not found")
+            return
+        if real_sec == "combos":
+            messagebox.showwarning("Invalid", "Add combos from the Combo Specials tab")
+            return
+        val = self.menu["sections"].get(real_sec)
         name = self.entry_subsection.get().strip()
         if not name:
             messagebox.showwarning("Input needed", "Enter sub-section name")
             return
-        if any(s.lower() == name.lower() for s in val):
+        # A flat section keeps its items in a "default" sub-section
+        existing = val.keys() if isinstance(val, dict) else ["default"]
+        if any(s.lower() == name.lower() for s in existing):
             messagebox.showwarning("Exists", "Sub-section already exists")
             return
-        val[name] = []
         self.entry_subsection.delete(0, tk.END)
-        self.load_sections()
-        idx = list(secs.keys()).index(real_sec)
-        self.lb_sections.selection_clear(0, tk.END)
-        self.lb_sections.selection_set(idx)
-        self.lb_sections.event_generate("<<ListboxSelect>>")
-
-        idx_sub = list(val.keys()).index(name)
-        self.lb_subsections.selection_clear(0, tk.END)
-        self.lb_subsections.selection_set(idx_sub)
-        self.lb_subsections.event_generate("<<ListboxSelect>>")
-        self.save_menu()
+        self.model.add_subsection(real_sec, name)
+        self._select_row(self.lb_subsections, name, self.on_subsection_select)
 
     def remove_subsection(self):
         sel_section = self.lb_sections.curselection()
@@ -360,24 +370,9 @@ class MenuEditorWindow:
             messagebox.showerror("Error", "Invalid selection")
             return
         if messagebox.askyesno("Confirm", f"Remove sub-section '{real_subsec}'?"):
-            self.menu["sections"][real_sec].pop(real_subsec, None)
-            self.load_sections()
-            idx = list(self.menu["sections"].keys()).index(real_sec)
-            self.lb_sections.selection_clear(0, tk.END)
-            self.lb_sections.selection_set(idx)
-            self.lb_sections.event_generate("<<ListboxSelect>>")
-            self.save_menu()
-            val = self.menu["sections"].get(real_sec, {})
-            if isinstance(val, dict) and val:
-                first = sorted(val.keys())[0]
-                idx_sub = list(val.keys()).index(first)
-                self.lb_subsections.selection_clear(0, tk.END)
-                self.lb_subsections.selection_set(idx_sub)
-                self.lb_subsections.event_generate("<<ListboxSelect>>")
-            else:
-                self.lb_subsections.selection_clear(0, tk.END)
-                self.lb_items.delete(0, tk.END)
-                self.entry_item_limit.delete(0, tk.END)
+            self.model.remove_subsection(real_sec, real_subsec)
+            if self.lb_subsections.size():
+                self._select_row(self.lb_subsections, self.lb_subsections.get(0), self.on_subsection_select)
 
     def add_item(self):
         sel_section = self.lb_sections.curselection()
@@ -389,101 +384,37 @@ class MenuEditorWindow:
         if not real_sec:
             messagebox.showerror("Error", "Section not found")
             return
-        secs = self.menu.setdefault("sections", {})
-        val = secs.get(real_sec)
+        val = self.menu["sections"].get(real_sec)
 
         new_item = self.entry_item.get().strip()
         if not new_item:
             messagebox.showwarning("Input needed", "Enter item name")
             return
 
-        if real_sec.lower() == "drinks":
-            if isinstance(val, list):
-                if new_item in val:
-                    messagebox.showwarning("Exists", "Item already exists")
-                    return
-                val.append(new_item)
-            elif isinstance(val, dict):
-                sel_subsec = self.lb_subsections.curselection()
-                subsec = None
-                if sel_subsec:
-                    subsec_lookup = self.lb_subsections.get(sel_subsec[0])
-                    subsec = self._get_subsection_real_name(real_sec, subsec_lookup)
-                if subsec is None:
-                    if "default" not in val:
-                        val["default"] = []
-                        self.load_sections()
-                        idx = list(secs.keys()).index(real_sec)
-                        self.lb_sections.selection_clear(0, tk.END)
-                        self.lb_sections.selection_set(idx)
-                        self.lb_sections.event_generate("<<ListboxSelect>>")
-                        idx_sub = list(val.keys()).index("default")
-                        self.lb_subsections.selection_clear(0, tk.END)
-                        self.lb_subsections.selection_set(idx_sub)
-                        self.lb_subsections.event_generate("<<ListboxSelect>>")
-                    subsec = "default"
-                if new_item in val.get(subsec, []):
-                    messagebox.showwarning("Exists", "Item already exists")
-                    return
-                val[subsec].append(new_item)
-        else:
-            if isinstance(val, dict):
-                sel_subsec = self.lb_subsections.curselection()
-                if not sel_subsec:
+        subsec = None
+        if isinstance(val, dict) and real_sec != "combos":
+            subsec = self._selected_subsection(real_sec)
+            if subsec is None:
+                if real_sec.lower() != "drinks":
                     messagebox.showwarning("Select", "Select a sub-section")
                     return
-                subsec_lookup = self.lb_subsections.get(sel_subsec[0])
-                subsec = self._get_subsection_real_name(real_sec, subsec_lookup)
-                if not subsec:
-                    messagebox.showerror("Error", "Sub-section not found")
-                    return
-                if new_item in val.get(subsec, []):
-                    messagebox.showwarning("Exists", "Item already exists")
-                    return
-                val[subsec].append(new_item)
-            elif isinstance(val, list):
-                if new_item in val:
-                    messagebox.showwarning("Exists", "Item already exists")
-                    return
-                val.append(new_item)
-            else:
-                messagebox.showwarning("Invalid", "Selected section invalid for adding items")
-                return
-
-        self.entry_item.delete(0, tk.END)
-        self.load_sections()
-
-        idx = list(secs.keys()).index(real_sec)
-        self.lb_sections.selection_clear(0, tk.END)
-        self.lb_sections.selection_set(idx)
-        self.lb_sections.event_generate("<<ListboxSelect>>")
-
-        val_new = secs.get(real_sec)
-        if isinstance(val_new, dict):
-            sel_subsec = self.lb_subsections.curselection()
-            if sel_subsec:
-                sel_subsec_lookup = self.lb_subsections.get(sel_subsec[0])
-                sel_subsec_real = self._get_subsection_real_name(real_sec, sel_subsec_lookup)
-                idx_sub = list(val_new.keys()).index(sel_subsec_real)
-                self.lb_subsections.selection_clear(0, tk.END)
-                self.lb_subsections.selection_set(idx_sub)
-                self.lb_subsections.event_generate("<<ListboxSelect>>")
-                items = val_new.get(sel_subsec_real, [])
-                if new_item in items:
-                    idx_item = items.index(new_item)
-                    self.lb_items.selection_clear(0, tk.END)
-                    self.lb_items.selection_set(idx_item)
-                    self.lb_items.event_generate("<<ListboxSelect>>")
+                # Drinks without a chosen sub-section go to "default", created if needed
+                subsec = "default"
+            items = val.get(subsec, [])
+        elif isinstance(val, list):
+            items = val
         else:
-            items = val_new
-            if new_item in items:
-                idx_item = items.index(new_item)
-                self.lb_items.selection_clear(0, tk.END)
-                self.lb_items.selection_set(idx_item)
-                self.lb_items.event_generate("<<ListboxSelect>>")
+            messagebox.showwarning("Invalid", "Selected section invalid for adding items")
+            return
+        if new_item in items:
+            messagebox.showwarning("Exists", "Item already exists")
+            return
 
-        self.save_menu()
-        self.load_prices()
+        self.entry_item.delete(0, tk.END)
+        self.model.add_item(real_sec, subsec, new_item)
+        if subsec is not None and subsec != self._shown_subsection:
+            self._select_row(self.lb_subsections, subsec, self.on_subsection_select)
+        self._select_row(self.lb_items, new_item, self.on_item_select)
 
     def remove_item(self):
         sel_section = self.lb_sections.curselection()
@@ -497,49 +428,21 @@ class MenuEditorWindow:
         if not real_sec:
             messagebox.showerror("Error", "Section not found")
             return
-        secs = self.menu.setdefault("sections", {})
-        val = secs.get(real_sec)
-
-        if real_sec.lower() == "drinks":
-            if isinstance(val, list):
-                if item in val:
-                    val.remove(item)
-            elif isinstance(val, dict):
-                sel_subsec = self.lb_subsections.curselection()
-                subsec = None
-                if sel_subsec:
-                    subsec_lookup = self.lb_subsections.get(sel_subsec[0])
-                    subsec = self._get_subsection_real_name(real_sec, subsec_lookup)
-                if subsec and item in val.get(subsec, []):
-                    val[subsec].remove(item)
-        else:
-            if isinstance(val, dict):
-                sel_subsec = self.lb_subsections.curselection()
-                if not sel_subsec:
-                    messagebox.showwarning("Select", "Select a sub-section")
-                    return
-                subsec_lookup = self.lb_subsections.get(sel_subsec[0])
-                subsec = self._get_subsection_real_name(real_sec, subsec_lookup)
-                if subsec and item in val.get(subsec, []):
-                    val[subsec].remove(item)
-            elif isinstance(val, list):
-                if item in val:
-                    val.remove(item)
-
-        self.menu.get("item_limits", {}).pop(item, None)
-        self.menu.get("prices", {}).pop(item, None)
-        for disc in self.menu.get("discounts", {}).values():
-            if "bypass_items" in disc and item in disc["bypass_items"]:
-                disc["bypass_items"].remove(item)
-        self.load_sections()
-        self.save_menu()
+        val = self.menu["sections"].get(real_sec)
 
-        idx = list(secs.keys()).index(real_sec)
-        self.lb_sections.selection_clear(0, tk.END)
-        self.lb_sections.selection_set(idx)
-        self.lb_sections.event_generate("<<ListboxSelect>>")
+        subsec = None
+        if isinstance(val, dict):
+            subsec = self._selected_subsection(real_sec)
+            if subsec is None:
+                if real_sec.lower() != "drinks":
+                    messagebox.showwarning("Select", "Select a sub-section")
+                return
+        elif not isinstance(val, list):
+            return
 
-        self.load_prices()
+        # Its price, limit and discount bypasses go too once no section lists it
+        self.model.remove_item(real_sec, subsec, item)
+        self.entry_item_limit.delete(0, tk.END)
 
     def set_item_limit(self):
         sel = self.lb_items.curselection()
@@ -554,101 +457,325 @@ class MenuEditorWindow:
         except Exception:
             messagebox.showwarning("Invalid", "Limit must be a non-negative integer")
             return
-        if limit == 0:
-            self.menu.get("item_limits", {}).pop(item, None)
-        else:
-            self.menu.setdefault("item_limits", {})[item] = limit
+        self.model.set_limit(item, limit)
         messagebox.showinfo("Success", f"Set limit for {item} to {limit}")
-        self.save_menu()
+
+    def import_items_dialog(self):
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Import Items")
+        dlg.configure(bg=colors.BG_COLOR)
+        dlg.transient(self.root)
+        dlg.grab_set()
+
+        tk.Label(dlg, text="Paste CSV or TSV rows: section, subsection, item, price, limit\n"
+                           "(subsection empty for flat sections; price and limit optional)",
+                 justify=tk.LEFT, fg=colors.FG_COLOR, bg=colors.BG_COLOR, font=colors.FONT_ITEM).pack(
+            anchor=tk.W, padx=10, pady=(10, 2))
+        text = tk.Text(dlg, width=70, height=16, wrap=tk.NONE)
+        text.pack(fill=tk.BOTH, expand=True, padx=10)
+
+        def import_lines(lines):
+            started = time.perf_counter()
+            rows, errors = menu_import.parse(lines, self.model)
+            if errors:
+                messagebox.showerror("Nothing Imported", f"{len(errors)} problem(s) found:\n\n"
+                                     + menu_import.describe_errors(errors), parent=dlg)
+                return
+            if not rows:
+                messagebox.showwarning("Nothing Imported", "No item rows found.", parent=dlg)
+                return
+            added = menu_import.apply(self.model, rows)
+            print(f"[Import] {len(rows)} rows, {added} new items in {(time.perf_counter() - started) * 1000:.0f} ms")
+            dlg.destroy()
+            messagebox.showinfo("Import Complete", f"Imported {len(rows)} rows ({added} new items).", parent=self.root)
+
+        def from_file():
+            path = filedialog.askopenfilename(parent=dlg, title="Import items",
+                                              filetypes=[("CSV / TSV", "*.csv *.tsv *.txt"), ("All files", "*.*")])
+            if not path:
+                return
+            try:
+                with open(path, "r", newline="", encoding="utf-8-sig") as fp:
+                    import_lines(fp)
+            except (OSError, UnicodeDecodeError) as e:
+                messagebox.showerror("Import Failed", f"Could not read {path}:\n{e}", parent=dlg)
+
+        btn_frame = ttk.Frame(dlg, style="TFrame")
+        btn_frame.pack(fill=tk.X, padx=10, pady=10)
+        ttk.Button(btn_frame, text="Import", command=lambda: import_lines(text.get("1.0", "end-1c").splitlines())).pack(
+            side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="From File...", command=from_file).pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dlg.destroy).pack(side=tk.RIGHT, padx=5)
+        text.focus_set()
+
+    def bulk_edit_dialog(self):
+        dlg = tk.Toplevel(self.root)
+        dlg.title("Bulk Edit Items")
+        dlg.configure(bg=colors.BG_COLOR)
+        dlg.transient(self.root)
+        dlg.grab_set()
+
+        section_names = sorted(s for s in self.menu.get("sections", {}) if s != "combos")
+        v = {key: tk.StringVar() for key in ("section", "subsection", "pattern", "min", "max",
+                                            "value", "to_section", "to_subsection")}
+        v["op"] = tk.StringVar(value="scale")
+
+        filters = ttk.LabelFrame(dlg, text="Items")
+        filters.pack(fill=tk.X, padx=10, pady=(10, 5))
+        ttk.Label(filters, text="Section:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
+        ttk.Combobox(filters, textvariable=v["section"], values=[""] + section_names).grid(row=0, column=1, sticky="ew", padx=5)
+        ttk.Label(filters, text="Sub-section:").grid(row=0, column=2, sticky="w", padx=5)
+        ttk.Entry(filters, textvariable=v["subsection"]).grid(row=0, column=3, sticky="ew", padx=5)
+        ttk.Label(filters, text="Name (e.g. *cola*):").grid(row=1, column=0, sticky="w", padx=5, pady=2)
+        ttk.Entry(filters, textvariable=v["pattern"]).grid(row=1, column=1, sticky="ew", padx=5)
+        ttk.Label(filters, text="Price from / to:").grid(row=1, column=2, sticky="w", padx=5)
+        price_range = ttk.Frame(filters)
+        price_range.grid(row=1, column=3, sticky="ew", padx=5)
+        ttk.Entry(price_range, textvariable=v["min"], width=8).pack(side=tk.LEFT)
+        ttk.Entry(price_range, textvariable=v["max"], width=8).pack(side=tk.LEFT, padx=(5, 0))
+
+        ops = ttk.LabelFrame(dlg, text="Change")
+        ops.pack(fill=tk.X, padx=10, pady=5)
+        for col, (op, label) in enumerate((("set", "Set price"), ("scale", "Change by %"), ("round", "Round to"),
+                                           ("move", "Move to"), ("delete", "Delete"))):
+            ttk.Radiobutton(ops, text=label, value=op, variable=v["op"]).grid(row=0, column=col, sticky="w", padx=5, pady=2)
+        ttk.Label(ops, text="Amount:").grid(row=1, column=0, sticky="w", padx=5)
+        ttk.Entry(ops, textvariable=v["value"], width=10).grid(row=1, column=1, sticky="w", padx=5)
+        ttk.Label(ops, text="Move to section / sub-section:").grid(row=2, column=0, columnspan=2, sticky="w", padx=5, pady=2)
+        ttk.Combobox(ops, textvariable=v["to_section"], values=section_names).grid(row=2, column=2, sticky="ew", padx=5)
+        ttk.Entry(ops, textvariable=v["to_subsection"]).grid(row=2, column=3, columnspan=2, sticky="ew", padx=5)
+
+        preview = tk.Text(dlg, width=80, height=14, wrap=tk.NONE, state=tk.DISABLED)
+        preview.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+        pending = []  # changes shown in the preview; any input edit discards them
+
+        def show(text):
+            preview.config(state=tk.NORMAL)
+            preview.delete("1.0", tk.END)
+            preview.insert("1.0", text)
+            preview.config(state=tk.DISABLED)
+
+        def number(key, label, required=False):
+            text = v[key].get().strip().lstrip("$")
+            if not text and not required:
+                return None
+            try:
+                value = float(text)
+            except ValueError:
+                value = math.nan
+            if not math.isfinite(value):
+                raise ValueError(f"{label} must be a number")
+            return value
+
+        def compute():
+            targets = bulk_edit.select(self.model, v["section"].get(), v["subsection"].get(), v["pattern"].get(),
+                                       number("min", "Price from"), number("max", "Price to"))
+            op = v["op"].get()
+            if op == "set":
+                price = number("value", "Amount", required=True)
+                if price < 0:
+                    raise ValueError("Price cannot be negative")
+                return targets, bulk_edit.set_prices(self.model, targets, price)
+            if op == "scale":
+                return targets, bulk_edit.scale_prices(self.model, targets, number("value", "Amount", required=True))
+            if op == "round":
+                return targets, bulk_edit.round_prices(self.model, targets, number("value", "Amount", required=True))
+            if op == "move":
+                return targets, bulk_edit.move_items(self.model, targets, v["to_section"].get(), v["to_subsection"].get())
+            return targets, bulk_edit.delete_items(self.model, targets)
+
+        def on_preview():
+            pending.clear()
+            btn_apply.config(state=tk.DISABLED)
+            try:
+                targets, changes = compute()
+            except ValueError as e:
+                show(str(e))
+                return
+            lines = bulk_edit.describe(self.model, changes)
+            show(f"{len(targets)} item(s) selected, {len(changes)} change(s)\n\n" + "\n".join(lines))
+            pending.extend(changes)
+            if changes:
+                btn_apply.config(state=tk.NORMAL)
+
+        def on_apply():
+            if not pending:
+                return
+            if v["op"].get() == "delete" and not messagebox.askyesno(
+                    "Confirm", f"Delete {len(pending)} item listing(s)?", parent=dlg):
+                return
+            bulk_edit.apply(self.model, list(pending))
+            dlg.destroy()
+            messagebox.showinfo("Bulk Edit", f"Applied {len(pending)} change(s).", parent=self.root)
+
+        def on_input_changed(*_):
+            if pending:
+                pending.clear()
+                btn_apply.config(state=tk.DISABLED)
+                show("Inputs changed; press Preview again.")
+
+        for var in v.values():
+            var.trace_add("write", on_input_changed)
+
+        btn_frame = ttk.Frame(dlg, style="TFrame")
+        btn_frame.pack(fill=tk.X, padx=10, pady=(0, 10))
+        ttk.Button(btn_frame, text="Preview", command=on_preview).pack(side=tk.LEFT, padx=5)
+        btn_apply = ttk.Button(btn_frame, text="Apply", command=on_apply, state=tk.DISABLED)
+        btn_apply.pack(side=tk.LEFT, padx=5)
+        ttk.Button(btn_frame, text="Cancel", command=dlg.destroy).pack(side=tk.RIGHT, padx=5)
 
     def load_sections(self):
+        if not self.tabs.is_built(self.tab_sections):
+            return
         self.lb_sections.delete(0, tk.END)
         for sec in sorted(self.menu.get("sections", {}).keys()):
             self.lb_sections.insert(tk.END, sec)
-        self.lb_subsections.delete(0, tk.END)
-        self.lb_items.delete(0, tk.END)
-        self.entry_item_limit.delete(0, tk.END)
+        self._clear_section_view()
 
     def create_prices_tab(self):
         frame = self.tab_prices
         frame.rowconfigure(0, weight=1)
         frame.columnconfigure(0, weight=1)
 
-        self.scroll_prices = ScrollableFrame(frame)
-        self.scroll_prices.pack(fill=tk.BOTH, expand=True)
-
-        self.price_vars = {}
+        # One Treeview row per item; only the row being edited has an Entry
+        self.price_tree = ttk.Treeview(frame, columns=("item", "price"), show="headings", selectmode="browse")
+        self.price_tree.heading("item", text="Item", anchor="w")
+        self.price_tree.heading("price", text="Price", anchor="w")
+        self.price_tree.column("item", width=320, anchor="w")
+        self.price_tree.column("price", width=120, anchor="w")
+        scrollbar = ttk.Scrollbar(frame, orient="vertical", command=self.price_tree.yview)
+        # Tk also calls yscrollcommand when rows are inserted or deleted, so the open edit is only moved, never committed
+        self.price_tree.configure(yscrollcommand=lambda *args: (scrollbar.set(*args), self._queue_place_price_editor()))
+        self.price_tree.bind("<Configure>", lambda e: self._queue_place_price_editor(), add="+")
+        self.price_tree.grid(row=0, column=0, sticky="nsew", padx=(10, 0), pady=10)
+        scrollbar.grid(row=0, column=1, sticky="ns", padx=(0, 10), pady=10)
+
+        ttk.Label(frame, text="Double-click a price (or press Enter) to edit it; leave it empty to clear it.").grid(
+            row=1, column=0, columnspan=2, sticky="w", padx=10, pady=(0, 10))
+
+        self.price_tree.bind("<Double-1>", self._on_price_double_click)
+        self.price_tree.bind("<Return>", lambda e: self._edit_price(self.price_tree.focus()))
+        self.price_tree.bind("<F2>", lambda e: self._edit_price(self.price_tree.focus()))
+
+        self.price_items = []  # sorted item names shown in the grid
+        self._price_editor = None
+
+    def _price_text(self, item):
+        prices = self.menu.get("prices", {})
+        if item in self.menu.get("sections", {}).get("combos", {}):
+            return str(prices.get("combos", {}).get(item, 0))
+        return str(prices.get(item, ""))
 
     def load_prices(self):
-        for w in self.scroll_prices.scrollable_frame.winfo_children():
-            w.destroy()
-        self.price_vars.clear()
-
-        all_items = set()
-        for sec, val in self.menu.get("sections", {}).items():
-            if sec == "combos":
-                continue
-            if isinstance(val, dict):
-                for sublist in val.values():
-                    all_items.update(sublist)
-            elif isinstance(val, list):
-                all_items.update(val)
-
-        combos = self.menu.get("sections", {}).get("combos", {})
-        all_items.update(combos.keys())
-
-        for item in sorted(all_items):
-            row = ttk.Frame(self.scroll_prices.scrollable_frame)
-            row.pack(fill=tk.X, pady=2, padx=10)
-
-            lbl = ttk.Label(row, text=item, width=25)
-            lbl.pack(side=tk.LEFT)
+        """Rebuild the whole price grid (a Treeview insert per item, no per-row widgets)."""
+        if not self.tabs.is_built(self.tab_prices):
+            return
+        self._cancel_price_edit()
+        self.price_tree.delete(*self.price_tree.get_children())
+        self.price_items = sorted(self.model.names())
+        for item in self.price_items:
+            self.price_tree.insert("", tk.END, iid=item, values=(item, self._price_text(item)))
+
+    def _add_price_row(self, item):
+        index = bisect.bisect_left(self.price_items, item)
+        if index < len(self.price_items) and self.price_items[index] == item:
+            return
+        self.price_items.insert(index, item)
+        self.price_tree.insert("", index, iid=item, values=(item, self._price_text(item)))
 
-            prices = self.menu.get("prices", {})
-            if item in combos:
-                price_val = prices.get("combos", {}).get(item, 0)
-            else:
-                price_val = prices.get(item, "")
-
-            var = tk.StringVar(value=str(price_val))
-
-            def on_price_change(*args, var=var):
-                self.save_menu()
-
-            var.trace_add("write", on_price_change)
-            ent = ttk.Entry(row, textvariable=var, width=10)
-            ent.pack(side=tk.LEFT, padx=10)
-            self.price_vars[item] = var
-
-    def save_prices(self):
-        prices = self.menu.setdefault("prices", {})
-        to_remove = []
-        for key in list(prices.keys()):
-            if key != "combos" and key not in self.price_vars:
-                to_remove.append(key)
-        for key in to_remove:
-            prices.pop(key, None)
-        combos_prices = prices.setdefault("combos", {})
-        for item, var in self.price_vars.items():
-            val = var.get().strip()
-            if val == "":
-                if item in combos_prices:
-                    combos_prices.pop(item, None)
-                if item in prices:
-                    prices.pop(item, None)
-                continue
+    def _remove_price_row(self, item):
+        index = bisect.bisect_left(self.price_items, item)
+        if index == len(self.price_items) or self.price_items[index] != item:
+            return
+        if self._price_editor and self._price_editor.item == item:
+            self._cancel_price_edit()
+        del self.price_items[index]
+        self.price_tree.delete(item)
+
+    def _on_price_double_click(self, event):
+        item = self.price_tree.identify_row(event.y)
+        if item:
+            self._edit_price(item)
+
+    def _edit_price(self, item):
+        self._commit_price_edit()
+        if not item:
+            return
+        self.price_tree.see(item)
+        self.price_tree.update_idletasks()
+        bbox = self.price_tree.bbox(item, "price")
+        if not bbox:
+            return
+        x, y, width, height = bbox
+        entry = ttk.Entry(self.price_tree)
+        entry.item = item
+        entry.insert(0, self.price_tree.set(item, "price"))
+        entry.select_range(0, tk.END)
+        entry.place(x=x, y=y, width=width, height=height)
+        entry.focus_set()
+        entry.bind("<Return>", lambda e: self._commit_price_edit(move=1))
+        entry.bind("<KP_Enter>", lambda e: self._commit_price_edit(move=1))
+        entry.bind("<Tab>", lambda e: self._commit_price_edit(move=1) or "break")
+        entry.bind("<Up>", lambda e: self._commit_price_edit(move=-1))
+        entry.bind("<Down>", lambda e: self._commit_price_edit(move=1))
+        entry.bind("<Escape>", lambda e: self._cancel_price_edit())
+        entry.bind("<FocusOut>", lambda e: self._commit_price_edit())
+        self._price_editor = entry
+
+    def _queue_place_price_editor(self):
+        if self._price_editor is not None:
+            self.price_tree.after_idle(self._place_price_editor)
+
+    def _place_price_editor(self):
+        """Keep the edit Entry over its cell after scrolling, rows added or removed above it, or a resize."""
+        entry = self._price_editor
+        if entry is None or not self.price_tree.winfo_exists() or not self.price_tree.exists(entry.item):
+            return
+        bbox = self.price_tree.bbox(entry.item, "price")
+        if bbox:
+            x, y, width, height = bbox
+            entry.place(x=x, y=y, width=width, height=height)
+        else:
+            # Row scrolled out of view; the edit stays open and reappears with it
+            entry.place_forget()
+
+    def _cancel_price_edit(self):
+        entry, self._price_editor = self._price_editor, None
+        if entry is not None:
+            entry.destroy()
+            self.price_tree.focus_set()
+
+    def _commit_price_edit(self, move=0):
+        entry = self._price_editor
+        if entry is None:
+            return
+        item = entry.item
+        val = entry.get().strip()
+        fval = None
+        if val != "":
             try:
                 fval = float(val)
                 if fval < 0:
                     raise ValueError
-                if item in self.menu.get("sections", {}).get("combos", {}):
-                    combos_prices[item] = fval
-                else:
-                    prices[item] = fval
-            except Exception:
+            except ValueError:
+                self._price_editor = None
                 messagebox.showerror("Invalid Value", f"Price '{val}' for item '{item}' is invalid.")
-                return False
-        return True
+                self._price_editor = entry
+                entry.focus_set()
+                return
+        self._price_editor = None
+        entry.destroy()
+        self.model.set_price(item, fval)
+
+        self.price_tree.focus_set()
+        if move:
+            index = self.price_tree.index(item) + move
+            rows = self.price_tree.get_children()
+            if 0 <= index < len(rows):
+                self.price_tree.selection_set(rows[index])
+                self.price_tree.focus(rows[index])
+                self._edit_price(rows[index])
 
     def create_combos_tab(self):
         frame = self.tab_combos
@@ -743,27 +870,17 @@ class MenuEditorWindow:
                 messagebox.showwarning("Invalid Price", "Please enter a valid positive price", parent=dlg)
                 return
 
-            combos = self.menu.setdefault("sections", {}).setdefault("combos", {})
-            if name in combos:
+            if name in self.model.combos:
                 messagebox.showwarning("Exists", "Combo name already exists", parent=dlg)
                 return
 
-            combos[name] = {
+            self.model.add_combo(name, {
                 "price": price,
                 "mix_and_match": bool(mixm_var.get()),
                 "combo_items": { "food": [], "drinks": [], "desserts": [] } if mixm_var.get() else { "food": {}, "drinks": {}, "desserts": {} },
                 "limits": { "food": 0, "drinks": 0, "desserts": 0 }
-            }
-
-            prices_combos = self.menu.setdefault("prices", {}).setdefault("combos", {})
-            prices_combos[name] = price
-
-            self.load_combos()
-            idx = list(combos.keys()).index(name)
-            self.lb_combos.selection_clear(0, tk.END)
-            self.lb_combos.selection_set(idx)
-            self.lb_combos.event_generate("<<ListboxSelect>>")
-            self.save_menu()
+            })
+            self._select_row(self.lb_combos, name, self.on_combo_select)
             messagebox.showinfo("Combo Added", f"Combo '{name}' added successfully", parent=dlg)
             dlg.destroy()
 
@@ -781,6 +898,8 @@ class MenuEditorWindow:
         self.on_combo_select()
 
     def load_combos(self):
+        if not self.tabs.is_built(self.tab_combos):
+            return
         self.lb_combos.delete(0, tk.END)
         combos = self.menu.get("sections", {}).get("combos", {})
         for combo_name in sorted(combos.keys()):
@@ -891,7 +1010,7 @@ class MenuEditorWindow:
                 lbl = ttk.Label(item_frame, text=item)
                 lbl.pack(side=tk.LEFT)
 
-                spin = SteppedSpinbox(item_frame, min_val=0, max_val=999)
+                spin = QuantityControl(item_frame, min_val=0, max_val=999)
                 spin.pack(side=tk.RIGHT)
                 spin_val = 0
                 if cat in combo_items:
@@ -901,7 +1020,7 @@ class MenuEditorWindow:
 
                 self._fixed_combo_item_spinboxes[item] = spin
 
-                spin.var.trace_add("write", lambda *a: self._fixed_combo_item_spinboxes_changed())
+                spin.command = self._fixed_combo_item_spinboxes_changed
 
     def _fixed_combo_item_spinboxes_changed(self):
         sel = self.lb_combos.curselection()
@@ -933,8 +1052,7 @@ class MenuEditorWindow:
                 if cat:
                     new_combo_items.setdefault(cat, {})[item_name] = qty
 
-        combo_data["combo_items"] = new_combo_items
-        self.save_menu()
+        self.model.update_combo(combo_name, combo_items=new_combo_items)
 
     def update_combo(self):
         sel = self.lb_combos.curselection()
@@ -943,7 +1061,7 @@ class MenuEditorWindow:
             return
         idx = sel[0]
         combo_name = self.lb_combos.get(idx)
-        combos = self.menu.setdefault("sections", {}).setdefault("combos", {})
+        combos = self.model.combos
         if combo_name not in combos:
             return
 
@@ -955,14 +1073,8 @@ class MenuEditorWindow:
             messagebox.showerror("Invalid", "Enter valid positive combo price")
             return
 
-        combo_data = combos[combo_name]
-        prices_combos = self.menu.setdefault("prices", {}).setdefault("combos", {})
-        prices_combos[combo_name] = price
-
-        combo_data["price"] = price
-        combo_data["mix_and_match"] = bool(self.combo_mam_var.get())
-
-        if combo_data["mix_and_match"]:
+        mix_and_match = bool(self.combo_mam_var.get())
+        if mix_and_match:
             selected_items_by_cat = {}
             if hasattr(self, "combo_dynamic_lbs") and isinstance(self.combo_dynamic_lbs, dict):
                 for cat, lb in self.combo_dynamic_lbs.items():
@@ -970,7 +1082,6 @@ class MenuEditorWindow:
                     selected_items_by_cat[cat] = selected_items
             else:
                 selected_items_by_cat = {"food": [], "drinks": [], "desserts": []}
-            combo_data["combo_items"] = selected_items_by_cat
 
             try:
                 limit_food = self.combo_limit_food_var.get()
@@ -981,21 +1092,19 @@ class MenuEditorWindow:
             except Exception:
                 messagebox.showerror("Invalid", "Combo section limits must be non-negative integers")
                 return
-            combo_data["limits"] = {
-                "food": limit_food,
-                "drinks": limit_drinks,
-                "desserts": limit_desserts
+            fields = {
+                "combo_items": selected_items_by_cat,
+                "limits": {"food": limit_food, "drinks": limit_drinks, "desserts": limit_desserts},
             }
         else:
-            combo_data["limits"] = {"food": 0, "drinks": 0, "desserts": 0}
+            fields = {"limits": {"food": 0, "drinks": 0, "desserts": 0}}
 
-        self.load_combos()
-        idx = list(combos.keys()).index(combo_name)
-        self.lb_combos.selection_clear(0, tk.END)
-        self.lb_combos.selection_set(idx)
-        self.lb_combos.event_generate("<<ListboxSelect>>")
+        was_mix = bool(combos[combo_name].get("mix_and_match", False))
+        self.model.update_combo(combo_name, price=price, mix_and_match=mix_and_match, **fields)
+        if mix_and_match != was_mix:
+            # The item pickers change between allowed lists and fixed quantities
+            self.on_combo_select()
         messagebox.showinfo("Success", "Combo updated")
-        self.save_menu()
 
     def remove_combo(self):
         sel = self.lb_combos.curselection()
@@ -1005,10 +1114,7 @@ class MenuEditorWindow:
         idx = sel[0]
         combo_name = self.lb_combos.get(idx)
         if messagebox.askyesno("Confirm", f"Remove combo '{combo_name}'?"):
-            self.menu["sections"]["combos"].pop(combo_name, None)
-            self.menu.get("prices", {}).get("combos", {}).pop(combo_name, None)
-            self.load_combos()
-            self.save_menu()
+            self.model.remove_combo(combo_name)
 
     # ============ Discounts Tab =============
 
@@ -1116,13 +1222,10 @@ class MenuEditorWindow:
                 messagebox.showwarning("Invalid Percent", "Percent must be an integer between 0 and 100.", parent=popup)
                 return
 
-            discounts = self.menu.setdefault("discounts", {})
-            if name in discounts:
+            if name in self.menu.get("discounts", {}):
                 messagebox.showwarning("Exists", "Discount with this name already exists.", parent=popup)
                 return
-            discounts[name] = {"percent": percent, "bypass_items": []}
-            self.load_discounts()
-            self.save_menu()
+            self.model.add_discount(name, percent)
             popup.destroy()
             messagebox.showinfo("Discount Added", f"Discount '{name}' added.", parent=self.root)
 
@@ -1132,6 +1235,8 @@ class MenuEditorWindow:
         popup.bind("<Return>", lambda e: confirm_add())
 
     def load_discounts(self):
+        if not self.tabs.is_built(self.tab_discounts):
+            return
         self.lb_discounts.delete(0, tk.END)
         discounts = self.menu.get("discounts", {})
         for dname in sorted(discounts.keys()):
@@ -1140,18 +1245,7 @@ class MenuEditorWindow:
         self.clear_discount_fields()
 
     def load_discount_bypass_items(self):
-        items = set()
-        for section, val in self.menu.get("sections", {}).items():
-            if section == "combos":
-                continue
-            if isinstance(val, dict):
-                for lst in val.values():
-                    items.update(lst)
-            elif isinstance(val, list):
-                items.update(val)
-        combos = self.menu.get("sections", {}).get("combos", {})
-        items.update(combos.keys())
-        items = sorted(items)
+        items = sorted(self.model.names())
         self.lb_disc_bypass.delete(0, tk.END)
         for i in items:
             self.lb_disc_bypass.insert(tk.END, i)
@@ -1184,13 +1278,11 @@ class MenuEditorWindow:
         if not dname:
             messagebox.showwarning("Name Required", "Enter discount name")
             return
-        discounts = self.menu.setdefault("discounts", {})
-        if dname in discounts:
+        if dname in self.menu.get("discounts", {}):
             messagebox.showwarning("Exists", "Discount already exists")
             return
-        discounts[dname] = { "percent": 0, "bypass_items": [] }
-        self.load_discounts()
-        self.save_menu()
+        self.model.add_discount(dname, 0)
+        self._select_row(self.lb_discounts, dname, self.on_discount_select)
 
     def remove_discount(self):
         sel = self.lb_discounts.curselection()
@@ -1199,10 +1291,8 @@ class MenuEditorWindow:
             return
         dname = self.lb_discounts.get(sel[0])
         if messagebox.askyesno("Confirm", f"Remove discount '{dname}'?"):
-            self.menu.get("discounts", {}).pop(dname, None)
-            self.load_discounts()
+            self.model.remove_discount(dname)
             self.clear_discount_fields()
-            self.save_menu()
 
     def update_discount(self):
         sel = self.lb_discounts.curselection()
@@ -1222,20 +1312,12 @@ class MenuEditorWindow:
             messagebox.showerror("Invalid", "Percent must be integer between 0 and 100")
             return
         bypass = [self.lb_disc_bypass.get(i) for i in self.lb_disc_bypass.curselection()]
-        discounts = self.menu.setdefault("discounts", {})
-        if new_name != old_name:
-            if new_name in discounts:
-                messagebox.showwarning("Exists", "Discount with that name already exists")
-                return
-            discounts.pop(old_name, None)
-        discounts[new_name] = {"percent": percent, "bypass_items": bypass}
-        self.load_discounts()
-        idx = list(discounts.keys()).index(new_name)
-        self.lb_discounts.selection_clear(0, tk.END)
-        self.lb_discounts.selection_set(idx)
-        self.lb_discounts.event_generate("<<ListboxSelect>>")
+        if new_name != old_name and new_name in self.menu.get("discounts", {}):
+            messagebox.showwarning("Exists", "Discount with that name already exists")
+            return
+        self.model.update_discount(old_name, new_name, percent, bypass)
+        self._select_row(self.lb_discounts, new_name, self.on_discount_select)
         messagebox.showinfo("Success", "Discount updated")
-        self.save_menu()
 
     # ============ Menu Image Tab =============
 
@@ -1278,21 +1360,33 @@ class MenuEditorWindow:
         messagebox.showinfo("Image Loaded", "Menu image loaded and saved.")
 
     def _load_and_show_image(self, path_or_url):
-        try:
-            if path_or_url.startswith("http://") or path_or_url.startswith("https://"):
-                response = requests.get(path_or_url)
-                response.raise_for_status()
-                pil_img = Image.open(io.BytesIO(response.content))
-            else:
-                pil_img = Image.open(path_or_url)
-            pil_img.thumbnail((400, 300), Image.LANCZOS)
-            self.image_tk = ImageTk.PhotoImage(pil_img)
-            self.img_display_lbl.config(image=self.image_tk, text="")
-            self.img_display_lbl.bind("<Button-1>", self.show_full_image)
-        except Exception as e:
-            self.img_display_lbl.config(text=f"Failed to load image: {e}", image="")
-            self.image_tk = None
-            self.img_display_lbl.unbind("<Button-1>")
+        # Fetched and decoded on the worker pool; the PhotoImage is made on the Tk thread
+        if self._image_task:
+            self._image_task.cancel()
+        self.img_display_lbl.config(text="Loading image...", image="")
+        self._image_task = dispatcher.submit(
+            image_cache.load_thumbnail, path_or_url, (400, 300),
+            on_done=self._show_image,
+            on_error=self._show_image_error,
+        )
+
+    def _show_image(self, pil_img):
+        from PIL import ImageTk
+
+        self._image_task = None
+        if not self.img_display_lbl.winfo_exists():
+            return
+        self.image_tk = ImageTk.PhotoImage(pil_img)
+        self.img_display_lbl.config(image=self.image_tk, text="")
+        self.img_display_lbl.bind("<Button-1>", self.show_full_image)
+
+    def _show_image_error(self, e):
+        self._image_task = None
+        if not self.img_display_lbl.winfo_exists():
+            return
+        self.img_display_lbl.config(text=f"Failed to load image: {e}", image="")
+        self.image_tk = None
+        self.img_display_lbl.unbind("<Button-1>")
 
     def clear_image(self):
         if "menu_image_path" in self.menu:
@@ -1307,31 +1401,29 @@ class MenuEditorWindow:
         if not self.image_path or (not self.image_path.startswith("http") and not os.path.isfile(self.image_path)):
             messagebox.showwarning("No image", "No valid image to display.")
             return
+        dispatcher.submit(
+            image_cache.load_fitted, self.image_path, (800, 600),
+            on_done=self._show_full_image,
+            on_error=self._show_full_image_error,
+        )
+
+    def _show_full_image(self, pil_img):
+        from PIL import ImageTk
+
         top = tk.Toplevel(self.root)
         top.title("Menu Image Preview")
-        try:
-            if self.image_path.startswith("http://") or self.image_path.startswith("https://"):
-                response = requests.get(self.image_path)
-                response.raise_for_status()
-                pil_img = Image.open(io.BytesIO(response.content))
-            else:
-                pil_img = Image.open(self.image_path)
-            w, h = pil_img.size
-            max_w, max_h = 800, 600
-            scale = min(max_w / w, max_h / h, 1)
-            pil_img = pil_img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-            img_tk = ImageTk.PhotoImage(pil_img)
-            lbl = ttk.Label(top, image=img_tk)
-            lbl.image = img_tk  # keep ref
-            lbl.pack()
-            top.geometry(f"{lbl.image.width()}x{lbl.image.height()}")
-            # Remove grab_set and transient to allow interacting with other windows while open
-            # top.transient(self.root)
-            # top.grab_set()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load full image: {e}")
-            top.destroy()
-            self.img_display_lbl.config(text="No image selected", image="")
+        img_tk = ImageTk.PhotoImage(pil_img)
+        lbl = ttk.Label(top, image=img_tk)
+        lbl.image = img_tk  # keep ref
+        lbl.pack()
+        top.geometry(f"{lbl.image.width()}x{lbl.image.height()}")
+        # Remove grab_set and transient to allow interacting with other windows while open
+        # top.transient(self.root)
+        # top.grab_set()
+
+    def _show_full_image_error(self, e):
+        messagebox.showerror("Error", f"Failed to load full image: {e}")
+        self.img_display_lbl.config(text="No image selected", image="")
 
     def load_image_tab(self):
         if self.image_path and (self.image_path.startswith("http") or os.path.isfile(self.image_path)):
@@ -1339,14 +1431,135 @@ class MenuEditorWindow:
         else:
             self.img_display_lbl.config(text="No image selected", image="")
 
+    # ============ Model change events ============
+
+    # Past this many changes at once, rebuilding the built tabs beats patching them
+    RELOAD_AFTER_EVENTS = 200
+
+    def _on_menu_changed(self, events):
+        if len(events) > self.RELOAD_AFTER_EVENTS:
+            self._reload_views()
+        else:
+            for event in events:
+                handler = getattr(self, f"_on_{event.kind}", None)
+                if handler:
+                    handler(event)
+        # One save per edit, however many rows it touched
+        self.save_menu()
+
+    def _reload_views(self):
+        if self.tabs.is_built(self.tab_sections):
+            shown = self._shown_section, self._shown_subsection
+            self.load_sections()
+            if shown[0] is not None:
+                self._select_row(self.lb_sections, shown[0], self.on_section_select)
+            if shown[1] is not None:
+                self._select_row(self.lb_subsections, shown[1], self.on_subsection_select)
+        self.load_prices()
+        self.load_combos()
+        self.load_discounts()
+
+    def _on_section_added(self, event):
+        if self.tabs.is_built(self.tab_sections):
+            self._insert_sorted(self.lb_sections, event.section)
+
+    def _on_section_removed(self, event):
+        if self.tabs.is_built(self.tab_sections):
+            self._remove_row(self.lb_sections, event.section)
+            if event.section == self._shown_section:
+                self._clear_section_view()
+
+    def _on_section_changed(self, event):
+        if self.tabs.is_built(self.tab_sections) and event.section == self._shown_section:
+            self._select_row(self.lb_sections, event.section, self.on_section_select)
+
+    def _on_subsection_added(self, event):
+        if self.tabs.is_built(self.tab_sections) and event.section == self._shown_section:
+            self.lb_subsections.insert(tk.END, event.subsection)
+
+    def _on_subsection_removed(self, event):
+        if self.tabs.is_built(self.tab_sections) and event.section == self._shown_section:
+            self._remove_row(self.lb_subsections, event.subsection)
+            if event.subsection == self._shown_subsection:
+                self._shown_subsection = None
+                self.lb_items.delete(0, tk.END)
+                self.entry_item_limit.delete(0, tk.END)
+
+    def _shows_items_of(self, event):
+        return (self.tabs.is_built(self.tab_sections) and event.section == self._shown_section
+                and event.subsection == self._shown_subsection)
+
+    def _on_item_added(self, event):
+        if self._shows_items_of(event):
+            self.lb_items.insert(tk.END, event.name)
+
+    def _on_item_removed(self, event):
+        if self._shows_items_of(event):
+            self._remove_row(self.lb_items, event.name)
+
+    def _on_limit_changed(self, event):
+        if not self.tabs.is_built(self.tab_sections):
+            return
+        sel = self.lb_items.curselection()
+        if sel and self.lb_items.get(sel[0]) == event.name:
+            self.on_item_select(None)
+
+    def _on_listed(self, event):
+        if self.tabs.is_built(self.tab_prices):
+            self._add_price_row(event.name)
+        if self.tabs.is_built(self.tab_discounts):
+            self._insert_sorted(self.lb_disc_bypass, event.name)
+
+    def _on_unlisted(self, event):
+        if self.tabs.is_built(self.tab_prices):
+            self._remove_price_row(event.name)
+        if self.tabs.is_built(self.tab_discounts):
+            self._remove_row(self.lb_disc_bypass, event.name)
+
+    def _on_price_changed(self, event):
+        if self.tabs.is_built(self.tab_prices) and self.price_tree.exists(event.name):
+            self.price_tree.set(event.name, "price", self._price_text(event.name))
+
+    def _on_combo_added(self, event):
+        if self.tabs.is_built(self.tab_combos):
+            self._insert_sorted(self.lb_combos, event.name)
+
+    def _on_combo_changed(self, event):
+        if self.tabs.is_built(self.tab_combos) and self._is_selected(self.lb_combos, event.name):
+            self.on_combo_select()
+
+    def _on_combo_removed(self, event):
+        if not self.tabs.is_built(self.tab_combos):
+            return
+        if self._is_selected(self.lb_combos, event.name):
+            self.clear_combo_details()
+        self._remove_row(self.lb_combos, event.name)
+
+    def _on_discount_added(self, event):
+        if self.tabs.is_built(self.tab_discounts):
+            self._insert_sorted(self.lb_discounts, event.name)
+
+    def _on_discount_changed(self, event):
+        # Also sent when removing an item's last listing drops it from the bypass list
+        if self.tabs.is_built(self.tab_discounts) and self._is_selected(self.lb_discounts, event.name):
+            self.on_discount_select()
+
+    def _on_discount_removed(self, event):
+        if self.tabs.is_built(self.tab_discounts):
+            self._remove_row(self.lb_discounts, event.name)
+
     # ============ Save and close ============
 
     def save_menu(self):
-        if not self.save_prices():
-            return
-        save_menu(self.menu, self.establishment)
+        # Serialized now, written on the worker pool; rapid successive saves collapse into one write
+        save_menu_async(self.menu, self.establishment, on_done=self._on_menu_saved, on_error=self._on_menu_save_failed)
+
+    def _on_menu_saved(self, written):
         if self.on_save_callback:
             self.on_save_callback()
 
+    def _on_menu_save_failed(self, e):
+        messagebox.showerror("Save Failed", f"Could not save the menu:\n{e}")
+
     def on_close(self):
         self.root.destroy()
\ No newline at end of file
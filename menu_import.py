@@ -0,0 +1,172 @@
+# menu_import.py
+"""
+Bulk item import for the Menu Editor.
+
+Takes CSV or TSV text (pasted or read from a file), one item per line:
+
+    section,subsection,item,price,limit
+    food,burgers,Cheeseburger,8.50,
+    drinks,,Cola,2.25,4
+
+Subsection may be empty for a flat section; price and limit are optional. A
+first row starting with "section" is taken as a header. Every line is checked
+in a single pass before anything changes, so the user sees all problems at
+once; a clean import is then applied as one model batch (one save, one view
+refresh).
+
+    with open(path, newline="", encoding="utf-8-sig") as fp:
+        rows, errors = menu_import.parse(fp, model)
+    if not errors:
+        added = menu_import.apply(model, rows)
+"""
+import csv
+import math
+from collections import namedtuple
+
+ImportRow = namedtuple("ImportRow", "line section subsection item price limit new")
+
+MAX_ERRORS_SHOWN = 15
+
+
+def _delimiter(first_line):
+    if "\t" in first_line:
+        return "\t"
+    if ";" in first_line and "," not in first_line:
+        return ";"
+    return ","
+
+
+def _number(text, kind):
+    text = text.strip().lstrip("$")
+    if not text:
+        return None
+    value = kind(text)
+    # float() accepts "nan" and "inf", which would poison totals and the saved JSON
+    if not math.isfinite(value) or value < 0:
+        raise ValueError
+    return value
+
+
+class _Target:
+    """Where rows of one section land: the real section name and each sub-section's current items."""
+
+    def __init__(self, name, value):
+        self.name = name
+        self.nested = isinstance(value, dict)
+        self.subsections = {}  # lower -> real name
+        self.items = {}  # real sub-section (None when flat) -> set of items
+        if self.nested:
+            for sub, items in value.items():
+                self.subsections[sub.lower()] = sub
+                self.items[sub] = set(items)
+        else:
+            self.items[None] = set(value or ())
+
+
+def _chain(first, rest):
+    yield first
+    yield from rest
+
+
+def parse(lines, model):
+    """
+    Check import lines against the menu in `model`. Returns (rows, errors):
+    ImportRows to apply, and "line N: ..." messages. Apply nothing if there are errors.
+    """
+    sections = model.sections
+    section_names = {name.lower(): name for name in sections}
+    targets = {}  # section lower -> _Target
+    prices = {}  # item -> (price, line)
+    placed = set()  # (section, sub-section, item) already on an earlier line
+    rows = []
+    errors = []
+
+    lines = iter(lines)
+    first = next(lines, "")
+    reader = csv.reader(_chain(first, lines), delimiter=_delimiter(first), skipinitialspace=True)
+    for cells in reader:
+        line = reader.line_num
+        cells = [c.strip() for c in cells]
+        if not any(cells) or cells[0].startswith("#"):
+            continue
+        if not rows and not errors and cells[0].lower() == "section":
+            continue
+        if len(cells) < 3 or len(cells) > 5:
+            errors.append(f"line {line}: expected section, subsection, item[, price[, limit]]")
+            continue
+        cells += [""] * (5 - len(cells))
+        section, subsection, item, price_text, limit_text = cells
+        if not section or not item:
+            errors.append(f"line {line}: section and item are required")
+            continue
+        if section.lower() == "combos":
+            errors.append(f"line {line}: combos are added in the Combo Specials tab")
+            continue
+        try:
+            price = _number(price_text, float)
+        except ValueError:
+            errors.append(f"line {line}: price '{price_text}' is not a non-negative number")
+            continue
+        try:
+            limit = _number(limit_text, int)
+        except ValueError:
+            errors.append(f"line {line}: limit '{limit_text}' is not a non-negative whole number")
+            continue
+
+        target = targets.get(section.lower())
+        if target is None:
+            real = section_names.get(section.lower())
+            if real is None:
+                # New section, shaped by its first row
+                target = _Target(section, {} if subsection else [])
+            else:
+                target = _Target(real, sections[real])
+            targets[section.lower()] = target
+
+        if target.nested != bool(subsection):
+            need = "a sub-section" if target.nested else "no sub-section"
+            errors.append(f"line {line}: section '{target.name}' takes {need}")
+            continue
+        sub = None
+        if subsection:
+            sub = target.subsections.setdefault(subsection.lower(), subsection)
+        key = (target.name, sub, item)
+        if key in placed:
+            errors.append(f"line {line}: '{item}' is listed twice under {target.name}/{sub or '-'}")
+            continue
+        placed.add(key)
+        # Items already there keep their place; their price and limit are updated
+        new = item not in target.items.get(sub, ())
+
+        if price is not None:
+            seen = prices.setdefault(item, (price, line))
+            if seen[0] != price:
+                errors.append(f"line {line}: '{item}' priced {price:g} here but {seen[0]:g} on line {seen[1]}")
+                continue
+        rows.append(ImportRow(line, target.name, sub, item, price, limit, new))
+
+    return rows, errors
+
+
+def apply(model, rows):
+    """Apply parsed rows as one model batch. Returns the number of items added."""
+    added = 0
+    with model.batch():
+        for row in rows:
+            if row.section not in model.sections:
+                model.add_section(row.section, nested=row.subsection is not None)
+            if row.new:
+                model.add_item(row.section, row.subsection, row.item)
+                added += 1
+            if row.price is not None:
+                model.set_price(row.item, row.price)
+            if row.limit is not None:
+                model.set_limit(row.item, row.limit)
+    return added
+
+
+def describe_errors(errors):
+    shown = errors[:MAX_ERRORS_SHOWN]
+    if len(errors) > len(shown):
+        shown.append(f"... and {len(errors) - len(shown)} more")
+    return "\n".join(shown)
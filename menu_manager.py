@@ -1,10 +1,16 @@
 # menu_manager.py
 import os
 import json
+import time
+import threading
 
 DATA_DIR = "data"
 MENU_DIR = os.path.join(DATA_DIR, "menus")
 
+# Menu writes are serialized; path -> cancel token of the newest queued async write
+_write_lock = threading.Lock()
+_pending_writes = {}
+
 
 def ensure_dirs():
     os.makedirs(MENU_DIR, exist_ok=True)
@@ -18,6 +24,11 @@ def load_menu_files():
 
 
 def load_menu(establishment_name):
+    return load_menu_raw(establishment_name)[0]
+
+
+def load_menu_raw(establishment_name):
+    """The menu and the exact bytes of its file."""
     ensure_dirs()
     path = os.path.join(MENU_DIR, f"{establishment_name}.json")
     if not os.path.exists(path):
@@ -35,16 +46,75 @@ def load_menu(establishment_name):
             "prices": {"food": 10, "drinks": 7, "animal_treat": 3, "combos": {}}
         }
         save_menu(menu, establishment_name)
-        return menu
-    with open(path, "r", encoding="utf-8") as fp:
-        return json.load(fp)
+    import metrics  # imported here: metrics itself imports this module
+
+    start = time.perf_counter()
+    with open(path, "rb") as fp:
+        raw = fp.read()
+    menu = json.loads(raw)
+    metrics.MENU_LOAD.observe(time.perf_counter() - start)
+    return menu, raw
+
+
+def _write_menu_text(path, text, establishment_name, menu=None):
+    # Imported here: both modules import this one
+    import metrics
+    import render_plan
+
+    start = time.perf_counter()
+    raw = text.encode("utf-8")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as fp:
+        fp.write(raw)
+    os.replace(tmp_path, path)
+    metrics.MENU_SAVE.observe(time.perf_counter() - start)
+    try:
+        render_plan.save_for_menu(establishment_name, menu if menu is not None else json.loads(raw), raw)
+    except OSError as e:
+        print(f"[Plan] Could not store plan for {establishment_name}: {e}")
 
 
 def save_menu(menu, establishment_name):
     ensure_dirs()
     path = os.path.join(MENU_DIR, f"{establishment_name}.json")
-    with open(path, "w", encoding="utf-8") as fp:
-        json.dump(menu, fp, indent=4)
+    with _write_lock:
+        # A queued background save holds older state
+        previous = _pending_writes.pop(path, None)
+        if previous:
+            previous.cancel()
+        _write_menu_text(path, json.dumps(menu, indent=4), establishment_name, menu)
+
+
+def save_menu_async(menu, establishment_name, on_done=None, on_error=None):
+    """
+    Save a menu on the worker pool. The menu is serialized right away, so later
+    edits on the caller's side cannot race the write. A queued write that has not
+    started yet is dropped when a newer one for the same menu arrives, so bursts
+    of saves (e.g. typing prices) end in a single write of the latest state.
+    `on_done(True)` runs on the Tk thread once the latest state is on disk.
+    """
+    import dispatcher
+
+    ensure_dirs()
+    path = os.path.join(MENU_DIR, f"{establishment_name}.json")
+    text = json.dumps(menu, indent=4)
+    token = dispatcher.CancelToken()
+    with _write_lock:
+        previous = _pending_writes.get(path)
+        if previous:
+            previous.cancel()
+        _pending_writes[path] = token
+
+    def write():
+        with _write_lock:
+            token.raise_if_cancelled()
+            # The plan is built from the serialized text; `menu` may change meanwhile
+            _write_menu_text(path, text, establishment_name)
+            if _pending_writes.get(path) is token:
+                del _pending_writes[path]
+        return True
+
+    return dispatcher.submit(write, token=token, on_done=on_done, on_error=on_error)
 
 
 def save_menu_file(filename, data, directory="menus"):
@@ -71,6 +141,8 @@ def delete_menu_file(establishment_name):
     try:
         os.remove(path)
         print(f"Deleted menu file: {path}")
+        import render_plan
+        render_plan.delete_plan(establishment_name)
     except FileNotFoundError:
         print(f"Menu file not found: {path}")
     except Exception as e:
@@ -0,0 +1,251 @@
+# menu_model.py
+"""
+The menu being edited, with change notifications.
+
+Every edit made in the Menu Editor goes through a MenuModel method. The method
+changes the menu dict in place and then tells subscribers exactly what
+changed, so each tab can patch only the rows involved instead of reloading
+from the whole menu:
+
+    model = MenuModel(menu)
+    model.subscribe(on_change)        # on_change(events) once per edit
+    model.add_item("food", "burgers", "Cheeseburger")
+    with model.batch():               # many edits, one delivery
+        ...
+
+Removing the last listing of an item or combo also drops its price, its item
+limit and its place in discount bypass lists.
+"""
+from collections import Counter, namedtuple
+from contextlib import contextmanager
+
+# kind is one of:
+#   section_added, section_removed, section_changed (re-read the whole section),
+#   subsection_added, subsection_removed, item_added, item_removed,
+#   listed / unlisted (a name entered or left the set of items and combos),
+#   limit_changed, price_changed, combo_added, combo_changed, combo_removed,
+#   discount_added, discount_changed, discount_removed
+MenuEvent = namedtuple("MenuEvent", "kind section subsection name", defaults=(None, None, None))
+
+
+def _section_items(value):
+    if isinstance(value, dict):
+        return [item for sub in value.values() for item in sub]
+    if isinstance(value, list):
+        return list(value)
+    return []
+
+
+class MenuModel:
+    def __init__(self, menu):
+        self.menu = menu
+        self._subscribers = []
+        self._pending = []
+        self._depth = 0
+        # Listings per name across sections, plus one per combo
+        self._listed = Counter()
+        for section, value in self.sections.items():
+            if section == "combos":
+                self._listed.update((value or {}).keys())
+            else:
+                self._listed.update(_section_items(value))
+
+    @property
+    def sections(self):
+        return self.menu.setdefault("sections", {})
+
+    @property
+    def combos(self):
+        return self.sections.get("combos", {}) or {}
+
+    def names(self):
+        """Every item and combo name on the menu."""
+        return set(self._listed)
+
+    def is_listed(self, name):
+        return self._listed.get(name, 0) > 0
+
+    def listings(self, name):
+        """How many sub-sections / flat sections (or combos) list `name`."""
+        return self._listed.get(name, 0)
+
+    # ---- notifications ----
+
+    def subscribe(self, callback):
+        self._subscribers.append(callback)
+
+    @contextmanager
+    def batch(self):
+        """Deliver the events of every edit made inside the block together, at the end."""
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._flush()
+
+    def _emit(self, kind, section=None, subsection=None, name=None):
+        self._pending.append(MenuEvent(kind, section, subsection, name))
+
+    def _flush(self):
+        events, self._pending = self._pending, []
+        if events:
+            for callback in list(self._subscribers):
+                callback(events)
+
+    # ---- listing bookkeeping ----
+
+    def _list(self, name):
+        self._listed[name] += 1
+        if self._listed[name] == 1:
+            self._emit("listed", name=name)
+
+    def _unlist(self, name):
+        self._listed[name] -= 1
+        if self._listed[name] > 0:
+            return
+        del self._listed[name]
+        prices = self.menu.get("prices", {})
+        prices.pop(name, None)
+        (prices.get("combos") or {}).pop(name, None)
+        self.menu.get("item_limits", {}).pop(name, None)
+        for dname, discount in self.menu.get("discounts", {}).items():
+            bypass = discount.get("bypass_items")
+            if bypass and name in bypass:
+                bypass.remove(name)
+                self._emit("discount_changed", name=dname)
+        self._emit("unlisted", name=name)
+
+    # ---- sections and items ----
+
+    def add_section(self, section, nested=False):
+        """Add an empty section: a flat item list, or with `nested` a dict of sub-sections."""
+        with self.batch():
+            self.sections[section] = {} if nested else []
+            self._emit("section_added", section)
+
+    def remove_section(self, section):
+        with self.batch():
+            value = self.sections.pop(section, None)
+            self._emit("section_removed", section)
+            names = (value or {}).keys() if section == "combos" else _section_items(value)
+            for name in names:
+                self._unlist(name)
+
+    def add_subsection(self, section, subsection):
+        """Add an empty sub-section. A flat section first becomes {"default": its items}."""
+        with self.batch():
+            value = self.sections.get(section)
+            if not isinstance(value, dict):
+                value = self.sections[section] = {"default": value or []}
+                value[subsection] = []
+                self._emit("section_changed", section)
+            else:
+                value[subsection] = []
+                self._emit("subsection_added", section, subsection)
+
+    def remove_subsection(self, section, subsection):
+        if section == "combos":
+            # The sections tab lists combos as the sub-sections of "combos"
+            return self.remove_combo(subsection)
+        with self.batch():
+            items = self.sections[section].pop(subsection, None) or []
+            self._emit("subsection_removed", section, subsection)
+            for item in items:
+                self._unlist(item)
+
+    def add_item(self, section, subsection, item):
+        """Append `item` to a flat section (subsection None) or to a sub-section, creating it if needed."""
+        with self.batch():
+            value = self.sections[section]
+            if subsection is None:
+                value.append(item)
+            else:
+                if subsection not in value:
+                    value[subsection] = []
+                    self._emit("subsection_added", section, subsection)
+                value[subsection].append(item)
+            self._emit("item_added", section, subsection, item)
+            self._list(item)
+
+    def remove_item(self, section, subsection, item):
+        with self.batch():
+            value = self.sections[section]
+            items = value if subsection is None else value.get(subsection, [])
+            if item not in items:
+                return
+            items.remove(item)
+            self._emit("item_removed", section, subsection, item)
+            self._unlist(item)
+
+    def set_limit(self, item, limit):
+        with self.batch():
+            if limit:
+                self.menu.setdefault("item_limits", {})[item] = limit
+            else:
+                self.menu.get("item_limits", {}).pop(item, None)
+            self._emit("limit_changed", name=item)
+
+    def set_price(self, name, price):
+        """Set the price of an item or combo; None clears it."""
+        with self.batch():
+            prices = self.menu.setdefault("prices", {})
+            combo_prices = prices.setdefault("combos", {})
+            if price is None:
+                combo_prices.pop(name, None)
+                prices.pop(name, None)
+            elif name in self.combos:
+                combo_prices[name] = price
+            else:
+                prices[name] = price
+            self._emit("price_changed", name=name)
+
+    # ---- combos ----
+
+    def add_combo(self, name, data):
+        with self.batch():
+            if "combos" not in self.sections:
+                self.sections["combos"] = {}
+                self._emit("section_added", "combos")
+            self.sections["combos"][name] = data
+            self._emit("combo_added", name=name)
+            self._list(name)
+            self.set_price(name, data.get("price", 0))
+
+    def update_combo(self, name, **fields):
+        with self.batch():
+            self.combos[name].update(fields)
+            self._emit("combo_changed", name=name)
+            if "price" in fields:
+                self.set_price(name, fields["price"])
+
+    def remove_combo(self, name):
+        with self.batch():
+            if self.combos.pop(name, None) is None:
+                return
+            self._emit("combo_removed", name=name)
+            self._unlist(name)
+
+    # ---- discounts ----
+
+    def add_discount(self, name, percent, bypass_items=()):
+        with self.batch():
+            self.menu.setdefault("discounts", {})[name] = {"percent": percent, "bypass_items": list(bypass_items)}
+            self._emit("discount_added", name=name)
+
+    def update_discount(self, old_name, name, percent, bypass_items):
+        with self.batch():
+            discounts = self.menu.setdefault("discounts", {})
+            if name != old_name:
+                discounts.pop(old_name, None)
+                self._emit("discount_removed", name=old_name)
+                self.add_discount(name, percent, bypass_items)
+            else:
+                discounts[name] = {"percent": percent, "bypass_items": list(bypass_items)}
+                self._emit("discount_changed", name=name)
+
+    def remove_discount(self, name):
+        with self.batch():
+            self.menu.get("discounts", {}).pop(name, None)
+            self._emit("discount_removed", name=name)
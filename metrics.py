@@ -0,0 +1,263 @@
+# metrics.py
+"""
+Local metrics export for watching register health without a debugger.
+
+All metrics are created once at import and only bump preallocated integers
+and floats when recorded, under one short lock, so any thread (the Tk thread,
+pool workers) may record at next to no cost. A background thread writes a
+snapshot every `interval` seconds, either as a Prometheus text file (for
+node-exporter's textfile collector, replaced atomically each time) or as one
+JSON object appended per line (rotated to <file>.1 past JSONL_MAX_BYTES).
+
+Configure with data/metrics.json, e.g.
+    {"enabled": true, "path": "data/metrics/immensecalc.prom", "format": "prometheus", "interval": 15}
+or point IMMENSECALC_METRICS_FILE at the file to write (a .jsonl name selects JSONL).
+"""
+import os
+import json
+import time
+import bisect
+import threading
+from array import array
+
+from menu_manager import DATA_DIR
+
+METRICS_CONFIG_PATH = os.path.join(DATA_DIR, "metrics.json")
+METRICS_ENV_VAR = "IMMENSECALC_METRICS_FILE"
+DEFAULT_METRICS_PATH = os.path.join(DATA_DIR, "metrics", "immensecalc.prom")
+DEFAULT_INTERVAL = 15  # seconds
+JSONL_MAX_BYTES = 10 * 1024 * 1024
+
+# Latency buckets in seconds, from one frame to a visible freeze
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_registry = []
+# Counters and histograms are read-modify-write; workers and the Tk thread both record
+_record_lock = threading.Lock()
+
+
+def _label_text(labels):
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in labels.items()) + "}"
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=None):
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.value = 0
+        _registry.append(self)
+
+    def inc(self, amount=1):
+        with _record_lock:
+            self.value += amount
+
+    def samples(self):
+        return [(self.name, self.labels, self.value)]
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def set(self, value):
+        self.value = value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=LATENCY_BUCKETS, labels=None):
+        self.name = name
+        self.help = help_text
+        self.labels = labels or {}
+        self.bounds = tuple(buckets)
+        self.counts = array("q", [0] * (len(self.bounds) + 1))  # last slot is +Inf
+        self.total = 0.0
+        self.count = 0
+        _registry.append(self)
+
+    def observe(self, value):
+        slot = bisect.bisect_left(self.bounds, value)
+        with _record_lock:
+            self.counts[slot] += 1
+            self.total += value
+            self.count += 1
+
+    def samples(self):
+        with _record_lock:
+            counts, total, count = list(self.counts), self.total, self.count
+        out = []
+        cumulative = 0
+        for bound, n in zip(self.bounds + (float("inf"),), counts):
+            cumulative += n
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            out.append((self.name + "_bucket", dict(self.labels, le=le), cumulative))
+        out.append((self.name + "_sum", self.labels, round(total, 6)))
+        out.append((self.name + "_count", self.labels, count))
+        return out
+
+
+class RecentEvents:
+    """Timestamps of the last `size` events in a preallocated ring, for per-hour rates."""
+
+    def __init__(self, size=4096):
+        self.times = array("d", [0.0] * size)
+        self.next = 0
+
+    def mark(self):
+        with _record_lock:
+            self.times[self.next % len(self.times)] = time.time()
+            self.next += 1
+
+    def count_since(self, since):
+        return sum(1 for t in self.times if t >= since)
+
+
+SUMMARY_REFRESH = Histogram("immensecalc_summary_refresh_seconds", "Time to recompute and redraw the order summary.")
+MENU_LOAD = Histogram("immensecalc_menu_load_seconds", "Time to read and parse a menu file.")
+MENU_SAVE = Histogram("immensecalc_menu_save_seconds", "Time to write a menu file.")
+IMAGE_CACHE_HITS = Counter("immensecalc_image_cache_requests_total", "Menu image loads by cache result.", {"result": "hit"})
+IMAGE_CACHE_MISSES = Counter("immensecalc_image_cache_requests_total", "Menu image loads by cache result.", {"result": "miss"})
+ORDERS_CONFIRMED = Counter("immensecalc_orders_confirmed_total", "Orders confirmed since start.")
+ORDERS_LAST_HOUR = Gauge("immensecalc_orders_last_hour", "Orders confirmed in the last 60 minutes.")
+TK_STALLS = Counter("immensecalc_tk_stalls_total", "Tk event loop stalls reported by the watchdog.")
+WIDGETS = Gauge("immensecalc_tk_widgets", "Live Tk widgets across all windows.")
+RESIDENT_MEMORY = Gauge("immensecalc_resident_memory_bytes", "Resident memory of the process.")
+WORKER_TASKS = Gauge("immensecalc_worker_tasks", "Background tasks queued or running on the worker pool.")
+DISPATCH_QUEUE = Gauge("immensecalc_dispatch_queue_depth", "Results waiting to be applied on the Tk thread.")
+PREWARMED_BYTES = Gauge("immensecalc_prewarm_bytes", "Estimated memory held by prewarmed menus.")
+UPTIME = Gauge("immensecalc_uptime_seconds", "Seconds since the app started.")
+
+_recent_orders = RecentEvents()
+_started = time.time()
+
+
+def order_confirmed():
+    ORDERS_CONFIRMED.inc()
+    _recent_orders.mark()
+
+
+def _resident_memory():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def render_prometheus():
+    lines = []
+    seen = set()
+    for metric in _registry:
+        if metric.name not in seen:
+            seen.add(metric.name)
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+        for name, labels, value in metric.samples():
+            lines.append(f"{name}{_label_text(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def render_json():
+    values = {}
+    for metric in _registry:
+        for name, labels, value in metric.samples():
+            values[name + _label_text(labels)] = value
+    return json.dumps({"ts": round(time.time(), 3), "metrics": values})
+
+
+class MetricsWriter:
+    def __init__(self, path, fmt="prometheus", interval=DEFAULT_INTERVAL):
+        self.path = path
+        self.format = fmt
+        self.interval = max(1, interval)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="metrics-writer", daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.write()
+            except Exception as e:
+                print(f"[Metrics] Failed to write {self.path}: {e}")
+
+    def write(self):
+        now = time.time()
+        ORDERS_LAST_HOUR.set(_recent_orders.count_since(now - 3600))
+        UPTIME.set(round(now - _started))
+        rss = _resident_memory()
+        if rss is not None:
+            RESIDENT_MEMORY.set(rss)
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.format == "jsonl":
+            if os.path.exists(self.path) and os.path.getsize(self.path) > JSONL_MAX_BYTES:
+                os.replace(self.path, self.path + ".1")
+            with open(self.path, "a", encoding="utf-8") as fp:
+                fp.write(render_json() + "\n")
+        else:
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                fp.write(render_prometheus())
+            os.replace(tmp_path, self.path)
+
+
+def load_settings():
+    settings = {"enabled": True, "path": DEFAULT_METRICS_PATH, "format": None, "interval": DEFAULT_INTERVAL}
+    try:
+        with open(METRICS_CONFIG_PATH, "r", encoding="utf-8") as fp:
+            settings.update(json.load(fp))
+    except (OSError, ValueError, TypeError):
+        pass
+    env_path = os.environ.get(METRICS_ENV_VAR, "").strip()
+    if env_path:
+        settings["enabled"] = True
+        settings["path"] = env_path
+    if not settings.get("format"):
+        settings["format"] = "jsonl" if str(settings["path"]).endswith(".jsonl") else "prometheus"
+    return settings
+
+
+def _count_widgets(widget):
+    return 1 + sum(_count_widgets(child) for child in widget.winfo_children())
+
+
+def install(root):
+    """Start the metrics writer and sample the widget count on the Tk thread. Returns the writer or None."""
+    settings = load_settings()
+    if not settings.get("enabled"):
+        return None
+    try:
+        interval = float(settings.get("interval") or DEFAULT_INTERVAL)
+    except (TypeError, ValueError):
+        interval = DEFAULT_INTERVAL
+    writer = MetricsWriter(settings["path"], settings["format"], interval)
+
+    # Widget trees can only be walked from the Tk thread; do it once per write interval
+    def sample_widgets():
+        try:
+            WIDGETS.set(_count_widgets(root))
+        except Exception:
+            return
+        root.after(int(writer.interval * 1000), sample_widgets)
+
+    root.after_idle(sample_widgets)
+    writer.start()
+    return writer
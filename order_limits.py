@@ -0,0 +1,109 @@
+# order_limits.py
+
+
+class LimitChecker:
+    """
+    Order limits compiled from a menu, kept up to date one quantity change at a time.
+
+    `item_limits` apply to loose items and to each meal of a mix-and-match combo;
+    every combo's `limits` caps the per-meal total of each of its categories,
+    whatever the categories are called. Each setter is O(1) and records or clears
+    a single violation, so the full set of current violations is always at hand
+    without walking the order.
+    """
+
+    def __init__(self, menu):
+        self.item_limits = {}
+        for item, limit in menu.get("item_limits", {}).items():
+            try:
+                limit = int(limit)
+            except (TypeError, ValueError):
+                continue
+            if limit > 0:
+                self.item_limits[item.lower()] = limit
+
+        self.category_limits = {}
+        for combo_name, combo in menu.get("sections", {}).get("combos", {}).items():
+            if not isinstance(combo, dict):
+                continue
+            limits = {}
+            for cat, limit in (combo.get("limits") or {}).items():
+                try:
+                    limit = int(limit)
+                except (TypeError, ValueError):
+                    continue
+                if limit > 0:
+                    limits[cat.lower()] = limit
+            if limits:
+                self.category_limits[combo_name] = limits
+
+        # key -> message; keys are ("item", item) / ("meal_item", combo, meal, item) / ("meal_cat", combo, meal, cat)
+        self._violations = {}
+
+    def _record(self, key, violated, message):
+        if violated:
+            self._violations[key] = message
+        else:
+            self._violations.pop(key, None)
+        return not violated
+
+    def item_limit(self, item):
+        return self.item_limits.get(item.lower(), 0)
+
+    def set_item_qty(self, item, qty):
+        """Track the ordered quantity of a loose item. Returns True if it is within its limit."""
+        item_lower = item.lower()
+        limit = self.item_limits.get(item_lower)
+        if limit is None:
+            return True
+        return self._record(("item", item_lower), qty > limit, f"Limit exceeded for {item}: max {limit}")
+
+    def set_meal_item_qty(self, combo_name, meal, item, qty):
+        """Track one item of one combo meal against its item limit."""
+        item_lower = item.lower()
+        limit = self.item_limits.get(item_lower)
+        if limit is None:
+            return True
+        return self._record(
+            ("meal_item", combo_name, meal, item_lower),
+            qty > limit,
+            f"Limit exceeded for combo item '{item}' in '{combo_name}' meal #{meal + 1}: max {limit}",
+        )
+
+    def set_meal_category_total(self, combo_name, meal, category, total):
+        """Track the per-meal total of one combo category against the combo's limit for it."""
+        limit = self.category_limits.get(combo_name, {}).get(category.lower())
+        if limit is None:
+            return True
+        return self._record(
+            ("meal_cat", combo_name, meal, category.lower()),
+            total > limit,
+            f"Combo '{combo_name}' meal #{meal + 1} exceeds {category} max limit ({limit}).",
+        )
+
+    def truncate_meals(self, combo_name, meals):
+        """Forget violations of meals at index `meals` and above (they were removed)."""
+        for key in list(self._violations):
+            if key[0] != "item" and key[1] == combo_name and key[2] >= meals:
+                del self._violations[key]
+
+    def clear(self):
+        self._violations.clear()
+
+    def swap_violations(self, violations):
+        """Install another order's violations and return the current ones (parked orders)."""
+        current, self._violations = self._violations, violations
+        return current
+
+    def is_item_violated(self, item):
+        return ("item", item.lower()) in self._violations
+
+    def is_meal_item_violated(self, combo_name, meal, item):
+        return ("meal_item", combo_name, meal, item.lower()) in self._violations
+
+    def violations(self):
+        """Messages for every limit currently exceeded, in a stable order."""
+        return [self._violations[key] for key in sorted(self._violations, key=repr)]
+
+    def has_violations(self):
+        return bool(self._violations)
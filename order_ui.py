@@ -1,50 +1,94 @@
 # order_ui.py
 
 import os
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
-import io
-import requests
-from widgets import SteppedSpinbox
-from menu_manager import load_menu
+from widgets import QuantityControl, TraceGroup, SlicedBuild, bind_mousewheel
+from combo_model import MealSelection
+from order_limits import LimitChecker
+from parked_orders import ParkedOrder
 from style_helper import apply_default_style
 import colors
+import metrics
+import dispatcher
+import image_cache
+import render_plan
+import prewarm
+import quick_entry
 
 
 class OrderUIWindow:
-    def __init__(self, root, establishment):
+    def __init__(self, root, establishment, register_number=1):
         self.root = root
         self.establishment = establishment
-        self.menu = load_menu(establishment)
+        self.register_number = register_number
+        # Sorted sections, priced rows and lookups, prepared when the menu was saved
+        # and usually already in memory from the landing page's background prewarm.
+        # Shared read-only by every register open on this menu; order state below is per window.
+        self.menu, self.plan = prewarm.take(establishment)
+        self._combo_names = {name.lower() for name, _label, _mix in self.plan["combos"]}
+        self._mix_combos = {name for name, _label, mix in self.plan["combos"] if mix}
 
         self.lower_to_original_item = {}
         self.lower_to_original_section = {}
         self.lower_to_original_subsection = {}
 
         self.current_item_spinboxes = {}
+        # item_lower -> (row widgets, normal background) for inline limit flags
+        self.current_item_rows = {}
         self.global_order_qty = {}
+        self.limit_checker = LimitChecker(self.menu)
 
         self.combo_qty_vars = {}
-        self.combo_selected_items_per_meal = {}
+        # Mix-and-match combo name -> MealSelection (meals x allowed items matrix)
+        self.combo_meals = {}
 
         self.discount_vars = {}
+        # Orders set aside for customers who stepped away, oldest first
+        self.parked = []
 
         self._updating_summary = False
+        self._rebinding = False
 
         self.custom_discount_var = tk.BooleanVar()
         self.custom_discount_percent_var = tk.StringVar(value="0")
+        # Traces hold this window alive through their callbacks; drop them with the window
+        self.traces = TraceGroup()
+        self.traces.remove_on_destroy(self.root)
+        self._image_task = None
+        self._row_build = None
+        self.root.bind("<Destroy>", self._on_destroy, add="+")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
 
         apply_default_style(self.root)
         self.root.configure(bg=colors.BG_COLOR)
+        # The empty layout shows right away; its contents fill in over the next few frames
         self._build_ui()
+        self._startup_build = SlicedBuild(self.root, self._startup_steps())
+
+    def _startup_steps(self):
         self._load_discounts()
+        yield
         self._populate_section_tree()
+        yield
         self._load_order_image()
+        yield
         self.update_order_summary()
+        yield
+        # Shared with other registers on this menu, so usually already built
+        quick_entry.index_for(self.menu, self.plan)
+        yield
+
+    def finish_building(self):
+        """Complete any construction still queued in slices, e.g. before a script inspects the rows."""
+        self._startup_build.finish()
+        if self._row_build:
+            self._row_build.finish()
 
     def _build_ui(self):
-        self.root.title(f"Order Tab - {self.establishment}")
+        suffix = f" (Register {self.register_number})" if self.register_number > 1 else ""
+        self.root.title(f"Order Tab - {self.establishment}{suffix}")
         self.root.geometry("1100x780")
         self.root.minsize(1100, 780)
 
@@ -90,8 +134,8 @@ class OrderUIWindow:
         def on_custom_discount_change(*args):
             self.update_order_summary()
 
-        self.custom_discount_var.trace_add("write", on_custom_discount_toggle)
-        self.custom_discount_percent_var.trace_add("write", on_custom_discount_change)
+        self.traces.add(self.custom_discount_var, on_custom_discount_toggle)
+        self.traces.add(self.custom_discount_percent_var, on_custom_discount_change)
 
         self.paned = ttk.Panedwindow(self.root, orient=tk.HORIZONTAL)
         self.paned.pack(fill=tk.BOTH, expand=True, padx=10, pady=0)
@@ -111,6 +155,24 @@ class OrderUIWindow:
         self.middle_panel = ttk.Frame(self.paned, style="TLabelframe")
         self.paned.add(self.middle_panel, weight=5)
 
+        quick_frame = ttk.Frame(self.middle_panel, style="TLabelframe")
+        quick_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+        ttk.Label(quick_frame, text="Quick entry:", font=colors.FONT_ITEM, background=colors.BG_COLOR).pack(side=tk.LEFT)
+        self.quick_var = tk.StringVar()
+        self.quick_entry = ttk.Entry(quick_frame, textvariable=self.quick_var, font=colors.FONT_SPINBOX)
+        self.quick_entry.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(6, 0))
+        self.quick_entry.bind("<Return>", self.apply_quick_entry)
+        self.quick_entry.bind("<KP_Enter>", self.apply_quick_entry)
+        self.quick_status = ttk.Label(
+            self.middle_panel,
+            text="e.g. 3 burger, 2 cola, meal deal x4, -vip",
+            font=colors.FONT_ITEM,
+            foreground=colors.FG_COLOR,
+            background=colors.BG_COLOR,
+            anchor="w",
+        )
+        self.quick_status.pack(fill=tk.X, padx=10)
+
         self.section_label_var = tk.StringVar(value="")
         self.section_label = ttk.Label(
             self.middle_panel,
@@ -129,7 +191,7 @@ class OrderUIWindow:
 
         self.search_entry.bind("<FocusIn>", self._search_focus_in)
         self.search_entry.bind("<FocusOut>", self._search_focus_out)
-        self.search_var.trace_add("write", self.on_search_change)
+        self.traces.add(self.search_var, self.on_search_change)
 
         self.item_canvas = tk.Canvas(self.middle_panel, background=colors.PANEL_BG, highlightthickness=0)
         self.item_scrollbar = ttk.Scrollbar(self.middle_panel, orient=tk.VERTICAL, command=self.item_canvas.yview, style="Vertical.TScrollbar")
@@ -142,7 +204,7 @@ class OrderUIWindow:
         self.item_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0), pady=(0, 10))
         self.item_scrollbar.pack(side=tk.RIGHT, fill=tk.Y, padx=(0, 10), pady=(0, 10))
 
-        self._bind_mousewheel(self.item_canvas)
+        bind_mousewheel(self.middle_panel, self.item_canvas)
 
         self.current_item_spinboxes.clear()
 
@@ -186,6 +248,18 @@ class OrderUIWindow:
         )
         self.total_label.pack(fill=tk.X, padx=10)
 
+        self.limit_status_label = ttk.Label(
+            self.right_panel,
+            text="",
+            font=colors.FONT_ITEM,
+            foreground=colors.LIMIT_WARNING_FG,
+            background=colors.BG_COLOR,
+            anchor="w",
+            justify=tk.LEFT,
+            wraplength=280,
+        )
+        self.limit_status_label.pack(fill=tk.X, padx=10)
+
         self.menu_image_frame = ttk.LabelFrame(self.right_panel, text="Menu Image", style="TLabelframe")
         self.menu_image_frame.pack(fill=tk.BOTH, expand=False, padx=10, pady=10)
         self.menu_image_frame.config(height=180)
@@ -196,6 +270,16 @@ class OrderUIWindow:
         self.menu_image_label.bind("<Button-1>", self._on_menu_image_click)
         self.menu_image_tk = None
 
+        park_frame = ttk.Frame(self.right_panel, style="TLabelframe")
+        park_frame.pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        self.park_button = ttk.Button(park_frame, text="Park Order", style="Accent.TButton", command=self.park_order)
+        self.park_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
+        self.parked_menu = tk.Menu(park_frame, tearoff=False)
+        self.parked_button = ttk.Menubutton(park_frame, text="Parked (0)", menu=self.parked_menu, state="disabled")
+        self.parked_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+
         self.btn_frame = ttk.Frame(self.right_panel, style="TLabelframe")
         self.btn_frame.pack(fill=tk.X, padx=10, pady=10)
 
@@ -210,19 +294,6 @@ class OrderUIWindow:
         treeview.configure(yscrollcommand=vsb.set)
         vsb.pack(side=tk.RIGHT, fill=tk.Y)
 
-    def _bind_mousewheel(self, widget):
-        widget.bind_all("<MouseWheel>", lambda e: self._on_mousewheel(e, widget))
-        widget.bind_all("<Button-4>", lambda e: self._on_mousewheel(e, widget))
-        widget.bind_all("<Button-5>", lambda e: self._on_mousewheel(e, widget))
-
-    def _on_mousewheel(self, event, widget):
-        if event.num == 4:
-            widget.yview_scroll(-1, "units")
-        elif event.num == 5:
-            widget.yview_scroll(1, "units")
-        else:
-            widget.yview_scroll(int(-1 * (event.delta / 120)), "units")
-
     def _search_focus_in(self, event):
         if self.search_entry.get() == "Search...":
             self.search_entry.delete(0, tk.END)
@@ -242,36 +313,27 @@ class OrderUIWindow:
             section, subsection = sel_id, None
         self._populate_items(section, subsection)
 
-    def _filter_items(self, items):
+    def _filter_rows(self, rows):
         filter_str = self.search_var.get().lower().strip()
         if filter_str == "" or filter_str == "search...":
-            return items
-        return [i for i in items if filter_str in i.lower()]
+            return rows
+        return [row for row in rows if filter_str in row[3]]
 
     def _populate_section_tree(self):
         self.section_tree.delete(*self.section_tree.get_children())
-        sections = self.menu.get("sections", {})
 
         self.lower_to_original_section.clear()
         self.lower_to_original_subsection.clear()
 
-        for section_key in sorted(sections.keys()):
+        for section in self.plan["tree"]:
+            section_key = section["id"]
             section_key_lower = section_key.lower()
             self.lower_to_original_section[section_key_lower] = section_key
-            if section_key_lower == "combos":
-                self.section_tree.insert("", "end", iid=section_key, text=section_key.capitalize(), open=True)
-            else:
-                parent_id = self.section_tree.insert(
-                    "", "end", iid=section_key, text=section_key.capitalize(), open=True
-                )
-                val = sections.get(section_key)
-                if isinstance(val, dict):
-                    for subsec_key in sorted(val.keys()):
-                        subsec_key_lower = subsec_key.lower()
-                        self.lower_to_original_subsection[(section_key_lower, subsec_key_lower)] = subsec_key
-                        self.section_tree.insert(
-                            parent_id, "end", iid=f"{section_key}::{subsec_key}", text=subsec_key.capitalize()
-                        )
+            parent_id = self.section_tree.insert("", "end", iid=section_key, text=section["text"], open=True)
+            for subsection in section["children"]:
+                subsec_key = subsection["id"].split("::", 1)[1]
+                self.lower_to_original_subsection[(section_key_lower, subsec_key.lower())] = subsec_key
+                self.section_tree.insert(parent_id, "end", iid=subsection["id"], text=subsection["text"])
 
         children = self.section_tree.get_children()
         if children:
@@ -303,36 +365,24 @@ class OrderUIWindow:
 
     def _populate_items(self, section, subsection):
         self._save_current_items_to_global_order()
+        if self._row_build:
+            self._row_build.cancel()
 
         for w in self.item_container.winfo_children():
             w.destroy()
         self.current_item_spinboxes.clear()
+        self.current_item_rows.clear()
         self.lower_to_original_item.clear()
 
-        self.section_label_var.set(f"{section.capitalize()}" + (f" - {subsection.capitalize()}" if subsection else ""))
-
-        sections = self.menu.get("sections", {})
-        section_data = sections.get(section)
-
-        items = []
-        if section_data is None:
-            items = []
-        elif isinstance(section_data, dict):
-            if subsection:
-                items = section_data.get(subsection, [])
-            else:
-                items = []
-                for sublst in section_data.values():
-                    items.extend(sublst)
-        elif isinstance(section_data, list):
-            items = section_data
+        node = self.plan["nodes"].get(f"{section}::{subsection}" if subsection else section)
+        if node is None:
+            self.section_label_var.set(f"{section.capitalize()}" + (f" - {subsection.capitalize()}" if subsection else ""))
+            rows = []
         else:
-            items = []
-
-        items = sorted(set(items))
-        items = self._filter_items(items)
+            self.section_label_var.set(node["label"])
+            rows = self._filter_rows(node["items"])
 
-        if not items and section.lower() != "combos":
+        if not rows and section.lower() != "combos":
             lbl = ttk.Label(
                 self.item_container,
                 text="No items to display.",
@@ -343,18 +393,11 @@ class OrderUIWindow:
             lbl.pack(pady=20)
             return
 
-        prices_data = self.menu.get("prices", {})
-        combos_prices = prices_data.get("combos", {})
+        # Rows are created a slice at a time so a large section never freezes the window
+        self._row_build = SlicedBuild(self.item_container, self._item_rows(rows))
 
-        default_prices_raw = {
-            "food": prices_data.get("food", 10),
-            "drinks": prices_data.get("drinks", 7),
-            "desserts": prices_data.get("desserts", 5),
-            "animal_treat": prices_data.get("animal_treat", 3),
-        }
-        default_prices = {k.lower(): v for k, v in default_prices_raw.items()}
-
-        for idx, item_name in enumerate(items):
+    def _item_rows(self, rows):
+        for idx, (item_name, _price, price_text, _search) in enumerate(rows):
             item_name_lower = item_name.lower()
             self.lower_to_original_item[item_name_lower] = item_name
 
@@ -365,41 +408,9 @@ class OrderUIWindow:
             lbl_name = tk.Label(frame, text=item_name, font=colors.FONT_ITEM, fg=colors.FG_COLOR, bg=bg_color)
             lbl_name.pack(side=tk.LEFT, padx=3)
 
-            price = None
-            if item_name in prices_data:
-                price = prices_data[item_name]
-            else:
-                for k in prices_data.keys():
-                    if k.lower() == item_name_lower:
-                        price = prices_data[k]
-                        break
-                if price is None:
-                    if section.lower() == "combos" and item_name in combos_prices:
-                        price = combos_prices[item_name]
-                    else:
-                        found_cat = None
-                        for cat in default_prices.keys():
-                            sec_items = sections.get(cat)
-                            if sec_items:
-                                if isinstance(sec_items, dict):
-                                    for sublst in sec_items.values():
-                                        for it in sublst:
-                                            if it.lower() == item_name_lower:
-                                                found_cat = cat
-                                                break
-                                elif isinstance(sec_items, list):
-                                    for it in sec_items:
-                                        if it.lower() == item_name_lower:
-                                            found_cat = cat
-                                            break
-                            if found_cat:
-                                break
-                        price = default_prices.get(found_cat, 0)
-            price = float(price if price is not None else 0)
-
             lbl_price = tk.Label(
                 frame,
-                text=f"${price:.2f}",
+                text=price_text,
                 font=colors.FONT_PRICE,
                 fg="#c1a1ff",
                 bg=bg_color,
@@ -408,22 +419,23 @@ class OrderUIWindow:
             )
             lbl_price.pack(side=tk.LEFT, padx=(10, 5))
 
-            spin = SteppedSpinbox(frame, min_val=0, max_val=999, bg=colors.SPINBOX_BG)
-            spin.entry.configure(font=colors.FONT_SPINBOX, fg="white", bg=colors.SPINBOX_BG, insertbackground="white")
+            spin = QuantityControl(frame, min_val=0, max_val=999, bg=colors.SPINBOX_BG, font=colors.FONT_SPINBOX)
             spin.pack(side=tk.RIGHT, padx=5)
 
             prev_qty = self.global_order_qty.get(item_name_lower, 0)
             spin.set(prev_qty)
 
-            def on_spin_change(*args, item_lower=item_name_lower, spin_ref=spin):
-                try:
-                    val = spin_ref.get()
-                except Exception:
-                    val = 0
+            self.current_item_rows[item_name_lower] = ((frame, lbl_name, lbl_price), bg_color)
+            self._flag_item_row(item_name_lower)
+
+            def on_spin_change(item_lower=item_name_lower, spin_ref=spin):
+                val = spin_ref.get()
                 if val == 0:
                     self.global_order_qty.pop(item_lower, None)
                 else:
                     self.global_order_qty[item_lower] = val
+                self.limit_checker.set_item_qty(self.lower_to_original_item.get(item_lower, item_lower), val)
+                self._flag_item_row(item_lower)
                 if not self._updating_summary:
                     self._updating_summary = True
                     try:
@@ -431,9 +443,34 @@ class OrderUIWindow:
                     finally:
                         self._updating_summary = False
 
-            spin.var.trace_add("write", on_spin_change)
+            spin.command = on_spin_change
 
             self.current_item_spinboxes[item_name_lower] = spin
+            yield
+
+    def _flag_item_row(self, item_lower):
+        """Highlight an item row while its quantity is over the item limit."""
+        row = self.current_item_rows.get(item_lower)
+        if not row:
+            return
+        widgets, normal_bg = row
+        bg = colors.LIMIT_WARNING_BG if self.limit_checker.is_item_violated(item_lower) else normal_bg
+        if widgets[0].cget("bg") != bg:
+            for w in widgets:
+                w.configure(bg=bg)
+
+    def _show_limit_status(self):
+        violations = self.limit_checker.violations()
+        if not violations:
+            text = ""
+        elif len(violations) <= 3:
+            text = "\n".join(f"⚠ {v}" for v in violations)
+        else:
+            text = "\n".join(f"⚠ {v}" for v in violations[:2]) + f"\n⚠ ...and {len(violations) - 2} more limit issue(s)"
+        try:
+            self.limit_status_label.config(text=text)
+        except tk.TclError:
+            pass
 
     def _save_current_items_to_global_order(self):
         for item_lower, spinbox in list(self.current_item_spinboxes.items()):
@@ -448,29 +485,29 @@ class OrderUIWindow:
 
     def _populate_combos_ui(self):
         self._save_current_items_to_global_order()
+        if self._row_build:
+            self._row_build.cancel()
 
         for w in self.item_container.winfo_children():
             w.destroy()
         self.current_item_spinboxes.clear()
         self.combo_qty_vars.clear()
-        self.combo_selected_items_per_meal.clear()
 
-        combos = self.menu.get("sections", {}).get("combos", {})
+        combos = self.plan["combos"]
         if not combos:
             lbl = ttk.Label(self.item_container, text="No combos available.", foreground=colors.FG_COLOR, background=colors.PANEL_BG)
             lbl.pack(pady=20)
             return
 
-        for combo_name, combo_data in sorted(combos.items()):
+        for combo_name, label, mix_and_match in combos:
             frame = ttk.Frame(self.item_container, relief=tk.RIDGE, borderwidth=1)
             frame.pack(fill=tk.X, padx=5, pady=4)
 
-            price = float(combo_data.get("price", 0))
-            lbl = ttk.Label(frame, text=f"{combo_name}  (${price:.2f})", font=colors.FONT_ITEM, foreground=colors.ACCENT_COLOR)
+            lbl = ttk.Label(frame, text=label, font=colors.FONT_ITEM, foreground=colors.ACCENT_COLOR)
             lbl.pack(side=tk.LEFT, padx=10, pady=6)
 
             lower_combo_name = combo_name.lower()
-            if combo_data.get("mix_and_match", False):
+            if mix_and_match:
                 btn_select = ttk.Button(frame, text="Select Items", style="Accent.TButton", command=lambda cn=combo_name: self.open_combo_selector(cn))
                 btn_select.pack(side=tk.RIGHT, padx=10, pady=6)
 
@@ -478,20 +515,16 @@ class OrderUIWindow:
                 btn_clear.pack(side=tk.RIGHT, padx=5, pady=6)
 
                 self.combo_qty_vars[combo_name] = None
-                self.combo_selected_items_per_meal.setdefault(combo_name, [])
+                self._get_meal_selection(combo_name)
             else:
-                spin = SteppedSpinbox(frame, min_val=0, max_val=999, bg=colors.SPINBOX_BG)
-                spin.entry.configure(font=colors.FONT_SPINBOX, fg="white", bg=colors.SPINBOX_BG, insertbackground="white")
+                spin = QuantityControl(frame, min_val=0, max_val=999, bg=colors.SPINBOX_BG, font=colors.FONT_SPINBOX)
                 spin.pack(side=tk.RIGHT, padx=10, pady=6)
 
                 prev_qty = self.global_order_qty.get(lower_combo_name, 0)
                 spin.set(prev_qty)
 
-                def on_spin_change(*args, combo=combo_name, spin_ref=spin):
-                    try:
-                        val = spin_ref.get()
-                    except Exception:
-                        val = 0
+                def on_spin_change(combo=combo_name, spin_ref=spin):
+                    val = spin_ref.get()
                     if val == 0:
                         self.global_order_qty.pop(combo.lower(), None)
                     else:
@@ -503,9 +536,17 @@ class OrderUIWindow:
                         finally:
                             self._updating_summary = False
 
-                spin.var.trace_add("write", on_spin_change)
+                spin.command = on_spin_change
                 self.combo_qty_vars[combo_name] = spin
 
+    def _get_meal_selection(self, combo_name):
+        model = self.combo_meals.get(combo_name)
+        if model is None:
+            combo_data = self.menu.get("sections", {}).get("combos", {}).get(combo_name, {})
+            model = MealSelection.for_combo(combo_data)
+            self.combo_meals[combo_name] = model
+        return model
+
     def open_combo_selector(self, combo_name):
         combo_data = self.menu["sections"]["combos"].get(combo_name)
         if not combo_data or not combo_data.get("mix_and_match", False):
@@ -521,7 +562,8 @@ class OrderUIWindow:
         limits = combo_data.get("limits", {})
         allowed_items = combo_data.get("combo_items", {})
 
-        selected_meals = self.combo_selected_items_per_meal.setdefault(combo_name, [])
+        selected_meals = self._get_meal_selection(combo_name)
+        checker = self.limit_checker
         cur_qty = max(len(selected_meals), 1)
 
         self._combo_selector_last_qty = cur_qty
@@ -548,90 +590,134 @@ class OrderUIWindow:
         scroll_frame.bind("<Configure>", lambda e: canvas.configure(scrollregion=canvas.bbox("all")))
 
         canvas.create_window((0, 0), window=scroll_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
 
         canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        bind_mousewheel(container, canvas)
 
         categories = list(allowed_items.keys())
+        max_cols = 2
+        scroll_frame.columnconfigure(0, weight=1)
+        scroll_frame.columnconfigure(1, weight=1)
+
+        # One entry per meal: {"frame": LabelFrame, "placeholder": widget or None once built}
+        meal_frames = []
+        build_pending = [False]
+
+        # Unbuilt meals reserve roughly the height they will take, so the scrollbar stays honest
+        tallest_cat = max((len(allowed_items.get(cat, [])) for cat in categories), default=0)
+        placeholder_height = 50 + 30 * tallest_cat
+
+        def add_meal_frame(i):
+            meal_frame = ttk.LabelFrame(scroll_frame, text=f"Meal #{i + 1}", padding=5)
+            meal_frame.grid(row=i // max_cols, column=i % max_cols, sticky="nwes", padx=5, pady=5)
+            placeholder = ttk.Frame(meal_frame, height=placeholder_height)
+            placeholder.pack(fill=tk.X)
+            meal_frames.append({"frame": meal_frame, "placeholder": placeholder})
+
+        def build_meal_contents(i):
+            entry = meal_frames[i]
+            entry["placeholder"].destroy()
+            entry["placeholder"] = None
+            meal_frame = entry["frame"]
+
+            for cat in categories:
+                cat_items = allowed_items.get(cat, [])
+                if not cat_items:
+                    continue
+                cat_frame = ttk.LabelFrame(meal_frame, text=f"{cat.capitalize()} (Limit: {limits.get(cat, 0)})")
+                cat_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT, padx=5, pady=5)
+
+                for item in cat_items:
+                    item_frame = ttk.Frame(cat_frame)
+                    item_frame.pack(fill=tk.X, pady=1)
+
+                    lbl = ttk.Label(item_frame, text=item)
+                    lbl.pack(side=tk.LEFT, anchor=tk.W)
+
+                    col = selected_meals.column(cat, item)
+                    spin = QuantityControl(item_frame, min_val=0, max_val=limits.get(cat, 0), bg=colors.SPINBOX_BG)
+                    spin.set(selected_meals.get(i, col))
+                    spin.pack(side=tk.RIGHT)
+                    if checker.is_meal_item_violated(combo_name, i, item):
+                        lbl.configure(foreground=colors.LIMIT_WARNING_FG)
+
+                    def on_spin_change(meal_idx=i, category=cat, item_name=item, col=col, spin_obj=spin, lbl_item=lbl):
+                        val = spin_obj.get()
+                        if meal_idx >= len(selected_meals) or val == selected_meals.get(meal_idx, col):
+                            return
+                        total_q = selected_meals.set(meal_idx, col, val)
+
+                        max_limit = selected_meals.category_limit(category)
+                        if max_limit > 0 and total_q > max_limit:
+                            excess = total_q - max_limit
+                            new_val = val - excess
+                            if new_val < 0:
+                                new_val = 0
+                            total_q = selected_meals.set(meal_idx, col, new_val)
+                            val = new_val
+                            spin_obj.set(new_val)
+                            messagebox.showwarning(
+                                "Limit Exceeded",
+                                f"Total {category} quantity exceeded max limit ({max_limit}) for Meal #{meal_idx + 1}.",
+                            )
+                        checker.set_meal_category_total(combo_name, meal_idx, category, total_q)
+                        ok = checker.set_meal_item_qty(combo_name, meal_idx, item_name, val)
+                        lbl_item.configure(foreground=colors.FG_COLOR if ok else colors.LIMIT_WARNING_FG)
+                        if not self._updating_summary:
+                            self._updating_summary = True
+                            try:
+                                self.update_order_summary()
+                            finally:
+                                self._updating_summary = False
+
+                    spin.command = on_spin_change
+
+        def build_visible_meals():
+            """Fill in the meals that are inside (or one screen away from) the visible part of the canvas."""
+            build_pending[0] = False
+            if not top.winfo_exists():
+                return
+            scroll_frame.update_idletasks()
+            view_h = max(canvas.winfo_height(), 1)
+            view_top = canvas.canvasy(0) - view_h
+            view_bottom = canvas.canvasy(0) + 2 * view_h
+            for i, entry in enumerate(meal_frames):
+                if entry["placeholder"] is None:
+                    continue
+                frame = entry["frame"]
+                y = frame.winfo_y()
+                if y + frame.winfo_height() >= view_top and y <= view_bottom:
+                    build_meal_contents(i)
+
+        def schedule_build(*_):
+            if not build_pending[0]:
+                build_pending[0] = True
+                top.after_idle(build_visible_meals)
+
+        def on_canvas_scroll(*args):
+            scrollbar.set(*args)
+            schedule_build()
 
-        def rebuild_meal_selectors():
-            for child in scroll_frame.winfo_children():
-                child.destroy()
+        canvas.configure(yscrollcommand=on_canvas_scroll)
+        canvas.bind("<Configure>", schedule_build)
 
+        def sync_meal_selectors():
+            """Add or remove only the meals whose count changed; existing meals keep their widgets."""
             q = quantity_var.get()
             if q < 0:
                 quantity_var.set(0)
                 return
 
-            while len(selected_meals) < q:
-                selected_meals.append({cat: {} for cat in categories})
-            while len(selected_meals) > q:
-                selected_meals.pop()
-
-            max_cols = 2
-            for i in range(q):
-                meal_frame = ttk.LabelFrame(scroll_frame, text=f"Meal #{i + 1}", padding=5)
-                row = i // max_cols
-                col = i % max_cols
-                meal_frame.grid(row=row, column=col, sticky="nwes", padx=5, pady=5)
-                scroll_frame.columnconfigure(col, weight=1)
-
-                for cat in categories:
-                    cat_items = allowed_items.get(cat, [])
-                    if not cat_items:
-                        continue
-                    cat_frame = ttk.LabelFrame(meal_frame, text=f"{cat.capitalize()} (Limit: {limits.get(cat, 0)})")
-                    cat_frame.pack(fill=tk.BOTH, expand=True, side=tk.LEFT, padx=5, pady=5)
-
-                    for item in cat_items:
-                        item_frame = ttk.Frame(cat_frame)
-                        item_frame.pack(fill=tk.X, pady=1)
-
-                        lbl = ttk.Label(item_frame, text=item)
-                        lbl.pack(side=tk.LEFT, anchor=tk.W)
-
-                        prev_qty = selected_meals[i].get(cat, {}).get(item, 0)
-                        spin = SteppedSpinbox(item_frame, min_val=0, max_val=limits.get(cat, 0))
-                        spin.set(prev_qty)
-                        spin.pack(side=tk.RIGHT)
-
-                        def on_spin_change(meal_idx=i, category=cat, item_name=item, spin_obj=spin):
-                            val = spin_obj.get()
-                            sel = selected_meals[meal_idx][category]
-                            if val == 0:
-                                sel.pop(item_name, None)
-                            else:
-                                sel[item_name] = val
-
-                            total_q = sum(sel.values())
-                            max_limit = limits.get(category, 0)
-                            if max_limit > 0 and total_q > max_limit:
-                                excess = total_q - max_limit
-                                new_val = val - excess
-                                if new_val < 0:
-                                    new_val = 0
-                                spin_obj.set(new_val)
-                                if new_val == 0:
-                                    sel.pop(item_name, None)
-                                messagebox.showwarning(
-                                    "Limit Exceeded",
-                                    f"Total {category} quantity exceeded max limit ({max_limit}) for Meal #{meal_idx + 1}.",
-                                )
-                            if not self._updating_summary:
-                                self._updating_summary = True
-                                try:
-                                    self.update_order_summary()
-                                finally:
-                                    self._updating_summary = False
-
-                        spin.entry.unbind("<FocusOut>")
-                        spin.entry.unbind("<Return>")
-                        spin.entry.unbind("<KP_Enter>")
-                        spin.entry.bind("<FocusOut>", lambda e, cb=on_spin_change: cb())
-                        spin.entry.bind("<Return>", lambda e, cb=on_spin_change: cb())
-                        spin.entry.bind("<KP_Enter>", lambda e, cb=on_spin_change: cb())
-                        spin.var.trace_add("write", lambda *a, cb=on_spin_change: cb())
+            selected_meals.resize(q)
+            checker.truncate_meals(combo_name, q)
+
+            while len(meal_frames) > q:
+                meal_frames.pop()["frame"].destroy()
+            while len(meal_frames) < q:
+                add_meal_frame(len(meal_frames))
+
+            schedule_build()
 
             if not self._updating_summary:
                 self._updating_summary = True
@@ -652,11 +738,13 @@ class OrderUIWindow:
                 return
             self._combo_selector_last_qty = q
 
-            rebuild_meal_selectors()
+            sync_meal_selectors()
 
-        quantity_var.trace_add("write", lambda *a: on_qty_change())
+        traces = TraceGroup()
+        traces.add(quantity_var, lambda *a: on_qty_change())
+        traces.remove_on_destroy(top)
 
-        rebuild_meal_selectors()
+        sync_meal_selectors()
 
         def save_and_close():
             if combo_name in self.combo_qty_vars and self.combo_qty_vars[combo_name]:
@@ -674,8 +762,9 @@ class OrderUIWindow:
         btn_save.pack(pady=10)
 
     def clear_combo_meals(self, combo_name):
-        if combo_name in self.combo_selected_items_per_meal:
-            self.combo_selected_items_per_meal[combo_name].clear()
+        if combo_name in self.combo_meals:
+            self.combo_meals[combo_name].clear()
+        self.limit_checker.truncate_meals(combo_name, 0)
         if combo_name in self.combo_qty_vars and self.combo_qty_vars[combo_name]:
             self.combo_qty_vars[combo_name].set(0)
         if combo_name.lower() in self.global_order_qty:
@@ -692,8 +781,7 @@ class OrderUIWindow:
             w.destroy()
         self.discount_vars.clear()
 
-        discounts = self.menu.get("discounts", {})
-        for dname in sorted(discounts.keys()):
+        for dname in self.plan["discounts"]:
             var = tk.BooleanVar()
             chk = ttk.Checkbutton(
                 self.top_discount_frame,
@@ -710,193 +798,116 @@ class OrderUIWindow:
         self.menu_image_tk = None
         self.menu_image_label.config(image="", text="No menu image selected")
         self.menu_image_label.unbind("<Button-1>")
+        if self._image_task:
+            self._image_task.cancel()
+            self._image_task = None
+
+        if menu_img_path and (menu_img_path.startswith(("http://", "https://")) or os.path.isfile(menu_img_path)):
+            # Fetched and decoded on the worker pool; only the PhotoImage is made here
+            self.menu_image_label.config(text="Loading menu image...")
+            self._image_task = dispatcher.submit(
+                image_cache.load_thumbnail, menu_img_path, (280, 180),
+                on_done=self._show_order_image,
+                on_error=lambda e: self.menu_image_label.config(text="Failed to load image", image=""),
+            )
 
-        if menu_img_path:
-            try:
-                if menu_img_path.startswith("http://") or menu_img_path.startswith("https://"):
-                    response = requests.get(menu_img_path)
-                    response.raise_for_status()
-                    pil_img = Image.open(io.BytesIO(response.content))
-                elif os.path.isfile(menu_img_path):
-                    pil_img = Image.open(menu_img_path)
-                else:
-                    pil_img = None
+    def _on_destroy(self, event):
+        # Drop results of background work meant for this window once it is gone
+        if event.widget is self.root and self._image_task:
+            self._image_task.cancel()
 
-                if pil_img:
-                    pil_img.thumbnail((280, 180), Image.LANCZOS)
-                    self.menu_image_tk = ImageTk.PhotoImage(pil_img)
-                    self.menu_image_label.config(image=self.menu_image_tk, text="")
-                    self.menu_image_label.bind("<Button-1>", self._on_menu_image_click)
-            except Exception:
-                self.menu_image_label.config(text="Failed to load image", image="")
+    def _show_order_image(self, pil_img):
+        from PIL import ImageTk
+
+        self._image_task = None
+        if not self.menu_image_label.winfo_exists():
+            return
+        self.menu_image_tk = ImageTk.PhotoImage(pil_img)
+        self.menu_image_label.config(image=self.menu_image_tk, text="")
+        self.menu_image_label.bind("<Button-1>", self._on_menu_image_click)
 
     def _on_menu_image_click(self, event=None):
         img_path = self.menu.get("menu_image_path", None)
         if not img_path:
             messagebox.showwarning("No image", "No menu image to display.")
             return
+        dispatcher.submit(
+            image_cache.load_fitted, img_path, (800, 600),
+            on_done=self._show_full_image,
+            on_error=lambda e: messagebox.showerror("Error", f"Failed to load full image: {e}"),
+        )
+
+    def _show_full_image(self, pil_img):
+        from PIL import ImageTk
+
         top = tk.Toplevel(self.root)
         top.title("Menu Image Preview")
-        try:
-            if img_path.startswith("http://") or img_path.startswith("https://"):
-                resp = requests.get(img_path)
-                resp.raise_for_status()
-                pil_img = Image.open(io.BytesIO(resp.content))
-            else:
-                pil_img = Image.open(img_path)
-            w, h = pil_img.size
-            max_w, max_h = 800, 600
-            scale = min(max_w / w, max_h / h, 1)
-            pil_img = pil_img.resize((int(w * scale), int(h * scale)), Image.LANCZOS)
-            img_tk = ImageTk.PhotoImage(pil_img)
-            lbl = ttk.Label(top, image=img_tk)
-            lbl.image = img_tk
-            lbl.pack()
-            top.geometry(f"{lbl.image.width()}x{lbl.image.height()}")
-            top.transient(self.root)
-            top.grab_set()
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to load full image: {e}")
-            top.destroy()
+        img_tk = ImageTk.PhotoImage(pil_img)
+        lbl = ttk.Label(top, image=img_tk)
+        lbl.image = img_tk
+        lbl.pack()
+        top.geometry(f"{lbl.image.width()}x{lbl.image.height()}")
+        top.transient(self.root)
+        top.grab_set()
 
     def get_current_order(self):
         order = {"combos": {}, "_discounts_applied": []}
-        sections = self.menu.get("sections", {})
-
-        item_to_cat = {}
-        name_case_map = {}
-
-        combos = sections.get("combos", {})
+        combos = self.menu.get("sections", {}).get("combos", {})
+        items = self.plan["items"]
 
-        for cat, val in sections.items():
-            cat_lower = cat.lower()
-            if cat_lower == "combos":
-                continue
-            if isinstance(val, dict):
-                for sublist in val.values():
-                    for item in sublist:
-                        litem = item.lower()
-                        if item not in combos:
-                            item_to_cat[litem] = cat_lower
-                            name_case_map[litem] = item
-            elif isinstance(val, list):
-                for item in val:
-                    if item not in combos:
-                        litem = item.lower()
-                        item_to_cat[litem] = cat_lower
-                        name_case_map[litem] = item
-
-        for cat_lower in set(item_to_cat.values()):
-            order[cat_lower] = {}
+        for _name, cat_lower in items.values():
+            order.setdefault(cat_lower, {})
 
         for item_lower, qty in self.global_order_qty.items():
             if qty <= 0:
                 continue
-            if item_lower in (name.lower() for name in combos.keys()):
+            if item_lower in self._combo_names:
                 continue
-            cat_lower = item_to_cat.get(item_lower, "food")
+            canonical_name, cat_lower = items.get(item_lower, (item_lower, "food"))
             order.setdefault(cat_lower, {})
-            canonical_name = name_case_map.get(item_lower, item_lower)
             order[cat_lower][canonical_name] = qty
 
         for combo_name, combo_data in combos.items():
             if combo_data.get("mix_and_match", False):
-                meals = self.combo_selected_items_per_meal.get(combo_name, [])
-                qty = len(meals)
+                meals = self.combo_meals.get(combo_name)
+                qty = len(meals) if meals else 0
                 if qty > 0:
                     order["combos"][combo_name] = {"qty": qty}
             else:
-                spin = self.combo_qty_vars.get(combo_name)
-                if spin:
-                    qty = spin.get()
-                    if qty > 0:
-                        order["combos"][combo_name] = {"qty": qty}
+                qty = self.global_order_qty.get(combo_name.lower(), 0)
+                if qty > 0:
+                    order["combos"][combo_name] = {"qty": qty}
 
         applied = [name for name, var in self.discount_vars.items() if var.get()]
         order["_discounts_applied"] = applied
         return order
 
-    def check_limits(self, order):
-        limits = self.menu.get("item_limits", {})
-
-        def exceeds_limit(item, qty):
-            lim = limits.get(item, 0)
-            return lim > 0 and qty > lim
-
-        for cat, items in order.items():
-            if cat in ("_discounts_applied", "combos"):
-                continue
-            for item, qty in items.items():
-                if exceeds_limit(item, qty):
-                    messagebox.showwarning("Limit Exceeded", f"Limit exceeded for {item}: max {limits[item]}")
-                    return False
-
-        for combo_name, combo_data in order.get("combos", {}).items():
-            combo_info = self.menu.get("sections", {}).get("combos", {}).get(combo_name, {})
-            if not combo_info.get("mix_and_match", False):
-                continue
-            meals = self.combo_selected_items_per_meal.get(combo_name, [])
-            limits_per_cat = {k.lower(): v for k, v in combo_info.get("limits", {}).items()}
-            for i, meal in enumerate(meals):
-                for cat in ("food", "drinks", "desserts"):
-                    cat_lower = cat.lower()
-                    total_qty_cat = sum(meal.get(cat, {}).values())
-                    max_lim = limits_per_cat.get(cat_lower, 0)
-                    if max_lim > 0 and total_qty_cat > max_lim:
-                        messagebox.showwarning(
-                            "Limit Exceeded",
-                            f"Combo '{combo_name}' meal #{i + 1} exceeds {cat} max limit ({max_lim})."
-                        )
-                        return False
-                for cat, items_dict in meal.items():
-                    for item, qty in items_dict.items():
-                        if exceeds_limit(item, qty):
-                            messagebox.showwarning(
-                                "Limit Exceeded",
-                                f"Limit exceeded for combo item '{item}': max {limits[item]}",
-                            )
-                            return False
-        return True
+    def check_limits(self, order=None):
+        """
+        Report every exceeded limit at once. The LimitChecker is kept current on
+        each quantity change, so this needs no pass over the order.
+        """
+        violations = self.limit_checker.violations()
+        if not violations:
+            return True
+        shown = violations[:15]
+        more = len(violations) - len(shown)
+        msg = "\n".join(f"- {v}" for v in shown) + (f"\n...and {more} more." if more > 0 else "")
+        messagebox.showwarning("Limit Exceeded", f"Please fix these limits before confirming:\n\n{msg}")
+        return False
 
     def calculate_order_cost(self, order):
-        prices = self.menu.get("prices", {})
+        plan = self.plan
         total = 0.0
 
-        default_cat_prices_raw = {
-            "food": prices.get("food", 10),
-            "drinks": prices.get("drinks", 7),
-            "desserts": prices.get("desserts", 5),
-            "animal_treat": prices.get("animal_treat", 3),
-        }
-        default_cat_prices = {k.lower(): v for k, v in default_cat_prices_raw.items()}
-
         for cat, items in order.items():
             if cat in ("_discounts_applied", "combos"):
                 continue
-            cat_lower = cat.lower()
-            dp = default_cat_prices.get(cat_lower, 0)
             for item_name, qty in items.items():
-                item_price = prices.get(item_name)
-                if item_price is None:
-                    for k in prices.keys():
-                        if k.lower() == item_name.lower():
-                            item_price = prices[k]
-                            break
-                if item_price is None:
-                    item_price = dp
-                total += item_price * qty
-
-        combos_prices = prices.get("combos", {})
+                total += render_plan.item_price(plan, item_name, cat) * qty
+
         for combo_name, combo_info in order.get("combos", {}).items():
-            qty = combo_info.get("qty", 0)
-            cprice = combos_prices.get(combo_name)
-            if cprice is None:
-                for k in combos_prices.keys():
-                    if k.lower() == combo_name.lower():
-                        cprice = combos_prices[k]
-                        break
-            cprice = cprice if cprice is not None else 0
-            total += cprice * qty
+            total += render_plan.combo_price(plan, combo_name) * combo_info.get("qty", 0)
 
         discounts = self.menu.get("discounts", {})
         applied = order.get("_discounts_applied", [])
@@ -913,32 +924,14 @@ class OrderUIWindow:
             for cat, items in order.items():
                 if cat in ("_discounts_applied", "combos"):
                     continue
-                cat_lower = cat.lower()
-                dp_cat = default_cat_prices.get(cat_lower, 0)
                 for it, qty in items.items():
-                    iprice = prices.get(it)
-                    if iprice is None:
-                        for k in prices.keys():
-                            if k.lower() == it.lower():
-                                iprice = prices[k]
-                                break
-                    if iprice is None:
-                        iprice = dp_cat
-                    cost = iprice * qty
+                    cost = render_plan.item_price(plan, it, cat) * qty
                     total_disc_items_cost += cost
                     if it in bypass_items:
                         bypass_cost += cost
 
             for combo_name, combo_info in order.get("combos", {}).items():
-                q = combo_info.get("qty", 0)
-                combo_cost = combos_prices.get(combo_name)
-                if combo_cost is None:
-                    for k in combos_prices.keys():
-                        if k.lower() == combo_name.lower():
-                            combo_cost = combos_prices[k]
-                            break
-                combo_cost = combo_cost if combo_cost is not None else 0
-                total_disc_items_cost += combo_cost * q
+                total_disc_items_cost += render_plan.combo_price(plan, combo_name) * combo_info.get("qty", 0)
 
             total = total - (total_disc_items_cost - bypass_cost) * percent
 
@@ -955,6 +948,13 @@ class OrderUIWindow:
         return total
 
     def update_order_summary(self):
+        if self._rebinding:
+            return
+        start = time.perf_counter()
+        self._refresh_order_summary()
+        metrics.SUMMARY_REFRESH.observe(time.perf_counter() - start)
+
+    def _refresh_order_summary(self):
         try:
             order = self.get_current_order()
         except Exception:
@@ -979,16 +979,14 @@ class OrderUIWindow:
                 combo_lines.append(f"  - {combo_name}: x{qty}")
                 combo_meta = self.menu.get("sections", {}).get("combos", {}).get(combo_name, {})
                 if combo_meta.get("mix_and_match", False):
-                    selected_meals = self.combo_selected_items_per_meal.get(combo_name, [])
-                    for i, meal in enumerate(selected_meals):
+                    selected_meals = self.combo_meals.get(combo_name)
+                    for i in range(len(selected_meals) if selected_meals else 0):
                         combo_lines.append(f"\n     Meal #{i+1}:")
                         for cat_view in ("drinks", "food", "desserts"):
-                            items_in_cat = meal.get(cat_view, {})
-                            if items_in_cat:
-                                for item_ordered, qnt in items_in_cat.items():
-                                    combo_lines.append(
-                                        f"              {cat_view.capitalize()}: - {item_ordered} x {qnt}"
-                                    )
+                            for item_ordered, qnt in selected_meals.meal_items(i, cat_view):
+                                combo_lines.append(
+                                    f"              {cat_view.capitalize()}: - {item_ordered} x {qnt}"
+                                )
                     combo_lines.append("")
                 else:
                     combo_items = combo_meta.get("combo_items", {"food": {}, "drinks": {}, "desserts": {}})
@@ -1035,13 +1033,17 @@ class OrderUIWindow:
             self.total_label.config(text=f"Total: ${total:,.2f}")
         except tk.TclError:
             pass
+        self._show_limit_status()
 
     def clear_all(self):
         self.global_order_qty.clear()
+        self.limit_checker.clear()
         for spin in self.current_item_spinboxes.values():
             spin.set(0)
-        for combo_name in self.combo_selected_items_per_meal:
-            self.combo_selected_items_per_meal[combo_name].clear()
+        for item_lower in self.current_item_rows:
+            self._flag_item_row(item_lower)
+        for meals in self.combo_meals.values():
+            meals.clear()
         for var in self.discount_vars.values():
             var.set(False)
         for spin in self.combo_qty_vars.values():
@@ -1076,5 +1078,120 @@ class OrderUIWindow:
         msg = f"Confirm this purchase?\n\nOrder details:\n" + "\n".join(summary_lines) + f"\n\nTotal: ${total:,.2f}"
 
         if messagebox.askokcancel("Confirm Purchase", msg):
+            metrics.order_confirmed()
             messagebox.showinfo("Purchase Confirmed", "Order confirmed! Ready for next customer.")
-            self.clear_all()
\ No newline at end of file
+            self.clear_all()
+
+    # ============ Quick entry ============
+
+    def apply_quick_entry(self, event=None):
+        """Add everything typed in the quick-entry box to the order in one update."""
+        text = self.quick_var.get().strip()
+        if not text:
+            return "break"
+        entries, errors = quick_entry.parse(text, quick_entry.index_for(self.menu, self.plan))
+        if errors:
+            # Nothing is applied until every token resolves
+            self.quick_status.config(text="; ".join(errors[:3]), foreground=colors.LIMIT_WARNING_FG)
+            return "break"
+
+        self._save_current_items_to_global_order()
+        for kind, name, qty in entries:
+            if kind == quick_entry.DISCOUNT:
+                var = self.discount_vars.get(name)
+                if var is not None:
+                    var.set(True)
+            elif name in self._mix_combos:
+                meals = self._get_meal_selection(name)
+                meals.resize(min(999, len(meals) + qty))
+            else:
+                key = name.lower()
+                total = min(999, self.global_order_qty.get(key, 0) + qty)
+                self.global_order_qty[key] = total
+                if kind == quick_entry.ITEM:
+                    self.limit_checker.set_item_qty(name, total)
+                    spin = self.current_item_spinboxes.get(key)
+                    if spin is not None:
+                        spin.set(total)
+                        self._flag_item_row(key)
+                else:
+                    spin = self.combo_qty_vars.get(name)
+                    if spin and spin.winfo_exists():
+                        spin.set(total)
+
+        self.quick_var.set("")
+        self.quick_status.config(text=f"Added {len(entries)} line(s)", foreground=colors.FG_COLOR)
+        self.update_order_summary()
+        return "break"
+
+    # ============ Parked orders ============
+
+    def _order_is_empty(self):
+        return (not self.global_order_qty and not any(len(m) for m in self.combo_meals.values())
+                and not any(var.get() for var in self.discount_vars.values()) and not self.custom_discount_var.get())
+
+    def _swap_order(self, incoming):
+        """Make `incoming` the visible order and return the current one as a ParkedOrder."""
+        order = self.get_current_order()
+        count = sum(q for cat, items in order.items() if cat not in ("_discounts_applied", "combos") for q in items.values())
+        count += sum(c.get("qty", 0) for c in order.get("combos", {}).values())
+        outgoing = ParkedOrder(
+            self.global_order_qty,
+            self.combo_meals,
+            self.limit_checker.swap_violations(incoming.violations),
+            discounts=[name for name, var in self.discount_vars.items() if var.get()],
+            custom_enabled=self.custom_discount_var.get(),
+            custom_percent=self.custom_discount_percent_var.get(),
+            summary=f"{count} item(s)  ${self.calculate_order_cost(order):,.2f}",
+        )
+        self.global_order_qty = incoming.quantities
+        self.combo_meals = incoming.meals
+
+        # Point the rows already on screen at the new state; nothing is rebuilt
+        self._rebinding = True
+        try:
+            for item_lower, spin in self.current_item_spinboxes.items():
+                if spin.winfo_exists():
+                    spin.set(self.global_order_qty.get(item_lower, 0))
+            for item_lower in self.current_item_rows:
+                self._flag_item_row(item_lower)
+            for combo_name, spin in self.combo_qty_vars.items():
+                if spin and spin.winfo_exists():
+                    spin.set(self.global_order_qty.get(combo_name.lower(), 0))
+            for name, var in self.discount_vars.items():
+                var.set(name in incoming.discounts)
+            self.custom_discount_var.set(incoming.custom_enabled)
+            self.custom_discount_percent_var.set(incoming.custom_percent)
+        finally:
+            self._rebinding = False
+        self.update_order_summary()
+        return outgoing
+
+    def park_order(self):
+        self._save_current_items_to_global_order()
+        if self._order_is_empty():
+            return
+        self.parked.append(self._swap_order(ParkedOrder()))
+        self._refresh_parked_menu()
+
+    def resume_order(self, index):
+        """Bring back a parked order; a non-empty current order is parked in its place."""
+        self._save_current_items_to_global_order()
+        incoming = self.parked.pop(index)
+        outgoing = self._swap_order(incoming)
+        if outgoing.quantities or any(len(m) for m in outgoing.meals.values()) or outgoing.discounts or outgoing.custom_enabled:
+            self.parked.append(outgoing)
+        self._refresh_parked_menu()
+
+    def _refresh_parked_menu(self):
+        self.parked_menu.delete(0, tk.END)
+        for i, parked in enumerate(self.parked):
+            self.parked_menu.add_command(label=f"#{i + 1}  {parked.label()}", command=lambda i=i: self.resume_order(i))
+        self.parked_button.configure(text=f"Parked ({len(self.parked)})", state="normal" if self.parked else "disabled")
+
+    def _on_close(self):
+        if self.parked and not messagebox.askyesno(
+            "Parked Orders", f"{len(self.parked)} parked order(s) will be lost. Close this register anyway?", parent=self.root
+        ):
+            return
+        self.root.destroy()
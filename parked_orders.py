@@ -0,0 +1,29 @@
+# parked_orders.py
+import time
+
+
+class ParkedOrder:
+    """
+    One customer's in-progress order, set aside while another is served.
+
+    Holds the order window's own state objects (quantities, meal matrices and
+    limit violations) rather than copies, so parking and resuming swap a few
+    references however large the order is.
+    """
+
+    __slots__ = ("quantities", "meals", "violations", "discounts", "custom_enabled", "custom_percent",
+                 "parked_at", "summary")
+
+    def __init__(self, quantities=None, meals=None, violations=None, discounts=(), custom_enabled=False,
+                 custom_percent="0", summary=""):
+        self.quantities = quantities if quantities is not None else {}  # item/combo lower -> qty
+        self.meals = meals if meals is not None else {}  # combo name -> MealSelection
+        self.violations = violations if violations is not None else {}  # LimitChecker state
+        self.discounts = frozenset(discounts)
+        self.custom_enabled = custom_enabled
+        self.custom_percent = custom_percent
+        self.parked_at = time.time()
+        self.summary = summary
+
+    def label(self):
+        return f"{time.strftime('%H:%M', time.localtime(self.parked_at))}  {self.summary}"
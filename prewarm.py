@@ -0,0 +1,196 @@
+# prewarm.py
+"""
+Loads menus in the background while the landing page waits for a choice.
+
+After the landing window has painted, every menu in data/menus is read, parsed
+and given its render plan (see render_plan.py) on the shared worker pool, most
+recently used first, so the establishment the user picks is usually ready when
+Order Tab is clicked. Work is only handed out while the user has been idle for
+a moment and the pool has nothing else to do, and stops once the warmed menus
+reach the memory cap. Menus loaded on demand beyond the cap push out the least
+recently used ones.
+
+    prewarm.start(root)
+    menu, plan = prewarm.take("Diner")   # warm copy, or loaded on the spot
+"""
+import os
+import json
+import time
+from collections import OrderedDict
+
+import dispatcher
+import metrics
+import render_plan
+from menu_manager import DATA_DIR, MENU_DIR, load_menu_files
+
+RECENT_PATH = os.path.join(DATA_DIR, "recent_menus.json")
+MAX_RECENT = 20
+MAX_IN_FLIGHT = 2  # menus loading at once, leaving the rest of the pool free
+QUIET_AFTER_INPUT_S = 0.5  # no new work until the user has paused this long
+POLL_MS = 100
+MEMORY_CAP_BYTES = 64 * 1024 * 1024
+# Parsed JSON plus its plan takes several times the file size in memory
+BYTES_PER_FILE_BYTE = 8
+
+_cache = OrderedDict()  # name -> (stat key, menu, plan, estimated bytes), least recently used first; Tk thread only
+_queue = []
+_in_flight = set()
+_root = None
+_last_input = 0.0
+_cache_bytes = 0
+_pumping = False
+
+
+def _stat_key(name):
+    try:
+        st = os.stat(os.path.join(MENU_DIR, f"{name}.json"))
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def recent_menus():
+    try:
+        with open(RECENT_PATH, "r", encoding="utf-8") as fp:
+            names = json.load(fp)
+    except (OSError, ValueError):
+        return []
+    return [n for n in names if isinstance(n, str)]
+
+
+def mark_used(name):
+    """Record `name` as the most recently used menu (it is warmed first next time)."""
+    names = [name] + [n for n in recent_menus() if n != name]
+    try:
+        os.makedirs(DATA_DIR, exist_ok=True)
+        with open(RECENT_PATH, "w", encoding="utf-8") as fp:
+            json.dump(names[:MAX_RECENT], fp)
+    except OSError as e:
+        print(f"[Prewarm] Could not record recent menus: {e}")
+
+
+def _warm_order():
+    names = load_menu_files()
+    recent = [n for n in recent_menus() if n in names]
+    rest = [n for n in names if n not in recent]
+    # Menus never opened here: most recently edited first
+    rest.sort(key=lambda n: (_stat_key(n) or (0, 0))[0], reverse=True)
+    return recent + rest
+
+
+def start(root):
+    """Begin warming menus once `root` is idle. Safe to call again to rescan."""
+    global _root
+    if _root is None:
+        _root = root
+        for sequence in ("<Any-KeyPress>", "<Any-ButtonPress>"):
+            root.bind_all(sequence, _on_input, add="+")
+    _queue[:] = [n for n in _warm_order() if n not in _in_flight]
+    _schedule()
+
+
+def _schedule():
+    global _pumping
+    if not _pumping and _root is not None:
+        _pumping = True
+        _root.after(POLL_MS, _pump)
+
+
+def prioritize(name):
+    """Warm `name` next, e.g. when it is selected but not opened yet."""
+    if name in _queue:
+        _queue.remove(name)
+    if name not in _in_flight and not _is_fresh(name):
+        _queue.insert(0, name)
+        _schedule()
+
+
+def _on_input(event):
+    global _last_input
+    _last_input = time.monotonic()
+
+
+def _is_fresh(name):
+    entry = _cache.get(name)
+    return entry is not None and entry[0] == _stat_key(name)
+
+
+def _pump():
+    global _pumping
+    _pumping = False
+    if not _queue and not _in_flight:
+        return
+    user_busy = time.monotonic() - _last_input < QUIET_AFTER_INPUT_S
+    pool_busy = dispatcher.pending() > len(_in_flight)
+    while _queue and not user_busy and not pool_busy and len(_in_flight) < MAX_IN_FLIGHT:
+        if _cache_bytes >= MEMORY_CAP_BYTES:
+            print(f"[Prewarm] Memory cap reached; {len(_queue)} menu(s) left cold")
+            _queue.clear()
+            break
+        name = _queue.pop(0)
+        if _is_fresh(name):
+            continue
+        _in_flight.add(name)
+        dispatcher.submit(_load, name, on_done=_store, on_error=lambda e, n=name: _failed(n, e))
+    try:
+        _schedule()
+    except Exception:
+        # root destroyed: the app is exiting
+        pass
+
+
+def _load(name):
+    key = _stat_key(name)
+    if key is None:
+        return name, None, None, None
+    menu, plan = render_plan.load(name)
+    if not isinstance(menu.get("sections"), dict) or not isinstance(menu.get("prices", {}), dict):
+        raise ValueError("menu has no sections or prices")
+    return name, key, menu, plan
+
+
+def _store(result):
+    global _cache_bytes
+    name, key, menu, plan = result
+    _in_flight.discard(name)
+    if key is None:
+        return
+    _evict(name)
+    size = key[1] * BYTES_PER_FILE_BYTE
+    _cache[name] = (key, menu, plan, size)
+    _cache_bytes += size
+    # Menus opened over a long shift must not grow the cache past the cap either
+    while _cache_bytes > MEMORY_CAP_BYTES and len(_cache) > 1:
+        _evict(next(iter(_cache)))
+    metrics.PREWARMED_BYTES.set(_cache_bytes)
+
+
+def _failed(name, exc):
+    _in_flight.discard(name)
+    print(f"[Prewarm] Skipped {name}: {exc}")
+
+
+def _evict(name):
+    global _cache_bytes
+    entry = _cache.pop(name, None)
+    if entry:
+        _cache_bytes -= entry[3]
+        metrics.PREWARMED_BYTES.set(_cache_bytes)
+
+
+def take(name):
+    """
+    The menu and render plan for `name`: the warm copy if the file has not
+    changed since it was loaded, otherwise read now. Menus from here are shared
+    and must not be modified.
+    """
+    entry = _cache.get(name)
+    if entry is not None and entry[0] == _stat_key(name):
+        _cache.move_to_end(name)
+        return entry[1], entry[2]
+    _evict(name)
+    key = _stat_key(name)
+    menu, plan = render_plan.load(name)
+    if key is not None:
+        _store((name, key, menu, plan))
+    return menu, plan
@@ -0,0 +1,175 @@
+# quick_entry.py
+"""
+Typed order entry for the Order Tab, e.g.
+
+    3 burger, 2 cola, meal deal x4, -vip
+
+Each comma-separated token is a quantity and a name (`3 burger`, `burger x3`,
+`3x burger`; no quantity means 1) or `-name` for a discount. Names resolve
+against items, combos and discounts by exact name, alias, numeric PLU code,
+then word prefixes (`chick burg`) and finally closest spelling. Aliases and PLU
+codes come from the optional menu keys
+
+    "aliases": {"cb": "Cheeseburger"},  "plu": {"1041": "Cola"}
+
+Indexes are built once per menu version and shared by every register.
+"""
+import re
+import difflib
+from collections import OrderedDict
+
+ITEM, COMBO, DISCOUNT = "item", "combo", "discount"
+MAX_PREFIX = 8
+_MAX_INDEXES = 8
+
+# "3 burger", "3x burger", "burger x3", "burger*3"; a trailing "x" needs a space
+# before it so names like "Box 2" are not read as "Bo" x2
+_TOKEN_RE = re.compile(r"(?:(\d+)\s*[x*]?\s+)?(.+?)(?:(?:\s+[x*]|\s*\*)\s*(\d+))?")
+_indexes = OrderedDict()  # menu digest -> QuickIndex
+
+
+def normalize(text):
+    return " ".join(re.sub(r"[^0-9a-z]+", " ", text.lower()).split())
+
+
+class QuickIndex:
+    def __init__(self, menu, plan):
+        self.names = {}  # kind -> {normalized name: name}
+        self.prefixes = {}  # kind -> {word prefix: set of normalized names}
+        for name, _cat in plan["items"].values():
+            self._add(ITEM, name)
+        for name, _label, _mix in plan["combos"]:
+            self._add(COMBO, name)
+        for name in plan["discounts"]:
+            self._add(DISCOUNT, name)
+
+        # Aliases and PLU codes point at a name of any kind
+        self.shortcuts = {}
+        for table in (menu.get("aliases") or {}, menu.get("plu") or {}):
+            for key, target in table.items():
+                hit = self.exact(str(target))
+                if hit:
+                    self.shortcuts[normalize(str(key))] = hit
+        self.close_pool = {kind: list(names) for kind, names in self.names.items()}
+
+    def _add(self, kind, name):
+        key = normalize(name)
+        if not key:
+            return
+        self.names.setdefault(kind, {}).setdefault(key, name)
+        prefixes = self.prefixes.setdefault(kind, {})
+        for word in key.split():
+            for n in range(1, min(len(word), MAX_PREFIX) + 1):
+                prefixes.setdefault(word[:n], set()).add(key)
+
+    def exact(self, text, kinds=(ITEM, COMBO, DISCOUNT)):
+        key = normalize(text)
+        for kind in kinds:
+            name = self.names.get(kind, {}).get(key)
+            if name is not None:
+                return kind, name
+        return None
+
+    def whole(self, text, kinds=(ITEM, COMBO)):
+        """(kind, name) when `text` is exactly a name, alias or PLU code, else None."""
+        hit = self.exact(text, kinds)
+        if hit:
+            return hit
+        hit = self.shortcuts.get(normalize(text))
+        if hit and hit[0] in kinds:
+            return hit
+        return None
+
+    def resolve(self, text, kinds=(ITEM, COMBO)):
+        """(kind, name) for `text`, None if nothing fits, or a list of names when ambiguous."""
+        key = normalize(text)
+        if not key:
+            return None
+        hit = self.whole(key, kinds)
+        if hit:
+            return hit
+
+        words = key.split()
+        scored = []
+        for kind in kinds:
+            prefixes = self.prefixes.get(kind, {})
+            candidates = None
+            for word in words:
+                found = prefixes.get(word[:MAX_PREFIX], set())
+                candidates = found if candidates is None else candidates & found
+                if not candidates:
+                    break
+            for cand in candidates or ():
+                cand_words = cand.split()
+                # Long query words were looked up by their first MAX_PREFIX letters
+                if not all(any(cw.startswith(w) for cw in cand_words) for w in words):
+                    continue
+                exact_words = sum(1 for w in words if w in cand_words)
+                scored.append((-exact_words, len(cand), cand, kind))
+        if scored:
+            scored.sort()
+            best = scored[0]
+            ties = [s for s in scored if s[:2] == best[:2]]
+            if len(ties) > 1:
+                return [self.names[s[3]][s[2]] for s in ties]
+            return best[3], self.names[best[3]][best[2]]
+
+        for kind in kinds:
+            close = difflib.get_close_matches(key, self.close_pool.get(kind, []), n=1, cutoff=0.75)
+            if close:
+                return kind, self.names[kind][close[0]]
+        return None
+
+
+def index_for(menu, plan):
+    digest = plan.get("menu_sha1") or id(plan)
+    index = _indexes.get(digest)
+    if index is None:
+        index = _indexes[digest] = QuickIndex(menu, plan)
+        while len(_indexes) > _MAX_INDEXES:
+            _indexes.popitem(last=False)
+    else:
+        _indexes.move_to_end(digest)
+    return index
+
+
+def parse(text, index):
+    """
+    Resolve a whole command line. Returns (entries, errors): entries are
+    (kind, name, qty) in input order; errors are messages for tokens that did
+    not resolve. Callers should apply nothing when there are errors.
+    """
+    entries = []
+    errors = []
+    for token in re.split(r"[,;\n]+", text):
+        token = token.strip()
+        if not token:
+            continue
+        if token.startswith("-"):
+            hit = index.resolve(token[1:], kinds=(DISCOUNT,))
+            qty = 1
+        else:
+            # Names such as "7 Up" or "Box 2" win over reading a quantity out of them
+            hit = index.whole(token)
+            qty = 1
+            if hit is None:
+                lead, name, trail = _TOKEN_RE.fullmatch(token).groups()
+                if lead and trail:
+                    # "7 Up x2" is two 7 Ups; "3 cola x2" gives the quantity twice
+                    hit = index.whole(f"{lead} {name}")
+                    qty = int(trail)
+                    if hit is None:
+                        errors.append(f"Conflicting quantities in '{token}'")
+                        continue
+                else:
+                    qty = int(lead or trail or 1)
+                    hit = index.resolve(name)
+        if hit is None:
+            errors.append(f"Nothing matches '{token}'")
+        elif isinstance(hit, list):
+            errors.append(f"'{token}' could be: {', '.join(hit[:5])}")
+        elif qty <= 0:
+            errors.append(f"Quantity must be positive in '{token}'")
+        else:
+            entries.append((hit[0], hit[1], qty))
+    return entries, errors
@@ -0,0 +1,213 @@
+# render_plan.py
+"""
+Everything the order window shows, precomputed from a menu.
+
+A plan holds the sorted section tree, each section's rows with their prices
+already resolved and formatted, the combo and discount lists, and O(1) price
+lookups for totals. It is rebuilt whenever a menu is saved and stored in
+data/plans/ next to the menu, keyed by a hash of the menu file, so opening an
+Order Tab only reads it and binds widgets to it.
+
+    menu, plan = render_plan.load("Diner")
+"""
+import os
+import json
+import hashlib
+import threading
+
+from menu_manager import DATA_DIR, load_menu_raw
+
+PLAN_VERSION = 2
+PLAN_DIR = os.path.join(DATA_DIR, "plans")
+
+# Prices for items without one of their own, overridable by the same keys in menu["prices"]
+DEFAULT_CATEGORY_PRICES = (("food", 10), ("drinks", 7), ("desserts", 5), ("animal_treat", 3))
+
+
+def menu_digest(raw):
+    return hashlib.sha1(raw).hexdigest()
+
+
+def plan_path(establishment_name):
+    return os.path.join(PLAN_DIR, f"{establishment_name}.json")
+
+
+def _as_price(value):
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _section_items(value):
+    if isinstance(value, dict):
+        return [item for sub in value.values() for item in sub]
+    if isinstance(value, list):
+        return list(value)
+    return []
+
+
+def _lower_lookup(prices, exact_names=()):
+    """Case-insensitive price map: first spelling wins, except names spelled exactly as given."""
+    lookup = {}
+    for key, value in prices.items():
+        price = _as_price(value)
+        if price is not None:
+            lookup.setdefault(key.lower(), price)
+    for name in exact_names:
+        price = _as_price(prices.get(name))
+        if price is not None:
+            lookup[name.lower()] = price
+    return lookup
+
+
+def _row(name, price):
+    # name, price, display text, search key
+    return [name, price, f"${price:.2f}", name.lower()]
+
+
+def _price_tables(menu):
+    """(explicit item prices, category prices, row_price) for the items on `menu`."""
+    sections = menu.get("sections", {})
+    prices = menu.get("prices", {})
+    all_items = [item for key, value in sections.items() if key.lower() != "combos" for item in _section_items(value)]
+    explicit = _lower_lookup(prices, all_items)
+    category_prices = {cat: _as_price(prices.get(cat, default)) or 0.0 for cat, default in DEFAULT_CATEGORY_PRICES}
+
+    # Rows show the default of the first default category that lists the item
+    display_category = {}
+    for cat, _ in DEFAULT_CATEGORY_PRICES:
+        for item in _section_items(sections.get(cat)):
+            display_category.setdefault(item.lower(), cat)
+
+    def row_price(item):
+        price = explicit.get(item.lower())
+        if price is None:
+            price = category_prices.get(display_category.get(item.lower()), 0.0)
+        return price
+
+    return explicit, category_prices, row_price
+
+
+def price_resolver(menu):
+    """
+    item -> the price the order screen shows for it: its own price (matched
+    case-insensitively), else the default of the first default category listing it.
+    """
+    return _price_tables(menu)[2]
+
+
+def build_plan(menu, digest=None):
+    sections = menu.get("sections", {})
+    prices = menu.get("prices", {})
+    combos = sections.get("combos", {}) or {}
+    explicit, category_prices, row_price = _price_tables(menu)
+
+    tree = []
+    nodes = {}
+    for key in sorted(sections.keys()):
+        value = sections[key]
+        entry = {"id": key, "text": key.capitalize(), "children": []}
+        tree.append(entry)
+        if key.lower() == "combos":
+            continue
+        nodes[key] = {
+            "label": key.capitalize(),
+            "items": [_row(item, row_price(item)) for item in sorted(set(_section_items(value)))],
+        }
+        if isinstance(value, dict):
+            for sub in sorted(value.keys()):
+                node_id = f"{key}::{sub}"
+                entry["children"].append({"id": node_id, "text": sub.capitalize()})
+                nodes[node_id] = {
+                    "label": f"{key.capitalize()} - {sub.capitalize()}",
+                    "items": [_row(item, row_price(item)) for item in sorted(set(value[sub]))],
+                }
+
+    # The order summary files an item under the last section listing it
+    items = {}
+    for key, value in sections.items():
+        if key.lower() == "combos":
+            continue
+        for item in _section_items(value):
+            if item not in combos:
+                items[item.lower()] = [item, key.lower()]
+
+    combo_rows = []
+    for name, data in sorted(combos.items()):
+        shown = _as_price(data.get("price", 0)) or 0.0
+        combo_rows.append([name, f"{name}  (${shown:.2f})", bool(data.get("mix_and_match", False))])
+
+    return {
+        "version": PLAN_VERSION,
+        "menu_sha1": digest,
+        "tree": tree,
+        "nodes": nodes,
+        "items": items,
+        "item_prices": explicit,
+        "category_prices": category_prices,
+        "combos": combo_rows,
+        "combo_prices": _lower_lookup(prices.get("combos", {}) or {}, combos.keys()),
+        "discounts": sorted(menu.get("discounts", {}).keys()),
+    }
+
+
+def item_price(plan, item_name, category):
+    """Price charged for one `item_name` ordered under `category`."""
+    price = plan["item_prices"].get(item_name.lower())
+    if price is None:
+        price = plan["category_prices"].get(category.lower(), 0.0)
+    return price
+
+
+def combo_price(plan, combo_name):
+    return plan["combo_prices"].get(combo_name.lower(), 0.0)
+
+
+def read_plan(establishment_name):
+    try:
+        with open(plan_path(establishment_name), "r", encoding="utf-8") as fp:
+            return json.load(fp)
+    except (OSError, ValueError):
+        return None
+
+
+def write_plan(establishment_name, plan):
+    os.makedirs(PLAN_DIR, exist_ok=True)
+    path = plan_path(establishment_name)
+    # Saves and background loads may both write a plan; never share a temp file
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fp:
+        json.dump(plan, fp, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def save_for_menu(establishment_name, menu, raw):
+    """Rebuild and store the plan for menu file contents `raw` that were just written."""
+    write_plan(establishment_name, build_plan(menu, menu_digest(raw)))
+
+
+def delete_plan(establishment_name):
+    try:
+        os.remove(plan_path(establishment_name))
+    except FileNotFoundError:
+        pass
+
+
+def load(establishment_name):
+    """
+    The menu and its plan. A missing or stale plan (menu edited outside the app,
+    older plan format) is rebuilt and stored again.
+    """
+    menu, raw = load_menu_raw(establishment_name)
+    digest = menu_digest(raw)
+    plan = read_plan(establishment_name)
+    if not plan or plan.get("version") != PLAN_VERSION or plan.get("menu_sha1") != digest:
+        plan = build_plan(menu, digest)
+        try:
+            write_plan(establishment_name, plan)
+        except OSError as e:
+            print(f"[Plan] Could not store plan for {establishment_name}: {e}")
+    return menu, plan
@@ -0,0 +1,81 @@
+# share_code.py
+"""
+Compact menu share codes for the landing page's Export / Import.
+
+    IMC1.<base64url of zlib-compressed minified JSON>.<crc32 of that JSON, hex>
+
+The JSON is {"establishment": name, "menu": menu}, the same object the older
+plain-JSON codes held, and decode() accepts both, so codes from earlier
+versions still import. Whitespace inside a code (line breaks added by chat
+apps or mail) is ignored.
+
+    code = share_code.encode("Diner", menu)
+    name, menu = share_code.decode(code)
+"""
+import json
+import zlib
+import base64
+
+PREFIX = "IMC"
+VERSION = 1
+# Refuse codes that would inflate past this (a real menu is far smaller)
+MAX_JSON_BYTES = 32 * 1024 * 1024
+
+
+def encode(establishment, menu):
+    raw = json.dumps({"establishment": establishment, "menu": menu}, separators=(",", ":"),
+                     ensure_ascii=False).encode("utf-8")
+    payload = base64.urlsafe_b64encode(zlib.compress(raw, 9)).decode("ascii").rstrip("=")
+    return f"{PREFIX}{VERSION}.{payload}.{zlib.crc32(raw):08x}"
+
+
+def is_share_code(text):
+    return text.lstrip().startswith(PREFIX)
+
+
+def _unpack(code):
+    code = "".join(code.split())
+    parts = code.split(".")
+    if len(parts) != 3 or not parts[0][len(PREFIX):].isdigit():
+        raise ValueError("This is not a complete menu code.")
+    version = int(parts[0][len(PREFIX):])
+    if version != VERSION:
+        raise ValueError(f"This menu code is format {version}; update the app to import it.")
+    payload, checksum = parts[1], parts[2]
+    try:
+        compressed = base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+        inflater = zlib.decompressobj()
+        raw = inflater.decompress(compressed, MAX_JSON_BYTES)
+    except (ValueError, zlib.error) as e:
+        raise ValueError("This menu code is damaged or incomplete.") from e
+    if inflater.unconsumed_tail:
+        raise ValueError("This menu code is too large to import.")
+    if not inflater.eof:
+        raise ValueError("This menu code is damaged or incomplete.")
+    if f"{zlib.crc32(raw):08x}" != checksum.lower():
+        raise ValueError("This menu code is damaged or incomplete (checksum mismatch).")
+    return raw
+
+
+def decode(text):
+    """(establishment, menu) from a share code or an old plain-JSON code. Raises ValueError."""
+    text = text.strip()
+    if is_share_code(text):
+        raw = _unpack(text)
+    elif text.startswith("{"):
+        raw = text
+    else:
+        raise ValueError("Paste a menu code starting with IMC (or an older JSON code).")
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON code: {e}") from e
+    if not isinstance(data, dict):
+        raise ValueError("Invalid menu code structure.")
+    name = data.get("establishment")
+    menu = data.get("menu")
+    if not isinstance(name, str) or not name.strip() or not isinstance(menu, dict) or not menu:
+        raise ValueError("Invalid menu code structure.")
+    if any(ch in name for ch in "/\\:"):
+        raise ValueError(f"Invalid establishment name in menu code: {name}")
+    return name.strip(), menu
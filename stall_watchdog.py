@@ -0,0 +1,117 @@
+# stall_watchdog.py
+import os
+import sys
+import time
+import threading
+import traceback
+from datetime import datetime
+from menu_manager import DATA_DIR
+import metrics
+
+LOG_DIR = os.path.join(DATA_DIR, "logs")
+STALL_LOG_PATH = os.path.join(LOG_DIR, "stalls.log")
+
+
+class StallWatchdog:
+    """
+    Detects freezes of the Tk event loop.
+
+    The Tk thread stamps a heartbeat every `interval_ms` through root.after().
+    A daemon thread checks how old the last stamp is; once it is older than
+    `threshold_ms` the main thread's stack is sampled with sys._current_frames
+    and a stall report is appended to the log when the loop recovers.
+    """
+
+    def __init__(self, root, interval_ms=100, threshold_ms=500, max_frames=15, log_path=STALL_LOG_PATH):
+        self.root = root
+        self.interval_ms = interval_ms
+        self.threshold = threshold_ms / 1000.0
+        self.max_frames = max_frames
+        self.log_path = log_path
+        self.main_thread_id = threading.main_thread().ident
+
+        self._last_beat = time.monotonic()
+        self._stop = threading.Event()
+        self._thread = None
+        self._after_id = None
+
+        # Samples collected for the stall currently in progress
+        self._stall_samples = []
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._last_beat = time.monotonic()
+        self._after_id = self.root.after(self.interval_ms, self._heartbeat)
+        self._thread = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _heartbeat(self):
+        self._last_beat = time.monotonic()
+        if not self._stop.is_set():
+            self._after_id = self.root.after(self.interval_ms, self._heartbeat)
+
+    def _watch(self):
+        poll = self.interval_ms / 1000.0
+        while not self._stop.wait(poll):
+            age = time.monotonic() - self._last_beat
+            if age - poll > self.threshold:
+                self._sample_stack(age)
+            elif self._stall_samples:
+                self._flush_stall()
+
+    def _sample_stack(self, age):
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return
+        stack = traceback.extract_stack(frame)[-self.max_frames:]
+        self._stall_samples.append((age, stack))
+
+    def _flush_stall(self):
+        samples = self._stall_samples
+        self._stall_samples = []
+        duration, _ = samples[-1]
+        metrics.TK_STALLS.inc()
+
+        # The most common innermost frame across samples is the likely culprit
+        counts = {}
+        for _, stack in samples:
+            if stack:
+                top = stack[-1]
+                key = (top.filename, top.lineno, top.name)
+                counts[key] = counts.get(key, 0) + 1
+
+        lines = [
+            f"[{datetime.now().isoformat(timespec='seconds')}] Tk event loop stalled for {duration * 1000:.0f} ms "
+            f"({len(samples)} sample(s))"
+        ]
+        for (filename, lineno, name), hits in sorted(counts.items(), key=lambda kv: -kv[1]):
+            lines.append(f"  hot: {os.path.basename(filename)}:{lineno} in {name} ({hits}/{len(samples)})")
+        lines.append("  stack at last sample (most recent call last):")
+        for entry in traceback.format_list(samples[-1][1]):
+            lines.append("    " + entry.rstrip().replace("\n", "\n    "))
+        self._write("\n".join(lines) + "\n\n")
+
+    def _write(self, text):
+        try:
+            os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+            with open(self.log_path, "a", encoding="utf-8") as fp:
+                fp.write(text)
+        except Exception as e:
+            print(f"[Watchdog] Failed to write stall report: {e}")
+
+
+def install(root, **kwargs):
+    """Create and start a StallWatchdog bound to `root`."""
+    watchdog = StallWatchdog(root, **kwargs)
+    watchdog.start()
+    return watchdog
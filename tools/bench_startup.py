@@ -0,0 +1,84 @@
+# tools/bench_startup.py
+"""
+Startup benchmark: time from interpreter start to the first painted landing page.
+
+Each sample runs in a fresh interpreter so nothing is cached in sys.modules.
+The "eager" mode imports everything the landing page used to pull in up front
+(order_ui, menu_editor, updater, Pillow, requests); "lazy" is the current startup.
+
+    python tools/bench_startup.py [--runs 7]
+
+Without a display only the import phase is measured.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import sys, time
+t0 = time.perf_counter()
+mode = sys.argv[1]
+if mode == "eager":
+    for name in ("order_ui", "menu_editor", "updater", "PIL.Image", "PIL.ImageTk", "requests"):
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+import tkinter as tk
+from landing_page import LandingPage
+t_import = time.perf_counter()
+try:
+    root = tk.Tk()
+except tk.TclError:
+    print(f"{(t_import - t0) * 1000:.2f} nan")
+    sys.exit(0)
+root.geometry("450x220")
+LandingPage(root)
+root.update()
+t_paint = time.perf_counter()
+root.destroy()
+print(f"{(t_import - t0) * 1000:.2f} {(t_paint - t0) * 1000:.2f}")
+"""
+
+
+def sample(mode):
+    out = subprocess.run(
+        [sys.executable, "-c", PROBE, mode],
+        cwd=ROOT_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    results = {}
+    for mode in ("eager", "lazy"):
+        samples = [sample(mode) for _ in range(args.runs)]
+        results[mode] = (
+            statistics.median(s[0] for s in samples),
+            statistics.median(s[1] for s in samples),
+        )
+
+    print(f"{'mode':<8}{'import ms':>12}{'first paint ms':>18}")
+    for mode, (imp, paint) in results.items():
+        print(f"{mode:<8}{imp:>12.1f}{paint:>18.1f}")
+
+    eager_paint, lazy_paint = results["eager"][1], results["lazy"][1]
+    if eager_paint == eager_paint and lazy_paint == lazy_paint:  # both measured (not NaN)
+        print(f"\nTime to first paint: {eager_paint - lazy_paint:+.1f} ms saved")
+    else:
+        print(f"\nImport phase: {results['eager'][0] - results['lazy'][0]:+.1f} ms saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+# tools/download_check.py
+"""
+End-to-end check of the updater's installer download against a local HTTP
+server with Range support.
+
+Scenarios:
+  resume     the server drops the connection part way through; the download
+             resumes with a Range request and the file verifies
+  mismatch   the published SHA-256 does not match; the download is rejected
+             and nothing is left behind
+  complete   a finished .part gets 416 with "bytes */<total>"; it is verified
+             and renamed without downloading again
+  stale      a .part longer than the file gets 416; it is discarded and
+             downloaded again without using up a retry
+  missing    the installer is gone (404); the download fails at once instead
+             of retrying
+
+    python tools/download_check.py
+
+Exits non-zero if any scenario fails. Runs in a temporary directory and needs
+no display.
+"""
+import hashlib
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+PAYLOAD = os.urandom(3 * 1024 * 1024 + 123)
+INSTALLER = "ImmenseCalculatorSetup.exe"
+
+
+class Server:
+    """Serves PAYLOAD and a SHA256SUMS file; can cut the next response short."""
+
+    def __init__(self):
+        self.requests = []  # (path, Range header) per request
+        self.body_bytes = 0  # installer bytes sent
+        self.drop_after = None  # cut the next installer response after this many bytes
+        self.checksum = hashlib.sha256(PAYLOAD).hexdigest()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("Range")))
+                if self.path == "/SHA256SUMS":
+                    body = f"{server.checksum}  {INSTALLER}\n".encode()
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                if self.path != f"/{INSTALLER}":
+                    self.send_error(404)
+                    return
+                start = 0
+                rng = self.headers.get("Range")
+                if rng:
+                    start = int(rng.split("=", 1)[1].split("-", 1)[0])
+                    if start >= len(PAYLOAD):
+                        self.send_response(416)
+                        self.send_header("Content-Range", f"bytes */{len(PAYLOAD)}")
+                        self.send_header("Content-Length", "0")
+                        self.end_headers()
+                        return
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}")
+                else:
+                    self.send_response(200)
+                body = PAYLOAD[start:]
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if server.drop_after is not None:
+                    body, server.drop_after = body[:server.drop_after], None
+                    self.close_connection = True
+                self.wfile.write(body)
+                server.body_bytes += len(body)
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def reset(self):
+        self.requests.clear()
+        self.body_bytes = 0
+        self.drop_after = None
+        self.checksum = hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def make_updater(server):
+    from updater import Updater
+    updater = Updater(root=None, mirror="")
+    updater.installer_filename = INSTALLER
+    updater.installer_url = f"{server.url}/{INSTALLER}"
+    updater.checksum_url = f"{server.url}/SHA256SUMS"
+    return updater
+
+
+def check(name, condition, detail=""):
+    print(f"[Download] {'ok  ' if condition else 'FAIL'} {name}{': ' + detail if detail and not condition else ''}")
+    return condition
+
+
+def scenario_resume(server, work):
+    path = os.path.join(work, INSTALLER)
+    server.drop_after = len(PAYLOAD) // 3
+    size = make_updater(server).fetch_installer(path)
+    ranges = [r for p, r in server.requests if p.endswith(INSTALLER)]
+    offset = int(ranges[-1].split("=")[1].rstrip("-")) if len(ranges) == 2 and ranges[-1] else 0
+    with open(path, "rb") as fp:
+        same = fp.read() == PAYLOAD
+    return all([
+        check("resume: file complete and verified", size == len(PAYLOAD) and same),
+        # Bytes still in flight when the connection broke are fetched again, nothing more
+        check("resume: second request continued from the partial file", 0 < offset <= len(PAYLOAD) // 3, str(ranges)),
+    ])
+
+
+def scenario_mismatch(server, work):
+    path = os.path.join(work, INSTALLER)
+    server.checksum = "0" * 64
+    try:
+        make_updater(server).fetch_installer(path)
+        rejected = False
+    except ValueError:
+        rejected = True
+    return all([
+        check("mismatch: download rejected", rejected),
+        check("mismatch: nothing left behind", not os.path.exists(path) and not os.path.exists(path + ".part")),
+    ])
+
+
+def scenario_complete(server, work):
+    path = os.path.join(work, INSTALLER)
+    with open(path + ".part", "wb") as fp:
+        fp.write(PAYLOAD)
+    size = make_updater(server).fetch_installer(path)
+    return all([
+        check("complete: finished .part accepted", size == len(PAYLOAD) and os.path.exists(path)),
+        check("complete: nothing downloaded again", server.body_bytes == 0, str(server.body_bytes)),
+    ])
+
+
+def scenario_stale(server, work):
+    import updater
+    path = os.path.join(work, INSTALLER)
+    with open(path + ".part", "wb") as fp:
+        fp.write(PAYLOAD + b"stale tail")
+    attempts = updater.DOWNLOAD_ATTEMPTS
+    updater.DOWNLOAD_ATTEMPTS = 1  # the restart must not need a second attempt
+    try:
+        size = make_updater(server).fetch_installer(path)
+    finally:
+        updater.DOWNLOAD_ATTEMPTS = attempts
+    with open(path, "rb") as fp:
+        same = fp.read() == PAYLOAD
+    return check("stale: discarded and downloaded again", size == len(PAYLOAD) and same)
+
+
+def scenario_missing(server, work):
+    path = os.path.join(work, INSTALLER)
+    updater = make_updater(server)
+    updater.installer_url = f"{server.url}/gone.exe"
+    started = time.perf_counter()
+    try:
+        updater.fetch_installer(path)
+        failed = False
+    except IOError:
+        failed = True
+    gets = sum(1 for p, _ in server.requests if p == "/gone.exe")
+    return all([
+        check("missing: download failed", failed),
+        check("missing: not retried", gets == 1 and time.perf_counter() - started < 1, f"{gets} requests"),
+    ])
+
+
+def main():
+    os.chdir(tempfile.mkdtemp(prefix="immense_download_"))
+    server = Server()
+    results = []
+    for scenario in (scenario_resume, scenario_mismatch, scenario_complete, scenario_stale,
+                     scenario_missing):
+        server.reset()
+        work = tempfile.mkdtemp(dir=".")
+        started = time.perf_counter()
+        try:
+            results.append(scenario(server, work))
+        except Exception as e:
+            results.append(check(scenario.__name__, False, f"{type(e).__name__}: {e}"))
+        print(f"[Download] {scenario.__name__} took {time.perf_counter() - started:.1f}s")
+    server.httpd.shutdown()
+    failed = results.count(False)
+    print(f"[Download] {len(results) - failed}/{len(results)} scenarios passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
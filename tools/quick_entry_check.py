@@ -0,0 +1,56 @@
+# tools/quick_entry_check.py
+"""
+Checks of how quick entry splits tokens into quantity and name, against a small
+menu with names that start or end with a number ("7 Up", "Box 2").
+
+    python tools/quick_entry_check.py
+
+Exits non-zero if any case fails. Needs no display.
+"""
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+import quick_entry  # noqa: E402
+import render_plan  # noqa: E402
+
+MENU = {
+    "sections": {
+        "drinks": ["7 Up", "Cola"],
+        "food": {"boxes": ["Box 2", "Cheeseburger"]},
+    },
+    "prices": {"7 Up": 2, "Cola": 2, "Box 2": 9, "Cheeseburger": 8},
+    "aliases": {"cb": "Cheeseburger"},
+}
+
+# text -> (entries, number of errors)
+CASES = [
+    ("7 Up", ([("item", "7 Up", 1)], 0)),
+    ("Box 2", ([("item", "Box 2", 1)], 0)),
+    ("3 cola", ([("item", "Cola", 3)], 0)),
+    ("cola x3", ([("item", "Cola", 3)], 0)),
+    ("cb*2", ([("item", "Cheeseburger", 2)], 0)),
+    ("7 Up x2", ([("item", "7 Up", 2)], 0)),
+    ("2 7 Up", ([("item", "7 Up", 2)], 0)),
+    ("3 cola x2", ([], 1)),
+    ("2 Box 2", ([("item", "Box 2", 2)], 0)),
+]
+
+
+def main():
+    index = quick_entry.QuickIndex(MENU, render_plan.build_plan(MENU))
+    failed = 0
+    for text, (want_entries, want_errors) in CASES:
+        entries, errors = quick_entry.parse(text, index)
+        ok = entries == want_entries and len(errors) == want_errors
+        failed += not ok
+        detail = "" if ok else f": got {entries} {errors}"
+        print(f"[QuickEntry] {'ok  ' if ok else 'FAIL'} {text!r}{detail}")
+    print(f"[QuickEntry] {len(CASES) - failed}/{len(CASES)} cases passed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
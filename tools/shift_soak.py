@@ -0,0 +1,444 @@
+# tools/shift_soak.py
+"""
+Shift soak: replay a cashier session against a real LandingPage -> OrderUIWindow
+and record how the app holds up over hours.
+
+The session is a stream of actions (section switches, searches, quantity
+changes, combo selections, discount toggles and confirms) generated from a seed
+at a realistic rate, or replayed from a JSONL script written by --save-script.
+Actions pick their targets by fraction ("pick": 0..1), so one script replays
+against any menu. Each action is timed until Tk is idle again; RSS, widget
+count, Tcl command count and GC activity are sampled along the way. The JSON
+report can be compared across versions:
+
+    python tools/shift_soak.py --hours 8 --report soak-1.3.json
+    python tools/shift_soak.py --hours 8 --speed 60 --report quick.json    # 60x faster than real time
+    python tools/shift_soak.py --script shift.jsonl --report replay.json
+    python tools/shift_soak.py --compare soak-1.2.json soak-1.3.json
+
+Uses a generated menu unless --menu is given. Starts Xvfb when there is no
+display and it is installed.
+"""
+import argparse
+import datetime
+import gc
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from soak_sections import ROOT_DIR, build_menu, count_widgets, rss_bytes, tree_nodes
+
+ACTIONS = ("section", "search", "quantity", "combo", "discount", "confirm")
+
+
+def generate_script(seed, hours, per_minute):
+    """A customer-by-customer action stream with exponential gaps averaging `per_minute` actions a minute."""
+    rng = random.Random(seed)
+    mean_gap = 60.0 / per_minute
+    end = hours * 3600
+    actions = []
+    t = 0.0
+
+    def emit(action, **kwargs):
+        nonlocal t
+        t += rng.expovariate(1 / mean_gap)
+        actions.append({"t": round(t, 3), "action": action, **kwargs})
+
+    while t < end:
+        for _ in range(rng.randint(1, 4)):
+            emit("section", pick=rng.random())
+            if rng.random() < 0.2:
+                emit("search", pick=rng.random(), chars=rng.randint(2, 5))
+            for _ in range(rng.randint(1, 4)):
+                emit("quantity", pick=rng.random(), value=rng.choice((1, 1, 1, 2, 2, 3, 5)))
+        if rng.random() < 0.3:
+            emit("combo", pick=rng.random(), value=rng.randint(1, 3))
+        if rng.random() < 0.15:
+            emit("discount", pick=rng.random())
+        emit("confirm")
+    return actions
+
+
+def load_script(path):
+    with open(path, "r", encoding="utf-8") as fp:
+        return [json.loads(line) for line in fp if line.strip()]
+
+
+def save_script(actions, path):
+    with open(path, "w", encoding="utf-8") as fp:
+        for action in actions:
+            fp.write(json.dumps(action) + "\n")
+
+
+def percentiles(values):
+    if not values:
+        return {"count": 0}
+    values = sorted(values)
+
+    def rank(p):
+        return round(values[min(len(values) - 1, int(p / 100 * len(values)))], 2)
+
+    return {"count": len(values), "p50": rank(50), "p90": rank(90), "p99": rank(99), "max": round(values[-1], 2)}
+
+
+def start_virtual_display():
+    if os.environ.get("DISPLAY") or sys.platform in ("win32", "darwin"):
+        return None
+    xvfb = shutil.which("Xvfb")
+    if not xvfb:
+        return None
+    display = next(n for n in range(99, 200) if not os.path.exists(f"/tmp/.X{n}-lock"))
+    proc = subprocess.Popen([xvfb, f":{display}", "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    for _ in range(50):
+        if os.path.exists(f"/tmp/.X{display}-lock"):
+            break
+        time.sleep(0.1)
+    os.environ["DISPLAY"] = f":{display}"
+    print(f"[Shift] Started Xvfb on :{display}")
+    return proc
+
+
+class AutoMessagebox:
+    """Stands in for tkinter.messagebox in the order window: confirms everything and counts what was shown."""
+
+    def __init__(self):
+        self.shown = {}
+
+    def _count(self, kind):
+        self.shown[kind] = self.shown.get(kind, 0) + 1
+
+    def askokcancel(self, *args, **kwargs):
+        self._count("askokcancel")
+        return True
+
+    def askyesno(self, *args, **kwargs):
+        self._count("askyesno")
+        return True
+
+    def showinfo(self, *args, **kwargs):
+        self._count("showinfo")
+
+    def showwarning(self, *args, **kwargs):
+        self._count("showwarning")
+
+    def showerror(self, *args, **kwargs):
+        self._count("showerror")
+
+
+class GcMonitor:
+    def __init__(self):
+        self.collections = [0, 0, 0]
+        self.pause_ms = 0.0
+        self.max_pause_ms = 0.0
+        self._start = None
+
+    def __call__(self, phase, info):
+        if phase == "start":
+            self._start = time.perf_counter()
+        elif self._start is not None:
+            pause = (time.perf_counter() - self._start) * 1000
+            self._start = None
+            self.collections[info["generation"]] += 1
+            self.pause_ms += pause
+            self.max_pause_ms = max(self.max_pause_ms, pause)
+
+
+class ShiftDriver:
+    """Performs script actions on a live order window, timing each until Tk is idle."""
+
+    def __init__(self, root, order):
+        self.root = root
+        self.order = order
+        self.nodes = tree_nodes(order.section_tree)
+        sections = order.menu.get("sections", {})
+        self.combos = sorted(sections.get("combos", {}))
+        names = set()
+        for key, val in sections.items():
+            if key == "combos":
+                continue
+            for items in (val.values() if isinstance(val, dict) else [val]):
+                names.update(items)
+        self.item_names = sorted(names)
+        self.latencies = {name: [] for name in ACTIONS}
+        self.skipped = 0
+
+    @staticmethod
+    def _pick(seq, pick):
+        return seq[min(len(seq) - 1, int(pick * len(seq)))] if seq else None
+
+    def _timed(self, name, func):
+        start = time.perf_counter()
+        func()
+        self.root.update()
+        # Rows are built in slices; count the whole build, as before slicing
+        self.order.finish_building()
+        self.root.update()
+        self.latencies[name].append((time.perf_counter() - start) * 1000)
+
+    def run(self, action):
+        handler = getattr(self, "do_" + action.get("action", ""), None)
+        if handler is None:
+            self.skipped += 1
+            return
+        handler(action)
+
+    def do_section(self, action):
+        node = self._pick(self.nodes, action.get("pick", 0))
+        if node:
+            self._timed("section", lambda: self.order.section_tree.selection_set(node))
+
+    def do_search(self, action):
+        name = self._pick(self.item_names, action.get("pick", 0))
+        if not name:
+            return
+        entry = self.order.search_entry
+        self._timed("search", lambda: entry.delete(0, "end"))
+        for ch in name[:action.get("chars", 3)]:
+            self._timed("search", lambda: entry.insert("end", ch))
+        self._timed("search", lambda: entry.delete(0, "end"))
+
+    def do_quantity(self, action):
+        spins = list(self.order.current_item_spinboxes.values())
+        spins += [s for s in self.order.combo_qty_vars.values() if s]
+        spin = self._pick(spins, action.get("pick", 0))
+        if spin is None:
+            self.skipped += 1
+            return
+        self._timed("quantity", lambda: spin.set(action.get("value", 1), notify=True))
+
+    def do_combo(self, action):
+        name = self._pick(self.combos, action.get("pick", 0))
+        if not name:
+            self.skipped += 1
+            return
+        if "combos" in self.nodes:
+            self._timed("section", lambda: self.order.section_tree.selection_set("combos"))
+        combo = self.order.menu["sections"]["combos"][name]
+        value = action.get("value", 1)
+        if not combo.get("mix_and_match", False):
+            spin = self.order.combo_qty_vars.get(name)
+            if spin:
+                self._timed("combo", lambda: spin.set(value, notify=True))
+            return
+
+        before = set(self.order.root.winfo_children())
+        self._timed("combo", lambda: self.order.open_combo_selector(name))
+        tops = [w for w in self.order.root.winfo_children() if w not in before and w.winfo_class() == "Toplevel"]
+        if not tops:
+            self.skipped += 1
+            return
+        top = tops[0]
+        spinbox = next((w for w in walk(top) if w.winfo_class() == "TSpinbox"), None)
+        save = next((w for w in walk(top) if w.winfo_class() == "TButton" and "Save" in str(w.cget("text"))), None)
+        if spinbox is not None:
+            self._timed("combo", lambda: spinbox.set(value))
+        if save is not None:
+            self._timed("combo", save.invoke)
+        elif top.winfo_exists():
+            top.destroy()
+
+    def do_discount(self, action):
+        checks = [w for w in self.order.top_discount_frame.winfo_children() if w.winfo_class() == "TCheckbutton"]
+        check = self._pick(checks, action.get("pick", 0))
+        if check is None:
+            self.skipped += 1
+            return
+        self._timed("discount", check.invoke)
+
+    def do_confirm(self, action):
+        self._timed("confirm", self.order.confirm_purchase)
+
+
+def walk(widget):
+    for child in widget.winfo_children():
+        yield child
+        yield from walk(child)
+
+
+def git_describe():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT_DIR, capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_shift(args):
+    actions = load_script(args.script) if args.script else generate_script(args.seed, args.hours, args.rate)
+    if args.save_script:
+        save_script(actions, args.save_script)
+    report_path = os.path.abspath(args.report) if args.report else None
+    menu_path = os.path.abspath(args.menu) if args.menu else None
+
+    xvfb = start_virtual_display()
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"[Shift] No display available ({e}); install Xvfb or run under xvfb-run.")
+        return 2
+
+    try:
+        os.chdir(tempfile.mkdtemp(prefix="immense_shift_"))
+        import menu_manager
+        import order_ui
+        from landing_page import LandingPage
+        from version import APP_VERSION
+
+        if menu_path:
+            with open(menu_path, "r", encoding="utf-8") as fp:
+                menu_manager.save_menu(json.load(fp), "Shift")
+        else:
+            menu_manager.save_menu(build_menu(), "Shift")
+        boxes = AutoMessagebox()
+        order_ui.messagebox = boxes
+
+        landing = LandingPage(root)
+        landing.selected_estab.set("Shift")
+        landing.open_order_tab_new()
+        root.update()
+        landing.order_ui.finish_building()
+        driver = ShiftDriver(root, landing.order_ui)
+
+        gc_monitor = GcMonitor()
+        gc.callbacks.append(gc_monitor)
+
+        samples = []
+        hourly = {}
+        window = {name: [] for name in ACTIONS}
+
+        def take_sample(shift_s):
+            samples.append({
+                "shift_s": round(shift_s, 1),
+                "wall_s": round(time.perf_counter() - wall_start, 1),
+                "rss": rss_bytes(),
+                "widgets": count_widgets(root),
+                "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+                "gc_collections": list(gc_monitor.collections),
+                "gc_pause_ms": round(gc_monitor.pause_ms, 1),
+                "latency": {name: percentiles(vals) for name, vals in window.items() if vals},
+            })
+            for vals in window.values():
+                vals.clear()
+
+        wall_start = time.perf_counter()
+        take_sample(0)
+        next_sample = args.sample_every
+        for action in actions:
+            t = action.get("t", 0)
+            if args.speed > 0:
+                due = wall_start + t / args.speed
+                while time.perf_counter() < due:
+                    root.update()
+                    time.sleep(min(0.01, max(0.0, due - time.perf_counter())))
+
+            counts = {name: len(vals) for name, vals in driver.latencies.items()}
+            driver.run(action)
+            hour = int(t // 3600)
+            for name, vals in driver.latencies.items():
+                new = vals[counts[name]:]
+                window[name].extend(new)
+                hourly.setdefault(hour, {}).setdefault(name, []).extend(new)
+
+            if t >= next_sample:
+                take_sample(t)
+                rss = samples[-1]["rss"]
+                print(f"[Shift] {t / 3600:5.2f}h  rss {rss / 2**20 if rss else float('nan'):7.1f} MB"
+                      f"  widgets {samples[-1]['widgets']}  section p99 "
+                      f"{samples[-1]['latency'].get('section', {}).get('p99', '-')} ms")
+                next_sample += args.sample_every
+        take_sample(actions[-1]["t"] if actions else 0)
+        gc.callbacks.remove(gc_monitor)
+
+        report = {
+            "meta": {
+                "version": APP_VERSION,
+                "git": git_describe(),
+                "python": platform.python_version(),
+                "tk": root.tk.call("info", "patchlevel"),
+                "platform": platform.platform(),
+                "started": datetime.datetime.now().isoformat(timespec="seconds"),
+                "wall_s": round(time.perf_counter() - wall_start, 1),
+                "args": vars(args),
+            },
+            "actions": {name: percentiles(vals) for name, vals in driver.latencies.items()},
+            "hourly": [{"hour": h, **{name: percentiles(vals) for name, vals in hourly[h].items()}} for h in sorted(hourly)],
+            "samples": samples,
+            "gc": {"collections": gc_monitor.collections, "pause_ms": round(gc_monitor.pause_ms, 1),
+                   "max_pause_ms": round(gc_monitor.max_pause_ms, 2)},
+            "dialogs": boxes.shown,
+            "skipped": driver.skipped,
+        }
+        print_summary(report)
+        if report_path:
+            with open(report_path, "w", encoding="utf-8") as fp:
+                json.dump(report, fp, indent=2)
+            print(f"[Shift] Report written to {report_path}")
+        return 0
+    finally:
+        root.destroy()
+        if xvfb:
+            xvfb.terminate()
+
+
+def print_summary(report):
+    print(f"{'action':<10}{'count':>8}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}  (ms)")
+    for name, stats in report["actions"].items():
+        if stats.get("count"):
+            print(f"{name:<10}{stats['count']:>8}{stats['p50']:>9}{stats['p90']:>9}{stats['p99']:>9}{stats['max']:>9}")
+    first, last = report["samples"][0], report["samples"][-1]
+    if first["rss"] and last["rss"]:
+        print(f"RSS {first['rss'] / 2**20:.1f} -> {last['rss'] / 2**20:.1f} MB, "
+              f"widgets {first['widgets']} -> {last['widgets']}, Tcl commands {first['tcl_commands']} -> {last['tcl_commands']}")
+    print(f"GC collections {report['gc']['collections']}, total pause {report['gc']['pause_ms']} ms")
+
+
+def compare(old_path, new_path):
+    with open(old_path, "r", encoding="utf-8") as fp:
+        old = json.load(fp)
+    with open(new_path, "r", encoding="utf-8") as fp:
+        new = json.load(fp)
+    print(f"{'':<10}{old['meta'].get('version')} ({old['meta'].get('git')}) -> {new['meta'].get('version')} ({new['meta'].get('git')})")
+    print(f"{'action':<10}{'p50 old':>10}{'p50 new':>10}{'p99 old':>10}{'p99 new':>10}{'p99 change':>12}")
+    for name in ACTIONS:
+        a, b = old["actions"].get(name, {}), new["actions"].get(name, {})
+        if not a.get("count") or not b.get("count"):
+            continue
+        change = f"{(b['p99'] - a['p99']) / a['p99'] * 100:+.0f}%" if a["p99"] else "-"
+        print(f"{name:<10}{a['p50']:>10}{b['p50']:>10}{a['p99']:>10}{b['p99']:>10}{change:>12}")
+    for label, report in (("old", old), ("new", new)):
+        first, last = report["samples"][0], report["samples"][-1]
+        if first["rss"] and last["rss"]:
+            print(f"{label}: RSS growth {(last['rss'] - first['rss']) / 2**20:+.1f} MB, "
+                  f"widget growth {last['widgets'] - first['widgets']:+d}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a cashier shift against the order window and report latency and memory.")
+    parser.add_argument("--hours", type=float, default=8.0, help="shift length for generated scripts (default: %(default)s)")
+    parser.add_argument("--rate", type=float, default=30.0, help="average actions per minute (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--speed", type=float, default=1.0, help="time compression, 0 = as fast as possible (default: %(default)s)")
+    parser.add_argument("--script", help="replay this JSONL action script instead of generating one")
+    parser.add_argument("--save-script", help="write the action script that is run to this JSONL file")
+    parser.add_argument("--menu", help="menu JSON to use instead of the generated one")
+    parser.add_argument("--sample-every", type=float, default=300.0, help="shift seconds between samples (default: %(default)s)")
+    parser.add_argument("--report", help="write the JSON report here")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="compare two reports and exit")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        return compare(*args.compare)
+    return run_shift(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
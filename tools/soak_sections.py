@@ -0,0 +1,173 @@
+# tools/soak_sections.py
+"""
+Soak test for widget, trace and binding lifecycle.
+
+Switches sections of an order window many times (and periodically opens, reloads
+and closes a menu editor) against a generated menu, sampling RSS, Tcl command and
+variable counts and the live widget count. After warm-up these should stay flat;
+the script exits non-zero when they keep growing.
+
+    python tools/soak_sections.py [--switches 10000] [--sample-every 500]
+
+Runs in a temporary data directory. Needs a display (use xvfb-run when headless).
+"""
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+
+def rss_bytes():
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm") as fp:
+            return int(fp.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def build_menu(sections=8, items=40):
+    menu = {"sections": {}, "item_limits": {}, "discounts": {"Staff": 10}, "prices": {"combos": {}}}
+    for s in range(sections):
+        name = f"section{s}"
+        if s % 2:
+            menu["sections"][name] = {f"sub{k}": [f"{name} sub{k} item{i}" for i in range(items // 2)] for k in range(2)}
+            all_items = [item for sub in menu["sections"][name].values() for item in sub]
+        else:
+            all_items = [f"{name} item{i}" for i in range(items)]
+            menu["sections"][name] = all_items
+        for i, item in enumerate(all_items):
+            menu["prices"][item] = 1 + i % 9
+            if i % 10 == 0:
+                menu["item_limits"][item] = 5
+    first = menu["sections"]["section0"]
+    menu["sections"]["combos"] = {
+        "Meal Deal": {"mix_and_match": True, "combo_items": {"food": first[:6]}, "limits": {"food": 2}},
+        "Fixed Box": {"mix_and_match": False, "combo_items": {"food": {first[0]: 2}}},
+    }
+    menu["prices"]["combos"] = {"Meal Deal": 12, "Fixed Box": 8}
+    return menu
+
+
+def tree_nodes(tree, parent=""):
+    nodes = []
+    for node in tree.get_children(parent):
+        nodes.append(node)
+        nodes.extend(tree_nodes(tree, node))
+    return nodes
+
+
+def count_widgets(widget):
+    return 1 + sum(count_widgets(child) for child in widget.winfo_children())
+
+
+def sample(root, switches):
+    gc.collect()
+    return {
+        "switches": switches,
+        "rss": rss_bytes(),
+        "tcl_commands": len(root.tk.splitlist(root.tk.call("info", "commands"))),
+        "tcl_vars": len(root.tk.splitlist(root.tk.call("info", "vars"))),
+        "widgets": count_widgets(root),
+        "py_objects": len(gc.get_objects()),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--switches", type=int, default=10000)
+    parser.add_argument("--sample-every", type=int, default=500)
+    parser.add_argument("--editor-every", type=int, default=1000, help="open/reload/close a menu editor this often")
+    parser.add_argument("--rss-tolerance-mb", type=float, default=16.0)
+    parser.add_argument("--json", help="write samples and verdict to this file")
+    args = parser.parse_args(argv)
+    json_path = os.path.abspath(args.json) if args.json else None
+
+    import tkinter as tk
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        print(f"[Soak] No display available ({e}); run under xvfb-run.")
+        return 2
+    root.withdraw()
+
+    os.chdir(tempfile.mkdtemp(prefix="immense_soak_"))
+    from menu_manager import save_menu
+    from order_ui import OrderUIWindow
+    from menu_editor import MenuEditorWindow
+    save_menu(build_menu(), "Soak")
+
+    order_top = tk.Toplevel(root)
+    order = OrderUIWindow(order_top, "Soak")
+    order.finish_building()
+    nodes = tree_nodes(order.section_tree)
+
+    def open_editor():
+        top = tk.Toplevel(root)
+        editor = MenuEditorWindow(top, "Soak")
+        editor.notebook.select(editor.tab_prices)
+        root.update()
+        editor.load_prices()
+        root.update()
+        top.destroy()
+
+    def switch(i):
+        order.section_tree.selection_set(nodes[i % len(nodes)])
+        order.on_section_subsection_selected()
+        order.finish_building()
+        root.update()
+
+    # Warm up: visit every node once and open an editor so caches and lazy imports settle
+    for i in range(len(nodes)):
+        switch(i)
+    open_editor()
+    baseline = sample(root, 0)
+    samples = [baseline]
+    print(f"[Soak] {len(nodes)} sections, baseline {baseline}")
+
+    start = time.perf_counter()
+    for i in range(1, args.switches + 1):
+        switch(i)
+        if args.editor_every and i % args.editor_every == 0:
+            open_editor()
+        if i % args.sample_every == 0:
+            s = sample(root, i)
+            samples.append(s)
+            rss_mb = (s["rss"] - baseline["rss"]) / 2**20 if s["rss"] and baseline["rss"] else float("nan")
+            print(f"[Soak] {i:>6} switches  rss {rss_mb:+7.2f} MB  commands {s['tcl_commands'] - baseline['tcl_commands']:+d}"
+                  f"  vars {s['tcl_vars'] - baseline['tcl_vars']:+d}  widgets {s['widgets'] - baseline['widgets']:+d}")
+    elapsed = time.perf_counter() - start
+
+    # Allow for the rows of whichever section happens to be shown at the end
+    last = samples[-1]
+    growth = {key: last[key] - baseline[key] for key in ("tcl_commands", "tcl_vars", "widgets")}
+    rss_growth_mb = (last["rss"] - baseline["rss"]) / 2**20 if last["rss"] and baseline["rss"] else None
+    current_rows = count_widgets(order.item_container)
+    ok = (growth["tcl_commands"] <= current_rows and growth["tcl_vars"] <= current_rows
+          and growth["widgets"] <= current_rows
+          and (rss_growth_mb is None or rss_growth_mb <= args.rss_tolerance_mb))
+
+    print(f"[Soak] {args.switches} switches in {elapsed:.1f}s ({elapsed / max(args.switches, 1) * 1000:.2f} ms each)")
+    print(f"[Soak] growth: {growth}, rss {rss_growth_mb if rss_growth_mb is None else round(rss_growth_mb, 2)} MB")
+    print("[Soak] PASS" if ok else "[Soak] FAIL: memory or Tcl objects keep growing")
+
+    if json_path:
+        with open(json_path, "w", encoding="utf-8") as fp:
+            json.dump({"samples": samples, "growth": growth, "rss_growth_mb": rss_growth_mb, "ok": ok}, fp, indent=2)
+
+    root.destroy()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
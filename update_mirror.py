@@ -0,0 +1,308 @@
+# update_mirror.py
+"""
+LAN update mirror for shops running ImmenseCalculator on several machines.
+
+Fetches the latest GitHub release once (conditional requests, resumable downloads)
+into a cache directory and serves it over HTTP, so every register updates from the
+LAN instead of GitHub:
+
+    python update_mirror.py --cache D:\\immense-mirror --port 8765
+
+Point the registers at it with {"mirror": "http://<host>:8765/"} in data/updater.json
+(or the IMMENSECALC_UPDATE_MIRROR environment variable). With --fetch-only the cache
+directory can instead be placed on a network share and used as the mirror directly.
+"""
+import os
+import re
+import sys
+import json
+import time
+import hashlib
+import argparse
+import threading
+import mimetypes
+import requests
+from email.utils import formatdate
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import updater
+from menu_manager import DATA_DIR
+
+DEFAULT_CACHE_DIR = os.path.join(DATA_DIR, "update_mirror")
+DEFAULT_PORT = 8765
+DEFAULT_REFRESH = 60 * 60  # seconds
+CHECKSUM_FILE = "SHA256SUMS"
+# SHA-256, size and mtime of each cached asset, so reuse is checked by hash (dot files are not served)
+DIGEST_FILE = ".digests.json"
+
+
+def _sha256_file(path):
+    hasher = hashlib.sha256()
+    updater.Updater._hash_existing(path, hasher)
+    return hasher.hexdigest()
+
+
+def _load_digests(cache_dir):
+    try:
+        with open(os.path.join(cache_dir, DIGEST_FILE), "r", encoding="utf-8") as fp:
+            digests = json.load(fp)
+        return digests if isinstance(digests, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_digest(path, record):
+    """SHA-256 of a cached asset; the recorded one while the file is unchanged since it was recorded."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if isinstance(record, dict) and record.get("size") == st.st_size and record.get("mtime_ns") == st.st_mtime_ns:
+        return record.get("sha256")
+    return _sha256_file(path)
+
+
+def _record(path, digest):
+    st = os.stat(path)
+    return {"sha256": digest, "size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+
+def _is_checksum_asset(name):
+    name = name.lower()
+    return name in updater.CHECKSUM_ASSET_NAMES or name.endswith(".sha256")
+
+
+def _upstream_checksums(assets):
+    """
+    Fetch the release's checksum assets. Returns ({asset name: content},
+    {lower-case asset name: published sha256}).
+    """
+    contents, expected = {}, {}
+    for asset in assets:
+        if not _is_checksum_asset(asset["name"]):
+            continue
+        response = requests.get(asset["browser_download_url"], timeout=updater.DOWNLOAD_TIMEOUT)
+        response.raise_for_status()
+        contents[asset["name"]] = response.content
+        for name, digest in updater.parse_checksums(response.content.decode("utf-8", "replace")).items():
+            # A bare hash in "<file>.sha256" belongs to <file>
+            if not name and asset["name"].lower().endswith(".sha256"):
+                name = asset["name"].lower()[:-len(".sha256")]
+            if name:
+                expected.setdefault(name, digest)
+    return contents, expected
+
+
+def fetch_release(cache_dir):
+    """
+    Bring `cache_dir` up to date with the latest release. Returns True when the
+    cache holds a complete release afterwards.
+
+    Assets are checked against the release's checksum asset when it has one, and
+    a cached asset is reused only if its SHA-256 (recorded in DIGEST_FILE when it
+    was fetched) still matches. Everything is downloaded and verified before the
+    manifest is replaced, so clients never see a manifest that points at files
+    which are not there yet.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    upd = updater.Updater(mirror="", cache_path=os.path.join(cache_dir, ".release_cache.json"))
+    release = upd._get_release(force=True)
+    manifest_path = os.path.join(cache_dir, updater.MIRROR_MANIFEST_NAME)
+    if not release:
+        print("[Mirror] Could not fetch release info.")
+        return os.path.isfile(manifest_path)
+
+    assets = [a for a in release.get("assets", []) if a.get("name") and os.path.basename(a["name"]) == a["name"]]
+    checksum_contents, expected = _upstream_checksums(assets)
+    recorded = _load_digests(cache_dir)
+    digests = {}
+    for asset in assets:
+        name = asset["name"]
+        dest = os.path.join(cache_dir, name)
+        if name in checksum_contents:
+            continue
+        want = expected.get(name.lower())
+        record = recorded.get(name) or {}
+        have = _cached_digest(dest, record)
+        if want:
+            reuse = have == want
+        else:
+            # Nothing published to check against: the file must still be the one we fetched
+            reuse = have is not None and have == record.get("sha256") and record.get("size") == asset.get("size", -1)
+        if reuse:
+            digests[name] = _record(dest, have)
+            continue
+        print(f"[Mirror] Downloading {name}...")
+        digest, size = upd._download_resumable(asset["browser_download_url"], dest + ".part")
+        if want and digest != want:
+            os.remove(dest + ".part")
+            print(f"[Mirror] {name} failed SHA-256 verification (got {digest}, release says {want}); keeping the current cache.")
+            return os.path.isfile(manifest_path)
+        os.replace(dest + ".part", dest)
+        digests[name] = _record(dest, digest)
+        print(f"[Mirror] {name}: {size} bytes, sha256 {digest}{' (verified)' if want else ''}")
+
+    # Checksum lists go in last, so a failed download leaves the old list beside the old files.
+    # They are always taken fresh: a new list can be the same size as the old one.
+    for name, content in checksum_contents.items():
+        dest = os.path.join(cache_dir, name)
+        with open(dest + ".part", "wb") as fp:
+            fp.write(content)
+        os.replace(dest + ".part", dest)
+        digests[name] = _record(dest, hashlib.sha256(content).hexdigest())
+
+    # Publish checksums for the cached assets when the release does not carry its own
+    names = {a["name"].lower() for a in assets}
+    if not names & set(updater.CHECKSUM_ASSET_NAMES):
+        lines = [f"{digests[a['name']]['sha256']}  {a['name']}" for a in assets]
+        checksum_path = os.path.join(cache_dir, CHECKSUM_FILE)
+        with open(checksum_path, "w", encoding="utf-8") as fp:
+            fp.write("\n".join(lines) + "\n")
+        assets.append({"name": CHECKSUM_FILE, "size": os.path.getsize(checksum_path)})
+
+    digest_path = os.path.join(cache_dir, DIGEST_FILE)
+    with open(digest_path + ".tmp", "w", encoding="utf-8") as fp:
+        json.dump(digests, fp, indent=2)
+    os.replace(digest_path + ".tmp", digest_path)
+
+    previous = set()
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as fp:
+            previous = {a.get("name") for a in json.load(fp).get("assets", [])}
+    except (OSError, ValueError):
+        pass
+
+    manifest = {
+        "tag_name": release.get("tag_name", ""),
+        "name": release.get("name", ""),
+        "published_at": release.get("published_at"),
+        "assets": [{"name": a["name"], "size": a.get("size")} for a in assets],
+    }
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fp:
+        json.dump(manifest, fp, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+    # Drop assets of the release we just replaced
+    for name in previous - {a["name"] for a in assets}:
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except OSError:
+            pass
+
+    print(f"[Mirror] Cache holds release {manifest['tag_name']} ({len(assets)} assets).")
+    return True
+
+
+class MirrorRequestHandler(SimpleHTTPRequestHandler):
+    """Static file handler with ETag revalidation and single-range requests, for resumable client downloads."""
+
+    _range_remaining = None
+
+    def send_head(self):
+        self._range_remaining = None
+        path = self.translate_path(self.path)
+        if not os.path.isfile(path):
+            return super().send_head()
+        if os.path.basename(path).startswith(".") or path.endswith((".part", ".tmp")):
+            self.send_error(404, "File not found")
+            return None
+
+        st = os.stat(path)
+        etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return None
+
+        size = st.st_size
+        start, end = 0, size - 1
+        match = re.fullmatch(r"bytes=(\d*)-(\d*)", self.headers.get("Range", "").strip())
+        if match and (match.group(1) or match.group(2)):
+            if match.group(1):
+                start = int(match.group(1))
+                if match.group(2):
+                    end = min(int(match.group(2)), size - 1)
+            else:
+                start = max(size - int(match.group(2)), 0)
+            if start >= size or start > end:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.end_headers()
+                return None
+
+        f = open(path, "rb")
+        if match and (match.group(1) or match.group(2)):
+            f.seek(start)
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        else:
+            self.send_response(200)
+        self._range_remaining = end - start + 1
+        self.send_header("Content-Type", mimetypes.guess_type(path)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(self._range_remaining))
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", formatdate(st.st_mtime, usegmt=True))
+        self.end_headers()
+        return f
+
+    def copyfile(self, source, outputfile):
+        if self._range_remaining is None:
+            return super().copyfile(source, outputfile)
+        remaining = self._range_remaining
+        while remaining > 0:
+            block = source.read(min(remaining, 256 * 1024))
+            if not block:
+                break
+            outputfile.write(block)
+            remaining -= len(block)
+
+    def log_message(self, format, *args):
+        print(f"[Mirror] {self.address_string()} - {format % args}")
+
+
+def serve(cache_dir, host, port, refresh):
+    def refresh_loop():
+        while True:
+            time.sleep(refresh)
+            try:
+                fetch_release(cache_dir)
+            except Exception as e:
+                print(f"[Mirror] Refresh failed: {e}")
+
+    if refresh > 0:
+        threading.Thread(target=refresh_loop, daemon=True).start()
+
+    handler = lambda *args, **kwargs: MirrorRequestHandler(*args, directory=cache_dir, **kwargs)
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"[Mirror] Serving {os.path.abspath(cache_dir)} on http://{host}:{port}/")
+    print(f'[Mirror] Set {{"mirror": "http://<this-machine>:{port}/"}} in {updater.MIRROR_CONFIG_PATH} on each register.')
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Cache the latest ImmenseCalculator release and serve it on the LAN.")
+    parser.add_argument("--cache", default=DEFAULT_CACHE_DIR, help="cache directory (default: %(default)s)")
+    parser.add_argument("--host", default="0.0.0.0", help="address to listen on (default: %(default)s)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on (default: %(default)s)")
+    parser.add_argument("--refresh", type=int, default=DEFAULT_REFRESH,
+                        help="seconds between release checks while serving, 0 to disable (default: %(default)s)")
+    parser.add_argument("--fetch-only", action="store_true", help="update the cache directory and exit")
+    args = parser.parse_args(argv)
+
+    ok = fetch_release(args.cache)
+    if args.fetch_only:
+        return 0 if ok else 1
+    serve(args.cache, args.host, args.port, args.refresh)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
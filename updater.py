@@ -1,14 +1,21 @@
 import os
+import re
 import sys
+import json
+import time
+import hashlib
 import platform
 import tempfile
-import threading
 import subprocess
 import requests
+import urllib3
+from urllib.parse import urljoin, quote
 import tkinter as tk
 from tkinter import messagebox
 from packaging import version  # require `pip install packaging`
 from version import APP_VERSION
+from menu_manager import DATA_DIR
+import dispatcher
 
 # Current app version - keep this in sync with your releases
 APP_VERSION = "1.2.0"
@@ -20,21 +27,200 @@ GITHUB_REPO = "ImmenseCalculator"
 # GitHub API endpoints
 GITHUB_API_RELEASES_URL = f"https://api.github.com/repos/{GITHUB_USER}/{GITHUB_REPO}/releases/latest"
 
+# Last release response is kept here so launches inside the TTL never touch the network
+UPDATE_CACHE_PATH = os.path.join(DATA_DIR, "update_cache.json")
+UPDATE_CACHE_TTL = 6 * 60 * 60  # seconds
+
+# Backoff after failed checks (offline, server errors): 1 min doubling up to 1 hour
+FAILURE_BACKOFF_BASE = 60
+FAILURE_BACKOFF_MAX = 60 * 60
+
+# Installer download: chunk size adapts to throughput between these bounds
+DOWNLOAD_CHUNK_MIN = 16 * 1024
+DOWNLOAD_CHUNK_START = 64 * 1024
+DOWNLOAD_CHUNK_MAX = 1024 * 1024
+DOWNLOAD_TIMEOUT = (10, 30)  # (connect, read) seconds
+DOWNLOAD_ATTEMPTS = 5
+
+# Release assets that may carry the installer's SHA-256
+CHECKSUM_ASSET_NAMES = ("sha256sums", "sha256sums.txt", "checksums.txt")
+
+# Optional LAN mirror (see update_mirror.py): an http(s) base URL or a shared directory
+# holding MIRROR_MANIFEST_NAME plus the release assets, configured by environment
+# variable or by {"mirror": "..."} in MIRROR_CONFIG_PATH.
+MIRROR_ENV_VAR = "IMMENSECALC_UPDATE_MIRROR"
+MIRROR_CONFIG_PATH = os.path.join(DATA_DIR, "updater.json")
+MIRROR_MANIFEST_NAME = "latest.json"
+
+
+def load_mirror_setting():
+    mirror = os.environ.get(MIRROR_ENV_VAR, "").strip()
+    if mirror:
+        return mirror
+    try:
+        with open(MIRROR_CONFIG_PATH, "r", encoding="utf-8") as fp:
+            return (json.load(fp).get("mirror") or "").strip() or None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def _is_url(location):
+    return location.startswith("http://") or location.startswith("https://")
+
+
+def _is_transient(error):
+    """False for HTTP errors that retrying cannot fix (4xx other than timeout / rate limit)."""
+    response = getattr(error, "response", None)
+    if isinstance(error, requests.HTTPError) and response is not None:
+        return response.status_code >= 500 or response.status_code in (408, 429)
+    return True
+
+
+def parse_checksums(text):
+    """{lower-case file name: sha256} from sha256sum-style text; a bare hash is filed under ""."""
+    digests = {}
+    for line in text.splitlines():
+        match = re.match(r"^\s*([0-9a-fA-F]{64})\b\s*\*?(.*)$", line)
+        if match:
+            name = os.path.basename(match.group(2).strip().lower())
+            digests.setdefault(name, match.group(1).lower())
+    return digests
+
+
 class Updater:
-    def __init__(self, root=None, current_version=APP_VERSION):
+    def __init__(self, root=None, current_version=APP_VERSION, api_url=None,
+                 cache_path=UPDATE_CACHE_PATH, cache_ttl=UPDATE_CACHE_TTL, mirror=None):
         self.root = root
         self.current_version = current_version
+        self.mirror = mirror if mirror is not None else load_mirror_setting()
+        if api_url is None:
+            if self.mirror and _is_url(self.mirror):
+                api_url = urljoin(self.mirror.rstrip("/") + "/", MIRROR_MANIFEST_NAME)
+            else:
+                api_url = GITHUB_API_RELEASES_URL
+        self.api_url = api_url
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl
         self.latest_version = None
         self.installer_url = None
         self.installer_filename = None
+        self.checksum_url = None
+        self.progress_win = None
+        self.cancel_token = dispatcher.CancelToken()
 
-    def fetch_latest_release_info(self):
+    # ---------- Release cache ----------
+
+    def _load_cache(self):
         try:
-            headers = {'Accept': 'application/vnd.github.v3+json'}
-            response = requests.get(GITHUB_API_RELEASES_URL, headers=headers, timeout=10)
-            response.raise_for_status()
+            with open(self.cache_path, "r", encoding="utf-8") as fp:
+                cache = json.load(fp)
+            if cache.get("url") == self.api_url:
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {"url": self.api_url}
+
+    def _save_cache(self, cache):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as fp:
+                json.dump(cache, fp)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            print(f"[Updater] Failed to write update cache: {e}")
+
+    @staticmethod
+    def _rate_limit_reset(response, now):
+        """Return the epoch time until which the API asked us to back off, or None."""
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                return now + int(retry_after)
+            except ValueError:
+                pass
+        if response.headers.get("X-RateLimit-Remaining") == "0":
+            try:
+                return float(response.headers.get("X-RateLimit-Reset", ""))
+            except ValueError:
+                return now + FAILURE_BACKOFF_MAX
+        return None
 
-            release_info = response.json()
+    def _get_release(self, force=False):
+        """
+        Return the latest release JSON, going to the network only when needed.
+
+        Inside the TTL the cached response is used as-is. Otherwise a conditional
+        request is sent with the stored ETag; a 304 just refreshes the timestamp.
+        Rate-limit headers and repeated failures push back the next attempt; while
+        backing off the cached (possibly stale) release is returned if we have one.
+        `force` skips the TTL and failure backoff, but never an API rate limit.
+        """
+        if self.mirror and not _is_url(self.mirror):
+            # Shared directory mirror: the manifest is a local read, nothing to cache
+            manifest_path = os.path.join(self.mirror, MIRROR_MANIFEST_NAME)
+            try:
+                with open(manifest_path, "r", encoding="utf-8") as fp:
+                    return json.load(fp)
+            except (OSError, ValueError) as e:
+                print(f"[Updater] Failed to read mirror manifest {manifest_path}: {e}")
+                return None
+
+        cache = self._load_cache()
+        cached_release = cache.get("release")
+        now = time.time()
+
+        if cache.get("rate_limited_until", 0) > now:
+            print("[Updater] Rate limited by the releases API; using cached release info.")
+            return cached_release
+        if not force:
+            if cached_release and now - cache.get("fetched_at", 0) < self.cache_ttl:
+                return cached_release
+            if cache.get("retry_after", 0) > now:
+                return cached_release
+
+        headers = {'Accept': 'application/vnd.github.v3+json'}
+        if cached_release and cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+
+        try:
+            response = requests.get(self.api_url, headers=headers, timeout=10)
+            reset_at = self._rate_limit_reset(response, now)
+
+            if response.status_code == 304:
+                release = cached_release
+            elif response.status_code in (403, 429) and reset_at:
+                cache["rate_limited_until"] = reset_at
+                self._save_cache(cache)
+                print("[Updater] Releases API rate limit hit; backing off.")
+                return cached_release
+            else:
+                response.raise_for_status()
+                release = response.json()
+                cache["release"] = release
+                cache["etag"] = response.headers.get("ETag")
+                if reset_at:
+                    cache["rate_limited_until"] = reset_at
+        except Exception as e:
+            failures = cache.get("failures", 0) + 1
+            cache["failures"] = failures
+            cache["retry_after"] = now + min(FAILURE_BACKOFF_BASE * 2 ** (failures - 1), FAILURE_BACKOFF_MAX)
+            self._save_cache(cache)
+            print(f"[Updater] Failed to fetch release info: {e}")
+            # A user-initiated check should report the failure rather than stale data
+            return None if force else cached_release
+
+        cache["fetched_at"] = now
+        cache["failures"] = 0
+        cache.pop("retry_after", None)
+        self._save_cache(cache)
+        return release
+
+    def fetch_latest_release_info(self, force=False):
+        release_info = self._get_release(force=force)
+        if not release_info:
+            return False
+        try:
             tag_name = release_info.get("tag_name", "")
             if tag_name.startswith("v"):
                 tag_name = tag_name[1:]  # strip leading 'v'
@@ -57,14 +243,33 @@ class Updater:
                 print("[Updater] No suitable installer (.exe) found in latest release assets.")
                 return False
 
-            self.installer_url = installer_asset.get("browser_download_url")
+            self.installer_url = self._asset_location(installer_asset)
             self.installer_filename = installer_asset.get("name")
 
+            # Checksum published either per installer ("<installer>.sha256") or as a combined list
+            self.checksum_url = None
+            per_file = self.installer_filename.lower() + ".sha256"
+            for asset in assets:
+                name = asset.get("name", "").lower()
+                if name == per_file or name in CHECKSUM_ASSET_NAMES:
+                    self.checksum_url = self._asset_location(asset)
+                    if name == per_file:
+                        break
+
             return True
         except Exception as e:
-            print(f"[Updater] Failed to fetch release info: {e}")
+            print(f"[Updater] Failed to read release info: {e}")
             return False
 
+    def _asset_location(self, asset):
+        """Where to fetch a release asset from: the mirror when configured, else GitHub."""
+        if not self.mirror:
+            return asset.get("browser_download_url")
+        name = asset.get("name", "")
+        if _is_url(self.mirror):
+            return urljoin(self.mirror.rstrip("/") + "/", quote(name))
+        return os.path.join(self.mirror, name)
+
     def is_update_available(self):
         if self.latest_version is None:
             return False
@@ -89,7 +294,211 @@ class Updater:
         )
         ans = messagebox.askyesno("Update Available", msg)
         if ans:
-            threading.Thread(target=self.download_and_install, daemon=True).start()
+            self._open_progress_window()
+            dispatcher.submit(self.download_and_install, token=self.cancel_token)
+
+    # ---------- Progress reporting (Tk thread) ----------
+
+    def _post(self, callback):
+        """Run `callback` on the Tk thread."""
+        if self.root:
+            dispatcher.post(callback)
+
+    def _open_progress_window(self):
+        from tkinter import ttk
+
+        win = tk.Toplevel(self.root)
+        win.title("Downloading Update")
+        win.geometry("360x100")
+        win.resizable(False, False)
+        win.transient(self.root)
+        win.label = ttk.Label(win, text="Starting download...")
+        win.label.pack(anchor=tk.W, padx=10, pady=(12, 6))
+        win.bar = ttk.Progressbar(win, orient=tk.HORIZONTAL, mode="determinate", maximum=100)
+        win.bar.pack(fill=tk.X, padx=10)
+        # Closing the progress window cancels the download; the partial file is kept for resuming
+        win.protocol("WM_DELETE_WINDOW", lambda: (self.cancel_token.cancel(), self._close_progress()))
+        self.progress_win = win
+
+    def _show_progress(self, downloaded, total):
+        win = self.progress_win
+        if not win or not win.winfo_exists():
+            return
+        mb_done = downloaded / (1024 * 1024)
+        if total:
+            win.bar.configure(mode="determinate", value=downloaded * 100 / total)
+            win.label.configure(text=f"Downloaded {mb_done:.1f} of {total / (1024 * 1024):.1f} MB")
+        else:
+            win.bar.configure(mode="indeterminate")
+            win.bar.step(2)
+            win.label.configure(text=f"Downloaded {mb_done:.1f} MB")
+
+    def _close_progress(self):
+        if self.progress_win and self.progress_win.winfo_exists():
+            self.progress_win.destroy()
+        self.progress_win = None
+
+    # ---------- Download ----------
+
+    def _fetch_expected_sha256(self):
+        """Return the published SHA-256 of the installer, or None if the release has no checksum asset."""
+        if not self.checksum_url:
+            return None
+        if _is_url(self.checksum_url):
+            response = requests.get(self.checksum_url, timeout=DOWNLOAD_TIMEOUT)
+            response.raise_for_status()
+            text = response.text
+        else:
+            with open(self.checksum_url, "r", encoding="utf-8") as fp:
+                text = fp.read()
+        digests = parse_checksums(text)
+        digest = digests.get(self.installer_filename.lower()) or digests.get("")
+        if digest:
+            return digest
+        raise ValueError(f"No checksum for {self.installer_filename} in {self.checksum_url}")
+
+    @staticmethod
+    def _hash_existing(path, hasher):
+        """Feed an existing partial file into `hasher`; return its size."""
+        size = 0
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(DOWNLOAD_CHUNK_MAX)
+                if not block:
+                    break
+                hasher.update(block)
+                size += len(block)
+        return size
+
+    def _download_resumable(self, url, part_path):
+        """
+        Download `url` into `part_path`, resuming from whatever is already there.
+
+        Uses HTTP Range requests; a server that ignores Range (200 instead of 206)
+        restarts the file. Returns (sha256 hexdigest, size) of the complete file.
+        """
+        hasher = hashlib.sha256()
+        downloaded = self._hash_existing(part_path, hasher) if os.path.exists(part_path) else 0
+        if not _is_url(url):
+            return self._copy_resumable(url, part_path, hasher, downloaded)
+        chunk_size = DOWNLOAD_CHUNK_START
+        total = None
+        last_report = 0.0
+        restarted = False
+
+        attempt = 0
+        while attempt < DOWNLOAD_ATTEMPTS:
+            attempt += 1
+            headers = {"Range": f"bytes={downloaded}-"} if downloaded else {}
+            try:
+                with requests.get(url, headers=headers, stream=True, timeout=DOWNLOAD_TIMEOUT) as r:
+                    if r.status_code == 416 and downloaded:
+                        # Nothing past our offset: either the partial file is already
+                        # complete ("bytes */<total>" says how long the file is) or stale
+                        content_range = r.headers.get("Content-Range", "")
+                        size = content_range.rsplit("/", 1)[1] if "/" in content_range else ""
+                        if size.isdigit() and int(size) == downloaded:
+                            self._post(lambda d=downloaded: self._show_progress(d, d))
+                            return hasher.hexdigest(), downloaded
+                        if restarted:
+                            raise IOError(f"Server refused the download range ({content_range or 'no Content-Range'})")
+                        print("[Updater] Partial download does not match the server's file; starting over.")
+                        os.remove(part_path)
+                        hasher, downloaded = hashlib.sha256(), 0
+                        # Starting over is not a failed attempt
+                        restarted = True
+                        attempt -= 1
+                        continue
+                    r.raise_for_status()
+
+                    if r.status_code == 206:
+                        content_range = r.headers.get("Content-Range", "")
+                        if "/" in content_range and not content_range.endswith("/*"):
+                            total = int(content_range.rsplit("/", 1)[1])
+                        mode = "ab"
+                    else:
+                        if downloaded:
+                            print("[Updater] Server ignored resume request; restarting download.")
+                        hasher, downloaded = hashlib.sha256(), 0
+                        length = r.headers.get("Content-Length")
+                        total = int(length) if length else None
+                        mode = "wb"
+
+                    with open(part_path, mode) as f:
+                        while True:
+                            started = time.monotonic()
+                            chunk = r.raw.read(chunk_size, decode_content=True)
+                            if not chunk:
+                                break
+                            f.write(chunk)
+                            hasher.update(chunk)
+                            downloaded += len(chunk)
+                            self.cancel_token.raise_if_cancelled()
+
+                            # Grow chunks on fast links, shrink them when reads get slow
+                            elapsed = time.monotonic() - started
+                            if elapsed < 0.1 and chunk_size < DOWNLOAD_CHUNK_MAX:
+                                chunk_size *= 2
+                            elif elapsed > 1.0 and chunk_size > DOWNLOAD_CHUNK_MIN:
+                                chunk_size //= 2
+
+                            now = time.monotonic()
+                            if now - last_report >= 0.1:
+                                last_report = now
+                                self._post(lambda d=downloaded, t=total: self._show_progress(d, t))
+
+                if total is not None and downloaded < total:
+                    raise IOError(f"Connection closed at {downloaded} of {total} bytes")
+                self._post(lambda d=downloaded, t=total: self._show_progress(d, t))
+                return hasher.hexdigest(), downloaded
+            except (requests.RequestException, urllib3.exceptions.HTTPError, IOError) as e:
+                if attempt == DOWNLOAD_ATTEMPTS or not _is_transient(e):
+                    raise
+                print(f"[Updater] Download interrupted ({e}); resuming from {downloaded} bytes...")
+                time.sleep(min(2 ** attempt, 15))
+
+        raise IOError("Download did not complete")
+
+    def _copy_resumable(self, src_path, part_path, hasher, copied):
+        """Copy an installer from a shared-directory mirror, continuing an existing partial copy."""
+        total = os.path.getsize(src_path)
+        if copied > total:
+            hasher, copied = hashlib.sha256(), 0
+        last_report = 0.0
+        with open(src_path, "rb") as src, open(part_path, "ab" if copied else "wb") as dst:
+            src.seek(copied)
+            while True:
+                block = src.read(DOWNLOAD_CHUNK_MAX)
+                if not block:
+                    break
+                dst.write(block)
+                hasher.update(block)
+                copied += len(block)
+                self.cancel_token.raise_if_cancelled()
+                now = time.monotonic()
+                if now - last_report >= 0.1:
+                    last_report = now
+                    self._post(lambda d=copied, t=total: self._show_progress(d, t))
+        self._post(lambda d=copied, t=total: self._show_progress(d, t))
+        return hasher.hexdigest(), copied
+
+    def fetch_installer(self, installer_path):
+        """
+        Download (or resume) the installer to `installer_path` via a .part file
+        and check it against the release's SHA-256. Returns its size; a file
+        that fails verification is deleted and ValueError raised.
+        """
+        part_path = installer_path + ".part"
+        expected_sha256 = self._fetch_expected_sha256()
+        if expected_sha256 is None:
+            print("[Updater] Release has no checksum asset; installer will not be verified.")
+
+        digest, size = self._download_resumable(self.installer_url, part_path)
+        if expected_sha256 and digest != expected_sha256:
+            os.remove(part_path)
+            raise ValueError("Downloaded installer failed SHA-256 verification")
+        os.replace(part_path, installer_path)
+        return size
 
     def download_and_install(self):
         try:
@@ -97,22 +506,9 @@ class Updater:
             installer_path = os.path.join(tmp_dir, self.installer_filename)
             print(f"[Updater] Downloading installer to: {installer_path}")
 
-            with requests.get(self.installer_url, stream=True) as r:
-                r.raise_for_status()
-                total_length = r.headers.get('content-length')
-                total_length = int(total_length) if total_length else None
-
-                with open(installer_path, "wb") as f:
-                    downloaded = 0
-                    chunk_size = 8192
-                    for chunk in r.iter_content(chunk_size=chunk_size):
-                        if chunk:
-                            f.write(chunk)
-                            downloaded += len(chunk)
-                            if total_length:
-                                percent = int(downloaded * 100 / total_length)
-                                print(f"\r[Updater] Downloaded {percent}%...", end="", flush=True)
-                print("\n[Updater] Download complete.")
+            size = self.fetch_installer(installer_path)
+            print(f"[Updater] Download complete ({size} bytes).")
+            self._post(self._close_progress)
 
             # Run installer
             print("[Updater] Launching installer...")
@@ -127,23 +523,43 @@ class Updater:
             print("[Updater] Exiting app for update...")
             os._exit(0)
 
+        except dispatcher.Cancelled:
+            print("[Updater] Download cancelled.")
         except Exception as e:
             print(f"[Updater] Update failed: {e}")
             if self.root:
-                self.root.after(0, lambda: messagebox.showerror("Update Failed", f"Could not update the app:\n{e}"))
+                self._post(self._close_progress)
+                self._post(lambda err=e: messagebox.showerror("Update Failed", f"Could not update the app:\n{err}"))
+
+def check_for_updates(root=None, force=False):
+    """
+    Check for a newer release. Launch checks (force=False) are served from the
+    release cache when fresh and stay silent when offline; `force` is for
+    user-initiated checks, which always revalidate and report the outcome.
 
-def check_for_updates(root=None):
+    With a root the check runs on the worker pool and its dialogs are shown on
+    the Tk thread; without one it runs inline and only prints.
+    """
     updater = Updater(root)
-    success = updater.fetch_latest_release_info()
-    if not success:
-        if root:
-            root.after(0, lambda: messagebox.showinfo("Update", "Could not check for updates at this time."))
+    if root is None:
+        if not updater.fetch_latest_release_info(force=force):
+            return
+        if updater.is_update_available():
+            print(f"Update available: {updater.latest_version} (current: {updater.current_version})")
+        else:
+            print("No updates available. You have the latest version.")
         return
 
-    if updater.is_update_available():
-        if root:
+    def on_checked(success):
+        if not success:
+            if force:
+                messagebox.showinfo("Update", "Could not check for updates at this time.")
+            return
+        if updater.is_update_available():
             updater.prompt_update()
         else:
-            print(f"Update available: {updater.latest_version} (current: {updater.current_version})")
-    else:
-        print("No updates available. You have the latest version.")
\ No newline at end of file
+            print("No updates available. You have the latest version.")
+            if force:
+                messagebox.showinfo("Update", "No updates available. You have the latest version.")
+
+    return dispatcher.submit(updater.fetch_latest_release_info, force, on_done=on_checked)
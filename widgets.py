@@ -1,52 +1,399 @@
 # widgets.py
+import time
 import tkinter as tk
 
+_font_metrics = {}  # font spec -> (line height, width of "0"), shared by every QuantityControl
 
-class SteppedSpinbox(tk.Frame):
-    def __init__(self, parent, min_val=0, max_val=999, bg=None, **kwargs):
-        super().__init__(parent, bg=bg)
-        self.min_val = min_val
-        self.max_val = max_val
-        self.var = tk.StringVar(value="0")
 
-        entry_kwargs = {}
-        if bg:
-            entry_kwargs["bg"] = bg
+def _measure_font(widget, font):
+    """Line height and digit width of `font`, measured once per font spec without creating a named font."""
+    key = font if isinstance(font, (str, tuple)) else str(font)
+    metrics = _font_metrics.get(key)
+    if metrics is None:
+        line = int(widget.tk.call("font", "metrics", font, "-linespace"))
+        zero = int(widget.tk.call("font", "measure", font, "0"))
+        metrics = _font_metrics[key] = (line, zero)
+    return metrics
+
+
+class QuantityControl(tk.Canvas):
+    """
+    Integer quantity field with + / - buttons, drawn on a single Canvas.
+
+    The value is kept as an int. Clicking the field (or tabbing to it) lets digits
+    be typed; Up/Down and holding + / - step the value, accelerating the longer
+    the key or button is held. Nothing is reported while a value is being typed
+    or stepped: `command()` is called and <<ValueChanged>> generated once the
+    change is committed (button release, Return, focus out, or a short pause
+    after arrow keys), and only if the committed value actually differs.
+
+    set() updates the value silently unless notify=True.
+    """
+
+    REPEAT_DELAY = 400  # ms before a held button starts repeating
+    REPEAT_INTERVAL = 80
+    FAST_INTERVAL = 40
+    KEY_REPEAT_GAP = 150  # arrow presses closer than this count as a held key
+    KEY_COMMIT_DELAY = 350  # ms of quiet after arrow keys before committing
+
+    def __init__(self, parent, min_val=0, max_val=999, bg=None, fg="white", font=None, command=None, digits=3,
+                 button_bg="#3a3a3a", active_bg="#6f42c1", focus_color="#7952b3"):
+        font = font or "TkDefaultFont"
+        line, zero = _measure_font(parent, font)
+        self._field_w = zero * digits + 10
+        self._btn_w = line + 4
+        height = line + 6
+        width = self._field_w + 2 * (self._btn_w + 2)
 
-        self.entry = tk.Entry(self, textvariable=self.var, width=4, **entry_kwargs)
-        self.entry.pack(side=tk.LEFT)
+        field_bg = bg or button_bg
+        super().__init__(parent, width=width, height=height, bg=field_bg, highlightthickness=0, bd=0, takefocus=1)
 
-        button_bg = bg if bg else "#3a3a3a"
-        btn_kwargs = {"width": 2, "bg": button_bg, "fg": "white", "activebackground": "#6f42c1", "activeforeground": "white", "relief": "flat", "bd": 0}
+        self.min_val = min_val
+        self.max_val = max_val
+        self.command = command
+        self._button_bg = bg or button_bg
+        self._active_bg = active_bg
+        self._field_bg = field_bg
+        self._focus_color = focus_color
 
-        upbtn = tk.Button(self, text="+", command=self.increase, **btn_kwargs)
-        upbtn.pack(side=tk.LEFT, padx=(2,0))
+        self._value = min_val if min_val > 0 else 0
+        self._shown = self._value
+        self._typed = None  # digits typed since the field got focus, or None
+        self._repeat_id = None
+        self._commit_id = None
+        self._repeat_count = 0
+        self._last_key_time = 0
 
-        downbtn = tk.Button(self, text="-", command=self.decrease, **btn_kwargs)
-        downbtn.pack(side=tk.LEFT, padx=(2,0))
+        mid = height / 2
+        self.create_rectangle(0, 0, self._field_w - 1, height - 1, outline=field_bg, width=1, tags=("focus",))
+        self.create_text(self._field_w / 2, mid, text=str(self._value), fill=fg, font=font, tags=("value",))
+        x = self._field_w + 2
+        for tag, label, direction in (("up", "+", 1), ("down", "-", -1)):
+            self.create_rectangle(x, 0, x + self._btn_w, height, fill=self._button_bg, width=0, tags=(tag, tag + "_bg"))
+            self.create_text(x + self._btn_w / 2, mid, text=label, fill=fg, font=font, tags=(tag,))
+            self.tag_bind(tag, "<ButtonPress-1>", lambda e, d=direction: self._press(d))
+            self.tag_bind(tag, "<Enter>", lambda e, t=tag: self.itemconfigure(t + "_bg", fill=self._active_bg))
+            self.tag_bind(tag, "<Leave>", lambda e, t=tag: self.itemconfigure(t + "_bg", fill=self._button_bg))
+            x += self._btn_w + 2
+
+        self.tag_bind("focus", "<ButtonPress-1>", lambda e: self.focus_set())
+        self.tag_bind("value", "<ButtonPress-1>", lambda e: self.focus_set())
+        self.bind("<ButtonRelease-1>", self._release)
+        self.bind("<FocusIn>", self._focus_in)
+        self.bind("<FocusOut>", lambda e: self._focus_out())
+        self.bind("<Up>", lambda e: self._arrow(e, 1))
+        self.bind("<Down>", lambda e: self._arrow(e, -1))
+        self.bind("<Return>", lambda e: self._commit())
+        self.bind("<KP_Enter>", lambda e: self._commit())
+        self.bind("<Escape>", lambda e: self._revert())
+        self.bind("<BackSpace>", self._backspace)
+        self.bind("<Key>", self._key)
+        self.bind("<Destroy>", self._on_destroy)
 
     def get(self):
+        """The committed value. Input still being typed or stepped is committed first."""
+        if self._typed is not None or self._shown != self._value:
+            self._commit()
+        return self._value
+
+    def set(self, val, notify=False):
+        self._cancel_timers()
+        self._typed = None
         try:
-            val = int(self.var.get())
-            if val < self.min_val:
-                return self.min_val
-            if val > self.max_val:
-                return self.max_val
-            return val
-        except Exception:
-            return 0
-
-    def set(self, val):
-        self.var.set(str(val))
+            val = self._clamp(int(val))
+        except (TypeError, ValueError):
+            val = self._clamp(0)
+        changed = val != self._value
+        self._value = self._shown = val
+        self._draw()
+        if notify and changed:
+            self._notify()
 
     def increase(self):
-        val = self.get() + 1
-        if val > self.max_val:
-            val = self.max_val
-        self.set(val)
+        self.set(self.get() + 1, notify=True)
 
     def decrease(self):
-        val = self.get() - 1
-        if val < self.min_val:
-            val = self.min_val
-        self.set(val)
\ No newline at end of file
+        self.set(self.get() - 1, notify=True)
+
+    def _clamp(self, val):
+        return max(self.min_val, min(self.max_val, val))
+
+    def _draw(self):
+        text = self._typed if self._typed is not None else str(self._shown)
+        self.itemconfigure("value", text=text or "0")
+
+    def _notify(self):
+        if self.command:
+            self.command()
+        try:
+            self.event_generate("<<ValueChanged>>")
+        except tk.TclError:
+            pass
+
+    def _commit(self):
+        self._cancel_timers()
+        if self._typed is not None:
+            self._shown = self._clamp(int(self._typed or 0))
+            self._typed = None
+        self._shown = self._clamp(self._shown)
+        self._draw()
+        if self._shown != self._value:
+            self._value = self._shown
+            self._notify()
+
+    def _revert(self):
+        self._cancel_timers()
+        self._typed = None
+        self._shown = self._value
+        self._draw()
+
+    def _cancel_timers(self):
+        if self._repeat_id is not None:
+            self.after_cancel(self._repeat_id)
+            self._repeat_id = None
+        if self._commit_id is not None:
+            self.after_cancel(self._commit_id)
+            self._commit_id = None
+
+    def _step(self, direction):
+        if self._typed is not None:
+            self._shown = self._clamp(int(self._typed or 0))
+            self._typed = None
+        count = self._repeat_count
+        size = 1 if count < 10 else 5 if count < 30 else 10
+        shown = self._shown + direction * size
+        if size > 1:
+            # land on multiples of the step once accelerating
+            shown -= shown % size if direction > 0 else -(-shown % size)
+        self._shown = self._clamp(shown)
+        self._draw()
+
+    # -- mouse --
+
+    def _press(self, direction):
+        self._cancel_timers()
+        self._repeat_count = 0
+        self._step(direction)
+        self._repeat_id = self.after(self.REPEAT_DELAY, self._repeat, direction)
+
+    def _repeat(self, direction):
+        self._repeat_count += 1
+        self._step(direction)
+        interval = self.REPEAT_INTERVAL if self._repeat_count < 10 else self.FAST_INTERVAL
+        self._repeat_id = self.after(interval, self._repeat, direction)
+
+    def _release(self, event):
+        if self._repeat_id is not None:
+            self._commit()
+
+    # -- keyboard --
+
+    def _focus_in(self, event):
+        self._typed = None
+        self.itemconfigure("focus", outline=self._focus_color)
+
+    def _focus_out(self):
+        self.itemconfigure("focus", outline=self._field_bg)
+        self._commit()
+
+    def _arrow(self, event, direction):
+        if self._commit_id is not None:
+            self.after_cancel(self._commit_id)
+        held = 0 <= event.time - self._last_key_time < self.KEY_REPEAT_GAP
+        self._last_key_time = event.time
+        self._repeat_count = self._repeat_count + 1 if held else 0
+        self._step(direction)
+        self._commit_id = self.after(self.KEY_COMMIT_DELAY, self._commit)
+        return "break"
+
+    def _key(self, event):
+        # Only ASCII digits: isdigit() also accepts "²" and the like, which int() rejects
+        if not event.char or event.char not in "0123456789":
+            return None
+        typed = (self._typed or "") + event.char
+        if len(typed.lstrip("0")) > len(str(self.max_val)):
+            return "break"
+        self._typed = typed.lstrip("0") or "0"
+        self._draw()
+        return "break"
+
+    def _backspace(self, event):
+        typed = self._typed if self._typed is not None else str(self._shown)
+        self._typed = typed[:-1]
+        self._draw()
+        return "break"
+
+    def _on_destroy(self, event):
+        if event.widget is self:
+            self._cancel_timers()
+
+
+class TraceGroup:
+    """
+    Variable traces that are removed together.
+
+    A trace callback is registered as a Tcl command that keeps its closure (and
+    usually the owning window) alive until the trace is removed, so rows and
+    windows that add traces remove them again when they are rebuilt or destroyed.
+    """
+
+    def __init__(self):
+        self._traces = []
+
+    def add(self, var, callback, mode="write"):
+        self._traces.append((var, mode, var.trace_add(mode, callback)))
+
+    def remove_all(self):
+        for var, mode, cbname in self._traces:
+            try:
+                var.trace_remove(mode, cbname)
+            except tk.TclError:
+                pass
+        self._traces.clear()
+
+    def remove_on_destroy(self, widget):
+        widget.bind("<Destroy>", lambda e: self.remove_all() if e.widget is widget else None, add="+")
+
+
+def bind_mousewheel(area, target=None):
+    """
+    Scroll `target` (default: `area`) with the mouse wheel while the pointer is
+    over `area` or any widget inside it.
+
+    A single set of application-wide wheel bindings is installed on first use and
+    dispatches on the widget under the pointer, so opening windows does not pile
+    up global handlers; `area` is unregistered when it is destroyed.
+    """
+    root = area._root()
+    targets = getattr(root, "_wheel_targets", None)
+    if targets is None:
+        targets = root._wheel_targets = {}
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            root.bind_all(sequence, lambda e: _dispatch_mousewheel(root, e), add="+")
+
+    key = str(area)
+    targets[key] = target or area
+    area.bind("<Destroy>", lambda e: targets.pop(key, None) if e.widget is area else None, add="+")
+
+
+def _dispatch_mousewheel(root, event):
+    try:
+        widget = root.winfo_containing(event.x_root, event.y_root)
+    except (KeyError, tk.TclError):
+        # pointer over a widget Tkinter doesn't know (e.g. a combobox popdown)
+        return None
+    targets = root._wheel_targets
+    while widget is not None:
+        target = targets.get(str(widget))
+        if target is not None:
+            if event.num == 4:
+                target.yview_scroll(-1, "units")
+            elif event.num == 5:
+                target.yview_scroll(1, "units")
+            elif event.delta:
+                target.yview_scroll(int(-1 * (event.delta / 120)) or (-1 if event.delta > 0 else 1), "units")
+            return "break"
+        widget = widget.master
+    return None
+
+
+class SlicedBuild:
+    """
+    Run a generator on the Tk thread a slice at a time.
+
+    Each slice advances `steps` until `budget_ms` has passed, then hands control
+    back to the event loop, so a window can paint and take input while thousands
+    of rows are still being created. Yield after each unit of work (e.g. one row).
+    The build stops when `widget` is destroyed; finish() runs the rest right away
+    for code that needs the complete result.
+    """
+
+    BUDGET_MS = 12
+
+    def __init__(self, widget, steps, budget_ms=None, on_done=None):
+        self.widget = widget
+        self.steps = steps
+        self.budget = (budget_ms or self.BUDGET_MS) / 1000.0
+        self.on_done = on_done
+        self.done = False
+        self._after_id = widget.after_idle(self._slice)
+
+    def _slice(self):
+        self._after_id = None
+        try:
+            alive = self.widget.winfo_exists()
+        except tk.TclError:
+            alive = False
+        if not alive:
+            self.cancel()
+            return
+        deadline = time.perf_counter() + self.budget
+        for _ in self.steps:
+            if time.perf_counter() >= deadline:
+                # after(1) rather than after_idle so pending input and redraws go first
+                self._after_id = self.widget.after(1, self._slice)
+                return
+        self._complete()
+
+    def _complete(self):
+        self.done = True
+        if self.on_done:
+            self.on_done()
+
+    def finish(self):
+        if self.done:
+            return
+        self._cancel_timer()
+        for _ in self.steps:
+            pass
+        self._complete()
+
+    def cancel(self):
+        self._cancel_timer()
+        self.steps.close()
+        self.done = True
+
+    def _cancel_timer(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+            self._after_id = None
+
+
+class LazyTabs:
+    """
+    Notebook tabs whose contents are built the first time they are shown.
+
+    `build` is called (once) when its tab is first selected, so opening a window
+    only builds the tab that is actually visible.
+    """
+
+    def __init__(self, notebook):
+        self.notebook = notebook
+        self._builders = {}
+        self._built = set()
+        notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed, add="+")
+
+    def add(self, frame, text, build):
+        self.notebook.add(frame, text=text)
+        self._builders[str(frame)] = build
+        if self.notebook.select() == str(frame):
+            # The first tab is selected by add(); build it once the window has painted
+            self.notebook.after_idle(self.ensure, frame)
+
+    def is_built(self, frame):
+        return str(frame) in self._built
+
+    def ensure(self, frame):
+        key = str(frame)
+        if key in self._built or key not in self._builders:
+            return
+        self._built.add(key)
+        self._builders[key]()
+
+    def _on_tab_changed(self, event):
+        selected = self.notebook.select()
+        if selected:
+            self.ensure(selected)